@@ -0,0 +1,66 @@
+"""
+Benchmark: extraction throughput on a recorded crawl, fully offline.
+
+Record the archive once against the live site:
+
+    config = ScrapeFlowConfig(browser=BrowserConfig(har_path="crawl.har"))
+    async with ScrapeFlow(config) as scraper: ...   # HAR is written on close
+
+then replay every recorded HTML document through SpecificationExtractor via
+HarReplayRuntime - no browser and no network, so results are reproducible on
+CI. Requires selectolax.
+
+Usage: python benchmarks/har_extraction.py crawl.har [rounds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from typing import List
+
+from pydantic import BaseModel
+
+from scrapeflow.har import HarReplayRuntime
+from scrapeflow.schema_library import product_price_item_spec
+from scrapeflow.specifications import ProductPriceSpec, SpecificationExtractor
+
+
+class Listing(BaseModel):
+    products: List[ProductPriceSpec]
+
+
+async def main(har_path: str, rounds: int) -> None:
+    runtime = HarReplayRuntime(har_path)
+    await runtime.start()
+    urls = [
+        url
+        for url in runtime.archive.urls()
+        if "html" in runtime.archive.get(url)["response"].get("content", {}).get("mimeType", "")
+    ]
+    extractor = SpecificationExtractor(
+        Listing, schema={"products": product_price_item_spec()}, strict=False
+    )
+
+    samples = []
+    items = 0
+    for _ in range(rounds):
+        for url in urls:
+            async with runtime.acquire_page() as page:
+                start = time.perf_counter()
+                await runtime.goto(url, page=page)
+                try:
+                    items += len((await extractor.extract(page)).products)
+                except Exception:
+                    pass
+                samples.append(time.perf_counter() - start)
+    await runtime.close()
+
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[max(int(len(ms) * 0.95) - 1, 0)]
+    print(f"{len(urls)} documents x {rounds} rounds, {items} items extracted")
+    print(f"median {statistics.median(ms):6.2f} ms  p95 {p95:6.2f} ms  (n={len(ms)})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 5))
@@ -0,0 +1,43 @@
+"""
+Benchmark: cold import time of the scrapeflow package.
+
+Each statement is timed in a fresh interpreter, best of N runs.
+
+Usage: python benchmarks/import_time.py [runs]
+"""
+
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import scrapeflow",
+    "from scrapeflow.content_utils import clean_html_for_llm",
+    "from scrapeflow.registry import get_registry",
+    "from scrapeflow import ScrapeFlow",
+    "from scrapeflow import SpecificationExtractor",
+    "from scrapeflow import PlaywrightBrowserRuntime",
+]
+
+
+def time_statement(statement: str, runs: int) -> float:
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        samples.append(float(out.stdout.strip()))
+    return min(samples)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for statement in STATEMENTS:
+        print(f"{time_statement(statement, runs) * 1000:8.1f} ms  {statement}")
+
+
+if __name__ == "__main__":
+    main()
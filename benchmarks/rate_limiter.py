@@ -0,0 +1,102 @@
+"""
+Benchmark: RateLimiter accuracy and overhead with many concurrent acquirers.
+
+Starts N coroutines that all call acquire() at once, against a limiter at R
+requests per second, and reports:
+
+- achieved rate vs. configured rate (accuracy over the whole run)
+- grant jitter: |actual grant time - ideal GCRA slot| (p50/p99/max)
+- scheduling overhead: CPU time spent per acquire()
+
+The legacy limiter (a lock held across asyncio.sleep, on time.time()) is run
+for comparison with --legacy; --shared also runs SharedRateLimiter over an
+mmap'd state file (the cross-process limiter, here used from one process).
+
+Usage: python benchmarks/rate_limiter.py [acquirers] [rate] [--legacy] [--shared]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from scrapeflow.config import RateLimitConfig
+from scrapeflow.rate_limiter import RateLimiter
+
+
+class LegacyRateLimiter:
+    """The previous token bucket: serializes every waiter behind the sleeping one."""
+
+    def __init__(self, config: RateLimitConfig):
+        self.tokens = config.burst_size
+        self.max_tokens = config.burst_size
+        self.refill_rate = 1.0 / config.requests_per_second
+        self.last_update = time.time()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, key=None):
+        async with self._lock:
+            now = time.time()
+            self.tokens = min(
+                self.max_tokens, self.tokens + (now - self.last_update) / self.refill_rate
+            )
+            self.last_update = now
+            if self.tokens < 1:
+                await asyncio.sleep(self.refill_rate - self.tokens * self.refill_rate)
+                self.tokens = 0
+                self.last_update = time.time()
+            else:
+                self.tokens -= 1
+
+
+async def run(limiter, acquirers: int, rate: float, burst: int) -> None:
+    grants = []
+
+    async def worker():
+        await limiter.acquire("bench.example")
+        grants.append(time.monotonic())
+
+    cpu_start = time.process_time()
+    start = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(acquirers)))
+    elapsed = time.monotonic() - start
+    cpu = time.process_time() - cpu_start
+
+    grants.sort()
+    interval = 1.0 / rate
+    # Ideal GCRA schedule from the first grant: `burst` at once, then one every interval.
+    ideal = [grants[0] + max(0, i - burst + 1) * interval for i in range(acquirers)]
+    jitter_ms = sorted(abs(g - i) * 1000 for g, i in zip(grants, ideal))
+    achieved = (acquirers - burst) / (grants[-1] - grants[burst - 1]) if acquirers > burst else 0
+
+    print(f"{type(limiter).__name__}: {acquirers} acquirers at {rate:g}/s (burst {burst})")
+    print(f"  elapsed        {elapsed:.3f} s (ideal {(acquirers - burst) * interval:.3f} s)")
+    print(f"  achieved rate  {achieved:.1f}/s ({(achieved / rate - 1) * 100:+.2f}%)")
+    print(
+        f"  grant jitter   p50 {jitter_ms[len(jitter_ms) // 2]:.2f} ms, "
+        f"p99 {jitter_ms[int(len(jitter_ms) * 0.99) - 1]:.2f} ms, max {jitter_ms[-1]:.2f} ms"
+    )
+    print(f"  CPU/acquire    {cpu / acquirers * 1e6:.1f} us")
+
+
+def main() -> None:
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    acquirers = int(args[0]) if args else 10_000
+    rate = float(args[1]) if len(args) > 1 else 2_000.0
+    burst = 5
+    config = RateLimitConfig(requests_per_second=rate, burst_size=burst)
+    asyncio.run(run(RateLimiter(config), acquirers, rate, burst))
+    if "--legacy" in sys.argv:
+        asyncio.run(run(LegacyRateLimiter(config), acquirers, rate, burst))
+    if "--shared" in sys.argv:
+        from scrapeflow.shared_rate_limiter import MmapBackend, SharedRateLimiter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = MmapBackend(os.path.join(tmp, "ratelimit.bin"))
+            asyncio.run(run(SharedRateLimiter(config, backend), acquirers, rate, burst))
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
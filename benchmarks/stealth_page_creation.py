@@ -0,0 +1,64 @@
+"""
+Benchmark: page-creation latency with per-page vs. context-level stealth.
+
+"before" registers the five stealth patches as separate init scripts on
+every new page (the old behaviour); "after" registers one bundled script on
+the context once, so new pages inherit it. Requires a Playwright browser
+(`playwright install chromium`).
+
+Usage: python benchmarks/stealth_page_creation.py [pages]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+from scrapeflow.anti_detection import StealthMode
+
+
+async def per_page_stealth(context, pages: int) -> list:
+    samples = []
+    for _ in range(pages):
+        start = time.perf_counter()
+        page = await context.new_page()
+        for script in StealthMode.PATCHES.values():
+            await page.add_init_script(script)
+        await page.goto("about:blank")
+        samples.append(time.perf_counter() - start)
+        await page.close()
+    return samples
+
+
+async def context_stealth(context, pages: int) -> list:
+    await StealthMode.apply_stealth_to_context(context)
+    samples = []
+    for _ in range(pages):
+        start = time.perf_counter()
+        page = await context.new_page()
+        await page.goto("about:blank")
+        samples.append(time.perf_counter() - start)
+        await page.close()
+    return samples
+
+
+def report(label: str, samples: list) -> None:
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(f"{label:>7}: median {statistics.median(ms):6.1f} ms  p95 {p95:6.1f} ms  (n={len(ms)})")
+
+
+async def main(pages: int) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        for label, scenario in (("before", per_page_stealth), ("after", context_stealth)):
+            context = await browser.new_context()
+            report(label, await scenario(context, pages))
+            await context.close()
+        await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
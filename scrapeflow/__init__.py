@@ -8,46 +8,114 @@ Specification-driven extraction, robots.txt compliance, and ethical crawling
 (GDPR/CCPA) are built into the design.
 """
 
-from scrapeflow.engine import ScrapeFlow
-from scrapeflow.workflow import Workflow, Step
-from scrapeflow.workflow_executor import WorkflowExecutor
-from scrapeflow.extractors import Extractor, StructuredExtractor
-from scrapeflow.specifications import (
-    FieldSpec,
-    ItemSpec,
-    SpecificationExtractor,
-    HybridExtractor,
-    ProductPriceSpec,
-    JobListingSpec,
-    TariffCodeSpec,
-)
-from scrapeflow.robots import RobotsChecker
-from scrapeflow.registry import (
-    SelectorRegistry,
-    LoginHandler,
-    get_registry,
-    register_quotes_login_handler,
-)
-from scrapeflow.browser_runtime import PlaywrightBrowserRuntime
-from scrapeflow.llm_extract import (
-    generate_schema_from_prompt,
-    extract_with_schema,
-    extract_with_schema_async,
-)
-from scrapeflow.mcp_backend import (
-    MCPBackend,
-    PlaceholderMCPBackend,
-    MistralLLMBackend,
-    create_mcp_backend,
-)
-from scrapeflow.exceptions import (
-    ScrapeFlowError,
-    ScrapeFlowRetryError,
-    ScrapeFlowTimeoutError,
-    ScrapeFlowBlockedError,
-    ScrapeFlowValidationError,
-    ScrapeFlowRobotsDisallowedError,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from scrapeflow.engine import ScrapeFlow
+    from scrapeflow.workflow import Workflow, Step
+    from scrapeflow.workflow_executor import WorkflowExecutor
+    from scrapeflow.crawl import CrawlResult
+    from scrapeflow.process_pool import ShardedCrawlExecutor
+    from scrapeflow.extractors import Extractor, StructuredExtractor
+    from scrapeflow.specifications import (
+        FieldSpec,
+        ItemSpec,
+        SpecificationExtractor,
+        HybridExtractor,
+        ProductPriceSpec,
+        JobListingSpec,
+        TariffCodeSpec,
+    )
+    from scrapeflow.robots import RobotsChecker
+    from scrapeflow.registry import (
+        SelectorRegistry,
+        LoginHandler,
+        get_registry,
+        register_quotes_login_handler,
+    )
+    from scrapeflow.browser_runtime import PlaywrightBrowserRuntime
+    from scrapeflow.browser_server import BrowserServer
+    from scrapeflow.http_runtime import HttpRuntime, StaticPage
+    from scrapeflow.har import HarReplayRuntime
+    from scrapeflow.sinks import Sink, JSONLSink, CSVSink, SQLiteSink
+    from scrapeflow.columnar import ParquetExporter, ParquetSink, model_arrow_schema
+    from scrapeflow.render_mode import RenderMode, RenderModeRouter, RenderModeTable
+    from scrapeflow.llm_extract import (
+        generate_schema_from_prompt,
+        extract_with_schema,
+        extract_with_schema_async,
+    )
+    from scrapeflow.mcp_backend import (
+        MCPBackend,
+        PlaceholderMCPBackend,
+        MistralLLMBackend,
+        create_mcp_backend,
+    )
+    from scrapeflow.exceptions import (
+        ScrapeFlowError,
+        ScrapeFlowRetryError,
+        ScrapeFlowTimeoutError,
+        ScrapeFlowBlockedError,
+        ScrapeFlowHTTPError,
+        ScrapeFlowValidationError,
+        ScrapeFlowRobotsDisallowedError,
+    )
+
+# Public names are resolved on first access (PEP 562) so that `import scrapeflow`
+# stays cheap: Playwright, pydantic, aiohttp and friends are only imported by
+# the submodules that need them.
+_LAZY_IMPORTS = {
+    "ScrapeFlow": "scrapeflow.engine",
+    "Workflow": "scrapeflow.workflow",
+    "Step": "scrapeflow.workflow",
+    "WorkflowExecutor": "scrapeflow.workflow_executor",
+    "CrawlResult": "scrapeflow.crawl",
+    "ShardedCrawlExecutor": "scrapeflow.process_pool",
+    "Extractor": "scrapeflow.extractors",
+    "StructuredExtractor": "scrapeflow.extractors",
+    "FieldSpec": "scrapeflow.specifications",
+    "ItemSpec": "scrapeflow.specifications",
+    "SpecificationExtractor": "scrapeflow.specifications",
+    "HybridExtractor": "scrapeflow.specifications",
+    "ProductPriceSpec": "scrapeflow.specifications",
+    "JobListingSpec": "scrapeflow.specifications",
+    "TariffCodeSpec": "scrapeflow.specifications",
+    "RobotsChecker": "scrapeflow.robots",
+    "SelectorRegistry": "scrapeflow.registry",
+    "LoginHandler": "scrapeflow.registry",
+    "get_registry": "scrapeflow.registry",
+    "register_quotes_login_handler": "scrapeflow.registry",
+    "PlaywrightBrowserRuntime": "scrapeflow.browser_runtime",
+    "BrowserServer": "scrapeflow.browser_server",
+    "HttpRuntime": "scrapeflow.http_runtime",
+    "StaticPage": "scrapeflow.http_runtime",
+    "HarReplayRuntime": "scrapeflow.har",
+    "Sink": "scrapeflow.sinks",
+    "JSONLSink": "scrapeflow.sinks",
+    "CSVSink": "scrapeflow.sinks",
+    "SQLiteSink": "scrapeflow.sinks",
+    "ParquetExporter": "scrapeflow.columnar",
+    "ParquetSink": "scrapeflow.columnar",
+    "model_arrow_schema": "scrapeflow.columnar",
+    "RenderMode": "scrapeflow.render_mode",
+    "RenderModeRouter": "scrapeflow.render_mode",
+    "RenderModeTable": "scrapeflow.render_mode",
+    "generate_schema_from_prompt": "scrapeflow.llm_extract",
+    "extract_with_schema": "scrapeflow.llm_extract",
+    "extract_with_schema_async": "scrapeflow.llm_extract",
+    "MCPBackend": "scrapeflow.mcp_backend",
+    "PlaceholderMCPBackend": "scrapeflow.mcp_backend",
+    "MistralLLMBackend": "scrapeflow.mcp_backend",
+    "create_mcp_backend": "scrapeflow.mcp_backend",
+    "ScrapeFlowError": "scrapeflow.exceptions",
+    "ScrapeFlowRetryError": "scrapeflow.exceptions",
+    "ScrapeFlowTimeoutError": "scrapeflow.exceptions",
+    "ScrapeFlowBlockedError": "scrapeflow.exceptions",
+    "ScrapeFlowHTTPError": "scrapeflow.exceptions",
+    "ScrapeFlowValidationError": "scrapeflow.exceptions",
+    "ScrapeFlowRobotsDisallowedError": "scrapeflow.exceptions",
+}
 
 __version__ = "0.3.0"
 __all__ = [
@@ -55,6 +123,8 @@ __all__ = [
     "Workflow",
     "Step",
     "WorkflowExecutor",
+    "CrawlResult",
+    "ShardedCrawlExecutor",
     "Extractor",
     "StructuredExtractor",
     "FieldSpec",
@@ -70,6 +140,20 @@ __all__ = [
     "get_registry",
     "register_quotes_login_handler",
     "PlaywrightBrowserRuntime",
+    "BrowserServer",
+    "HttpRuntime",
+    "StaticPage",
+    "HarReplayRuntime",
+    "Sink",
+    "JSONLSink",
+    "CSVSink",
+    "SQLiteSink",
+    "ParquetExporter",
+    "ParquetSink",
+    "model_arrow_schema",
+    "RenderMode",
+    "RenderModeRouter",
+    "RenderModeTable",
     "MCPBackend",
     "PlaceholderMCPBackend",
     "MistralLLMBackend",
@@ -78,6 +162,7 @@ __all__ = [
     "ScrapeFlowRetryError",
     "ScrapeFlowTimeoutError",
     "ScrapeFlowBlockedError",
+    "ScrapeFlowHTTPError",
     "ScrapeFlowValidationError",
     "ScrapeFlowRobotsDisallowedError",
     "generate_schema_from_prompt",
@@ -85,3 +170,15 @@ __all__ = [
     "extract_with_schema_async",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -57,56 +57,69 @@ class ProxyRotator:
 class StealthMode:
     """Applies stealth techniques to avoid detection."""
 
-    @staticmethod
-    async def apply_stealth(page):
-        """Apply stealth techniques to a Playwright page."""
+    # Individual patches, kept separate for readability and selective reuse.
+    PATCHES = {
         # Remove webdriver property
-        await page.add_init_script(
-            """
+        "webdriver": """
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
-            """
-        )
-
+        """,
         # Override permissions
-        await page.add_init_script(
-            """
+        "permissions": """
             const originalQuery = window.navigator.permissions.query;
             window.navigator.permissions.query = (parameters) => (
                 parameters.name === 'notifications' ?
                     Promise.resolve({ state: Notification.permission }) :
                     originalQuery(parameters)
             );
-            """
-        )
-
+        """,
         # Override plugins
-        await page.add_init_script(
-            """
+        "plugins": """
             Object.defineProperty(navigator, 'plugins', {
                 get: () => [1, 2, 3, 4, 5]
             });
-            """
-        )
-
+        """,
         # Override languages
-        await page.add_init_script(
-            """
+        "languages": """
             Object.defineProperty(navigator, 'languages', {
                 get: () => ['en-US', 'en']
             });
-            """
-        )
-
+        """,
         # Mock chrome object
-        await page.add_init_script(
-            """
+        "chrome": """
             window.chrome = {
                 runtime: {}
             };
-            """
-        )
+        """,
+    }
+
+    @classmethod
+    def bundle(cls) -> str:
+        """
+        All patches as one init script.
+
+        Each patch runs in its own block with its own try/catch, so a failing
+        patch does not stop the others (as when they were separate scripts).
+        """
+        blocks = [
+            f"try {{{body}}} catch (e) {{}} // {name}" for name, body in cls.PATCHES.items()
+        ]
+        return "(() => {\n" + "\n".join(blocks) + "\n})();"
+
+    @classmethod
+    async def apply_stealth(cls, page):
+        """Apply stealth techniques to a single Playwright page (one init script)."""
+        await page.add_init_script(cls.bundle())
+
+    @classmethod
+    async def apply_stealth_to_context(cls, context):
+        """
+        Register the stealth bundle once on a BrowserContext.
+
+        Every page created from the context inherits it without extra round trips.
+        """
+        await context.add_init_script(cls.bundle())
 
 
 class AntiDetectionManager:
@@ -138,3 +151,8 @@ class AntiDetectionManager:
         if self.config.stealth_mode:
             await StealthMode.apply_stealth(page)
 
+    async def apply_stealth_to_context(self, context):
+        """Apply stealth mode once to a browser context if enabled (preferred)."""
+        if self.config.stealth_mode:
+            await StealthMode.apply_stealth_to_context(context)
+
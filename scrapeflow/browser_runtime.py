@@ -1,28 +1,91 @@
 """Playwright browser runtime adapter."""
 
-from typing import Optional
+import asyncio
+import fnmatch
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from playwright.async_api import (
     async_playwright,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
     Playwright,
     Browser,
     BrowserContext,
     Page,
+    Request,
+    Response,
+    Route,
 )
 
 from scrapeflow.config import ScrapeFlowConfig, BrowserType
 from scrapeflow.anti_detection import AntiDetectionManager
+from scrapeflow.page_pool import PagePool
+from scrapeflow.browser_server import BrowserServer
+from scrapeflow.http_cache import HttpCache, parse_cache_control, storable_headers
+from scrapeflow.ports import MonitorPort
+from scrapeflow.exceptions import ScrapeFlowError, ScrapeFlowTimeoutError
+
+# Chromium net errors that will not go away on retry.
+PERMANENT_NET_ERRORS = (
+    "net::ERR_NAME_NOT_RESOLVED",
+    "net::ERR_INVALID_URL",
+    "net::ERR_UNKNOWN_URL_SCHEME",
+    "net::ERR_BLOCKED_BY_CLIENT",
+    "net::ERR_CERT_",
+)
+
+
+def translate_navigation_error(error: Exception, url: str) -> Exception:
+    """
+    Map a Playwright navigation error onto the exceptions ErrorClassifier knows:
+    timeouts -> ScrapeFlowTimeoutError, transient net errors -> ConnectionError,
+    permanent ones (DNS, bad URL, TLS) -> ScrapeFlowError.
+    """
+    if isinstance(error, PlaywrightTimeoutError):
+        return ScrapeFlowTimeoutError(f"Navigation to {url} timed out: {error.message}")
+    if isinstance(error, PlaywrightError) and "net::ERR_" in error.message:
+        if any(code in error.message for code in PERMANENT_NET_ERRORS):
+            return ScrapeFlowError(f"Navigation to {url} failed: {error.message}")
+        return ConnectionError(f"Navigation to {url} failed: {error.message}")
+    return error
 
 
 class PlaywrightBrowserRuntime:
     """Infrastructure adapter for Playwright lifecycle and navigation."""
 
-    def __init__(self, config: ScrapeFlowConfig, anti_detection: AntiDetectionManager):
+    # Rate-limit kind for CostPolicy: a full page load with its subresources.
+    request_kind = "navigation"
+
+    def __init__(
+        self,
+        config: ScrapeFlowConfig,
+        anti_detection: AntiDetectionManager,
+        monitor: Optional[MonitorPort] = None,
+    ):
         self.config = config
         self.anti_detection = anti_detection
+        self.monitor = monitor
+        self._blocked_types = frozenset(config.browser.block_resource_types)
+        self._blocked_url_re = (
+            re.compile("|".join(fnmatch.translate(p) for p in config.browser.blocked_url_patterns))
+            if config.browser.blocked_url_patterns
+            else None
+        )
+        self.http_cache: Optional[HttpCache] = (
+            HttpCache(
+                config.browser.http_cache_dir,
+                config.browser.http_cache_max_bytes,
+                cache_errors=config.browser.http_cache_errors,
+            )
+            if config.browser.http_cache_dir
+            else None
+        )
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self.page_pool: Optional[PagePool] = None
         self._is_running = False
 
     @property
@@ -52,12 +115,16 @@ class PlaywrightBrowserRuntime:
                 ]
             )
 
-        self.browser = await browser_launcher.launch(
-            headless=self.config.browser.headless,
-            slow_mo=self.config.browser.slow_mo,
-            args=browser_args,
-            proxy=proxy,
-        )
+        launch_options = {
+            "headless": self.config.browser.headless,
+            "slow_mo": self.config.browser.slow_mo,
+            "args": browser_args,
+            "proxy": proxy,
+        }
+        if self.config.browser.use_browser_server or self.config.browser.browser_server_endpoint:
+            self.browser = await self._connect_browser_server(browser_launcher, launch_options)
+        else:
+            self.browser = await browser_launcher.launch(**launch_options)
 
         context_options = {
             "viewport": {
@@ -70,16 +137,171 @@ class PlaywrightBrowserRuntime:
             import os
             if os.path.exists(self.config.browser.storage_state_path):
                 context_options["storage_state"] = self.config.browser.storage_state_path
+        if self.config.browser.har_path and self.config.browser.har_mode == "record":
+            # Written when the context closes; .zip archives keep bodies as separate files.
+            context_options["record_har_path"] = self.config.browser.har_path
         self.context = await self.browser.new_context(**context_options)
-        self._page = await self.context.new_page()
-        await self.anti_detection.apply_stealth(self._page)
-        self._page.set_default_timeout(self.config.browser.timeout)
+        await self.anti_detection.apply_stealth_to_context(self.context)
+        await self._install_routes()
+        if self.config.browser.har_path and self.config.browser.har_mode == "replay":
+            # Registered last so it takes precedence; unknown URLs fail instead of going online.
+            await self.context.route_from_har(self.config.browser.har_path, not_found="abort")
+        self._page = await self._new_page()
+        self.page_pool = PagePool(
+            self._new_page,
+            min_size=self.config.browser.page_pool_min_size,
+            max_size=self.config.browser.page_pool_max_size,
+            max_uses=self.config.browser.page_max_uses,
+        )
+        await self.page_pool.start()
         self._is_running = True
 
+    async def _connect_browser_server(self, browser_launcher, launch_options: dict) -> Browser:
+        """
+        Connect to a long-lived browser server instead of launching a browser.
+
+        With an explicit endpoint the server is externally managed. Otherwise a
+        shared BrowserServer is health-checked (and launched or relaunched as
+        needed); a failed connection re-checks it once before retrying.
+        """
+        timeout = self.config.browser.timeout
+        endpoint = self.config.browser.browser_server_endpoint
+        if endpoint:
+            return await browser_launcher.connect(endpoint, timeout=timeout)
+
+        server = BrowserServer(
+            self.config.browser.browser_type,
+            launch_options={
+                "headless": launch_options["headless"],
+                "slowMo": launch_options["slow_mo"],
+                "args": launch_options["args"],
+                **({"proxy": launch_options["proxy"]} if launch_options["proxy"] else {}),
+            },
+            state_path=self.config.browser.browser_server_state_path,
+        )
+        loop = asyncio.get_running_loop()
+        endpoint = await loop.run_in_executor(None, server.ensure)
+        try:
+            return await browser_launcher.connect(endpoint, timeout=timeout)
+        except Exception:
+            # Other engines share this server: ensure() re-checks its health under
+            # the state-file lock and only relaunches it if it is really down.
+            endpoint = await loop.run_in_executor(None, server.ensure)
+            return await browser_launcher.connect(endpoint, timeout=timeout)
+
+    async def _install_routes(self) -> None:
+        """Install context-level request interception when any routing feature is enabled."""
+        if not (self._blocking_enabled or self.http_cache):
+            return
+        await self.context.route("**/*", self._handle_route)
+        if self._blocking_enabled:
+            self.context.on("response", self._record_response_bytes)
+
+    @property
+    def _blocking_enabled(self) -> bool:
+        return bool(self._blocked_types or self._blocked_url_re)
+
+    def _is_blocked(self, request: Request) -> bool:
+        if request.resource_type in self._blocked_types:
+            return True
+        return bool(self._blocked_url_re and self._blocked_url_re.match(request.url))
+
+    async def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if self._is_blocked(request):
+            self._increment("blocked_requests")
+            self._increment(f"blocked_requests.{request.resource_type}")
+            await route.abort("blockedbyclient")
+            return
+        if self.http_cache and request.method == "GET":
+            await self._handle_cached_route(route)
+            return
+        await route.continue_()
+
+    async def _handle_cached_route(self, route: Route) -> None:
+        """
+        Serve GETs through the on-disk cache.
+
+        Fresh entries are fulfilled from disk. Stale ones with validators are
+        revalidated with a conditional request (304 -> serve from disk). Misses
+        are fetched, stored if Cache-Control allows it, and fulfilled. Redirects
+        are passed back to the browser rather than followed here.
+        """
+        request = route.request
+        request_headers = await request.all_headers()
+        request_cc = parse_cache_control(request_headers.get("cache-control"))
+        if "no-store" in request_cc:
+            await route.continue_()
+            return
+
+        loop = asyncio.get_running_loop()
+        cache = self.http_cache
+        entry = await loop.run_in_executor(None, cache.lookup, request.url, request_headers)
+        if entry is not None and entry.is_fresh() and "no-cache" not in request_cc:
+            body = await loop.run_in_executor(None, cache.read_body, entry)
+            if body is not None:
+                self._increment("cache_hits")
+                await route.fulfill(status=entry.status, headers=entry.headers, body=body)
+                return
+            entry = None
+
+        fetch_headers = dict(request_headers)
+        if entry is not None:
+            fetch_headers.update(entry.validators())
+        try:
+            # No redirects: the browser must follow them itself, so page.url, relative links
+            # and cookies match the final URL, and each hop is cached under its own URL.
+            response = await route.fetch(headers=fetch_headers, max_redirects=0)
+        except PlaywrightError:
+            await route.continue_()
+            return
+
+        if entry is not None and response.status == 304:
+            body = await loop.run_in_executor(None, cache.read_body, entry)
+            if body is not None:
+                entry = await loop.run_in_executor(None, cache.refresh, entry, response.headers)
+                self._increment("cache_revalidations")
+                await route.fulfill(status=entry.status, headers=entry.headers, body=body)
+                return
+            # Body vanished (evicted concurrently): refetch unconditionally.
+            response = await route.fetch(headers=request_headers, max_redirects=0)
+
+        self._increment("cache_misses")
+        body = await response.body()
+        await loop.run_in_executor(
+            None, cache.store, request.url, request_headers, response.status, response.headers, body
+        )
+        # The fetched body is already decoded, so drop Content-Encoding/Length.
+        await route.fulfill(
+            status=response.status, headers=storable_headers(response.headers), body=body
+        )
+
+    def _record_response_bytes(self, response: Response) -> None:
+        """Count transferred bytes (Content-Length) so blocking savings can be measured."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self._increment("response_bytes", int(length))
+
+    def _increment(self, name: str, value: float = 1) -> None:
+        increment = getattr(self.monitor, "increment", None)
+        if increment is not None:
+            increment(name, value)
+
+    async def _new_page(self) -> Page:
+        """Create a page on the shared context (stealth is inherited from the context)."""
+        if not self.context:
+            raise RuntimeError("Browser runtime is not started.")
+        page = await self.context.new_page()
+        page.set_default_timeout(self.config.browser.timeout)
+        return page
+
     async def close(self) -> None:
         if not self._is_running:
             return
 
+        if self.page_pool:
+            await self.page_pool.close()
+            self.page_pool = None
         if self._page:
             await self._page.close()
             self._page = None
@@ -87,6 +309,7 @@ class PlaywrightBrowserRuntime:
             await self.context.close()
             self.context = None
         if self.browser:
+            # For a browser-server connection this only disconnects; the server stays up.
             await self.browser.close()
             self.browser = None
         if self.playwright:
@@ -94,10 +317,39 @@ class PlaywrightBrowserRuntime:
             self.playwright = None
         self._is_running = False
 
-    async def goto(self, url: str, wait_until: str, timeout: int) -> None:
-        if not self._page:
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[Page]:
+        """Lease a page from the pool; it is reset and returned on exit."""
+        page = await self.lease_page()
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
+
+    async def lease_page(self) -> Page:
+        """Lease a page from the pool. Pair with release_page()."""
+        if not self.page_pool:
+            raise RuntimeError("Browser runtime is not started.")
+        return await self.page_pool.acquire()
+
+    async def release_page(self, page: Page, discard: bool = False) -> None:
+        """Return a leased page; `discard=True` closes it instead of reusing it."""
+        if self.page_pool:
+            await self.page_pool.release(page, discard=discard)
+
+    async def goto(
+        self, url: str, wait_until: str, timeout: int, page: Optional[Page] = None
+    ) -> Optional[Response]:
+        target = page or self._page
+        if not target:
             raise RuntimeError("Browser runtime is not started.")
-        await self._page.goto(url, wait_until=wait_until, timeout=timeout)
+        try:
+            return await target.goto(url, wait_until=wait_until, timeout=timeout)
+        except PlaywrightError as e:
+            translated = translate_navigation_error(e, url)
+            if translated is e:
+                raise
+            raise translated from e
 
     async def save_storage_state(self, path: str) -> None:
         """Save cookies and local storage to a JSON file for session persistence."""
@@ -0,0 +1,285 @@
+"""
+Persistent Playwright browser server shared across engines and processes.
+
+Launching a browser costs 0.5-1.5 s. BrowserServer launches one long-lived
+browser server (Playwright's `launch-server`), records its websocket endpoint
+in a state file, and lets every later PlaywrightBrowserRuntime - in this or
+any other process on the machine - connect to it and only create a fresh
+context. Dead servers are detected by a health check and relaunched.
+
+The state file also records the server process's start time. A recorded pid
+is only trusted (or signalled) while it still names that same process, so a
+pid reused after a reboot or crash is never killed. State files live in a
+per-user directory by default and are ignored unless owned by this user, so
+another local user cannot point the crawler at their own endpoint.
+"""
+
+import json
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+from scrapeflow.config import BrowserType
+from scrapeflow.exceptions import ScrapeFlowError
+
+try:
+    import fcntl
+except ImportError:  # Windows: launches are not serialized across processes
+    fcntl = None
+
+
+def _owned_by_me(st: os.stat_result) -> bool:
+    getuid = getattr(os, "getuid", None)
+    return getuid is None or st.st_uid == getuid()
+
+
+def _default_state_dir() -> str:
+    """This user's private directory for server state ($XDG_RUNTIME_DIR or a 0700 tmp dir)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+    getuid = getattr(os, "getuid", None)
+    user = str(getuid()) if getuid else os.environ.get("USERNAME", "user")
+    path = os.path.join(tempfile.gettempdir(), f"scrapeflow-{user}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if getuid and (
+        not stat.S_ISDIR(st.st_mode) or not _owned_by_me(st) or st.st_mode & 0o077
+    ):
+        raise ScrapeFlowError(f"Browser server state directory {path} is not private to this user")
+    return path
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_start_time(pid: int) -> Optional[str]:
+    """Start time of `pid`, as an opaque identity string; None if it can't be read."""
+    try:
+        with open(f"/proc/{pid}/stat", "r", encoding="ascii", errors="replace") as f:
+            # Field 22 (starttime); the command name in field 2 may contain spaces.
+            return f.read().rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        pass
+    try:
+        output = subprocess.run(
+            ["ps", "-o", "lstart=", "-p", str(pid)],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output or None
+
+
+def _port_open(endpoint: str, timeout: float = 0.5) -> bool:
+    parsed = urlparse(endpoint)
+    if not parsed.hostname or not parsed.port:
+        return False
+    try:
+        with socket.create_connection((parsed.hostname, parsed.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+class BrowserServer:
+    """Launch-once, connect-many browser server with health check and relaunch."""
+
+    def __init__(
+        self,
+        browser_type: BrowserType = BrowserType.CHROMIUM,
+        launch_options: Optional[Dict[str, Any]] = None,
+        state_path: Optional[str] = None,
+        startup_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            browser_type: Browser to serve.
+            launch_options: Playwright launch options (headless, args, proxy, ...).
+            state_path: JSON file recording the running server's pid/endpoint,
+                        shared by all processes using the same path (default:
+                        in this user's runtime directory). A file owned by
+                        another user is ignored.
+            startup_timeout: Seconds to wait for a launched server to report
+                             its endpoint.
+        """
+        self.browser_type = BrowserType(browser_type)
+        self.launch_options = launch_options or {}
+        self.state_path = state_path or os.path.join(
+            _default_state_dir(), f"scrapeflow-browser-server-{self.browser_type.value}.json"
+        )
+        self.startup_timeout = startup_timeout
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Serialize launch decisions across processes sharing the state file."""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.state_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                if not _owned_by_me(os.fstat(f.fileno())):
+                    return None  # planted by another user: never trust its endpoint or pid
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _owns_pid(state: Dict[str, Any]) -> bool:
+        """True if the recorded pid is still the server process that was launched."""
+        pid, started = state.get("pid"), state.get("started")
+        if not pid or not started or not _pid_alive(pid):
+            return False
+        return _process_start_time(pid) == started
+
+    def is_healthy(self, state: Optional[Dict[str, Any]] = None) -> bool:
+        """True if the recorded server process is alive and accepting connections."""
+        state = state if state is not None else self._read_state()
+        if not state or not state.get("ws_endpoint"):
+            return False
+        return self._owns_pid(state) and _port_open(state["ws_endpoint"])
+
+    @property
+    def ws_endpoint(self) -> Optional[str]:
+        state = self._read_state()
+        return state.get("ws_endpoint") if state else None
+
+    def ensure(self) -> str:
+        """Return the endpoint of a healthy server, launching one if needed."""
+        with self._exclusive():
+            state = self._read_state()
+            if self.is_healthy(state):
+                return state["ws_endpoint"]
+            if state:
+                self._terminate(state)
+            return self._launch()
+
+    def relaunch(self) -> str:
+        """Stop the recorded server (if any) and launch a new one."""
+        with self._exclusive():
+            state = self._read_state()
+            if state:
+                self._terminate(state)
+            return self._launch()
+
+    def stop(self) -> None:
+        """Stop the recorded server and forget it."""
+        with self._exclusive():
+            state = self._read_state()
+            if state:
+                self._terminate(state)
+            for path in (self.state_path, f"{self.state_path}.log", f"{self.state_path}.config"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _spawn(self, config_path: str, log_file: Any) -> subprocess.Popen:
+        """Start `playwright launch-server` detached from this process."""
+        # The public CLI entry point (python -m playwright) runs the bundled driver.
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "playwright",
+                "launch-server",
+                "--browser",
+                self.browser_type.value,
+                "--config",
+                config_path,
+            ],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return process
+
+    def _launch(self) -> str:
+        config_path = f"{self.state_path}.config"
+        log_path = f"{self.state_path}.log"
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(self.launch_options, f)
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            process = self._spawn(config_path, log_file)
+        spawned = {"pid": process.pid, "started": _process_start_time(process.pid)}
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            endpoint = self._endpoint_from_log(log_path)
+            if endpoint:
+                self._write_state(
+                    {**spawned, "ws_endpoint": endpoint, "browser_type": self.browser_type.value}
+                )
+                return endpoint
+            if process.poll() is not None:  # exited during startup (and reaped)
+                break
+            time.sleep(0.05)
+
+        self._terminate(spawned)
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            output = f.read()[-2000:]
+        raise ScrapeFlowError(f"Browser server failed to start: {output}")
+
+    @staticmethod
+    def _endpoint_from_log(log_path: str) -> Optional[str]:
+        try:
+            with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("ws://") or line.startswith("wss://"):
+                        return line
+        except OSError:
+            pass
+        return None
+
+    @classmethod
+    def _terminate(cls, state: Dict[str, Any]) -> None:
+        """SIGTERM the recorded server's process group, only if the pid is still that server."""
+        if not cls._owns_pid(state):
+            return
+        pid = state["pid"]
+        try:
+            # The server was started in its own session, so it leads its group.
+            if os.getpgid(pid) == pid:
+                os.killpg(pid, signal.SIGTERM)
+                return
+        except (OSError, AttributeError):
+            pass
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
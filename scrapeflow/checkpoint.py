@@ -0,0 +1,261 @@
+"""
+Crawl checkpoints in SQLite, so long crawls can resume after a crash.
+
+One row per (job, canonical URL) holds the URL's status (queued, done,
+failed, retry), its error and its extracted data. Together the rows form the
+frontier, the seen-URL set and the partial results. URLs that failed for a
+transient reason (timeouts, 429/5xx, ...) are stored as `retry` and crawled
+again on resume; `failed` is final. Writes are buffered and flushed in one
+transaction per batch. The database runs in WAL mode with
+synchronous=NORMAL, which keeps write amplification low while surviving
+process crashes.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from scrapeflow.frontier import canonicalize_url
+from scrapeflow.retry import ErrorClassifier
+
+QUEUED = "queued"
+DONE = "done"
+FAILED = "failed"
+RETRY = "retry"
+# Statuses a later session claims again: unfinished, or failed transiently.
+_RECLAIMABLE = (QUEUED, RETRY)
+_SELECT_CHUNK = 500  # canonical URLs per IN (...) lookup, below SQLite's variable limit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS urls (
+    job_id TEXT NOT NULL,
+    canonical TEXT NOT NULL,
+    url TEXT NOT NULL,
+    priority REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    session TEXT NOT NULL,
+    error TEXT,
+    data TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, canonical)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS urls_by_status ON urls (job_id, status, priority DESC, canonical);
+"""
+
+_UPSERT = """
+INSERT INTO urls (job_id, canonical, url, priority, status, session, error, data, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_id, canonical) DO UPDATE SET
+    status = excluded.status,
+    session = excluded.session,
+    error = excluded.error,
+    data = COALESCE(excluded.data, urls.data),
+    updated_at = excluded.updated_at
+"""
+
+
+def _to_json(data: Any) -> str:
+    """Serialize extracted data, including Pydantic models, to JSON."""
+
+    def _default(obj: Any) -> Any:
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump(mode="json")
+        return str(obj)
+
+    return json.dumps(data, default=_default, ensure_ascii=False)
+
+
+class CrawlCheckpoint:
+    """Per-job crawl state (queued/done/failed URLs and results) in a SQLite file."""
+
+    def __init__(
+        self,
+        path: str,
+        job_id: str,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+    ):
+        """
+        Args:
+            path: SQLite database file (shared by any number of jobs).
+            job_id: Crawl job to record into or resume.
+            batch_size: Buffered row updates that trigger a flush.
+            flush_interval: Seconds after which buffered updates are flushed
+                            on the next write.
+        """
+        self.path = path
+        self.job_id = job_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # URLs queued by an earlier session (i.e. before a crash) may be claimed again.
+        self.session = uuid.uuid4().hex
+        self._buffer: Dict[str, Tuple] = {}  # canonical -> row, newest wins
+        self._last_flush = time.monotonic()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # claim_many() runs in an executor thread; calls are never concurrent.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, created_at, updated_at) VALUES (?, ?, ?)",
+                (job_id, now, now),
+            )
+
+    def _statuses(self, canonicals: List[str]) -> Dict[str, Tuple[str, str]]:
+        """canonical -> (status, session) of the stored URLs among `canonicals`."""
+        found: Dict[str, Tuple[str, str]] = {}
+        unique = list(dict.fromkeys(canonicals))
+        for start in range(0, len(unique), _SELECT_CHUNK):
+            chunk = unique[start : start + _SELECT_CHUNK]
+            cur = self._conn.execute(
+                "SELECT canonical, status, session FROM urls WHERE job_id = ? "
+                f"AND canonical IN ({', '.join('?' * len(chunk))})",
+                (self.job_id, *chunk),
+            )
+            found.update((canonical, (status, session)) for canonical, status, session in cur)
+        return found
+
+    def _write(
+        self,
+        url: str,
+        status: str,
+        priority: float = 0.0,
+        error: Optional[str] = None,
+        data: Optional[str] = None,
+    ) -> None:
+        canonical = canonicalize_url(url)
+        self._buffer[canonical] = (
+            self.job_id, canonical, url, priority, status, self.session, error, data, time.time()
+        )
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def claim(self, url: str, priority: float = 0.0) -> bool:
+        """
+        Record a URL as queued for this session.
+
+        Returns False if the job already finished it (done or failed for good)
+        or this session already claimed it; URLs left queued by an earlier,
+        crashed session, or failed there transiently, are claimed again.
+        """
+        return bool(self.claim_many([url], priority))
+
+    def claim_many(self, urls: Iterable[str], priority: float = 0.0) -> List[str]:
+        """claim() a batch of URLs with one lookup per chunk; return those claimed."""
+        urls = list(urls)
+        canonicals = [canonicalize_url(url) for url in urls]
+        known = self._statuses([c for c in canonicals if c not in self._buffer])
+        claimed = []
+        for url, canonical in zip(urls, canonicals):
+            row = self._buffer.get(canonical)
+            state = (row[4], row[5]) if row is not None else known.get(canonical)
+            if state is not None:
+                status, session = state
+                if status not in _RECLAIMABLE or session == self.session:
+                    continue
+            self._write(url, QUEUED, priority)
+            known[canonical] = (QUEUED, self.session)  # the write may flush the buffer
+            claimed.append(url)
+        return claimed
+
+    def mark_done(self, url: str, data: Any = None) -> None:
+        self._write(url, DONE, data=_to_json(data))
+
+    def mark_failed(self, url: str, error: BaseException) -> None:
+        """Record a failure; transient ones (ErrorClassifier.is_retryable) are retried on resume."""
+        retryable = isinstance(error, Exception) and ErrorClassifier.is_retryable(error)
+        self._write(url, RETRY if retryable else FAILED, error=f"{type(error).__name__}: {error}")
+
+    def flush(self) -> None:
+        """Write buffered updates in a single transaction."""
+        if self._buffer:
+            rows = list(self._buffer.values())
+            self._buffer.clear()
+            with self._conn:
+                self._conn.executemany(_UPSERT, rows)
+                self._conn.execute(
+                    "UPDATE jobs SET updated_at = ? WHERE job_id = ?", (time.time(), self.job_id)
+                )
+        self._last_flush = time.monotonic()
+
+    def pending_urls(self, chunk_size: int = 1000) -> Iterator[str]:
+        """
+        URLs to crawl on resume, highest priority first: queued but not finished
+        (e.g. in flight at a crash) or failed transiently.
+
+        Read in keyset-paginated chunks, so the job can be updated while iterating.
+        """
+        self.flush()
+        last: Optional[Tuple[float, str]] = None
+        while True:
+            if last is None:
+                cur = self._conn.execute(
+                    "SELECT priority, canonical, url FROM urls WHERE job_id = ? "
+                    "AND status IN (?, ?) ORDER BY priority DESC, canonical LIMIT ?",
+                    (self.job_id, *_RECLAIMABLE, chunk_size),
+                )
+            else:
+                cur = self._conn.execute(
+                    "SELECT priority, canonical, url FROM urls WHERE job_id = ? "
+                    "AND status IN (?, ?) AND (priority < ? OR (priority = ? AND canonical > ?)) "
+                    "ORDER BY priority DESC, canonical LIMIT ?",
+                    (self.job_id, *_RECLAIMABLE, last[0], last[0], last[1], chunk_size),
+                )
+            rows = cur.fetchall()
+            for _, _, url in rows:
+                yield url
+            if len(rows) < chunk_size:
+                return
+            last = rows[-1][0], rows[-1][1]
+
+    def results(self) -> Iterator[Tuple[str, Any]]:
+        """(url, data) of every completed URL."""
+        self.flush()
+        cur = self._conn.execute(
+            "SELECT url, data FROM urls WHERE job_id = ? AND status = ?", (self.job_id, DONE)
+        )
+        for url, data in cur:
+            yield url, json.loads(data) if data is not None else None
+
+    def stats(self) -> Dict[str, int]:
+        """Number of URLs per status."""
+        self.flush()
+        cur = self._conn.execute(
+            "SELECT status, COUNT(*) FROM urls WHERE job_id = ? GROUP BY status", (self.job_id,)
+        )
+        return {QUEUED: 0, DONE: 0, FAILED: 0, RETRY: 0, **dict(cur.fetchall())}
+
+    def mark_finished(self) -> None:
+        self.flush()
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET finished = 1, updated_at = ? WHERE job_id = ?",
+                (time.time(), self.job_id),
+            )
+
+    @property
+    def finished(self) -> bool:
+        cur = self._conn.execute("SELECT finished FROM jobs WHERE job_id = ?", (self.job_id,))
+        row = cur.fetchone()
+        return bool(row and row[0])
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
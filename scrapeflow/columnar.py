@@ -0,0 +1,269 @@
+"""
+Columnar (Arrow/Parquet) export of validated specification items.
+
+The Arrow schema is derived once from the Pydantic model (ProductPriceSpec,
+JobListingSpec, ...). Each batch of items is converted column by column into a
+RecordBatch and written as one Parquet row group, so exports never hold more
+than one batch in memory and skip the dict -> DataFrame round trip.
+
+Requires pyarrow: pip install pyarrow (or scrapeflow-py[parquet]).
+"""
+
+import datetime
+import decimal
+import enum
+import json
+import os
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from scrapeflow.sinks import Sink
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+else:  # pragma: no cover
+    UnionType = Union
+
+
+def _pyarrow() -> Any:
+    """Lazy-import pyarrow and pyarrow.parquet."""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Parquet export. Install with: pip install pyarrow"
+        )
+    return pyarrow
+
+
+def _json_value(value: Any) -> Any:
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _str_value(value: Any) -> Any:
+    if value is None:
+        return None
+    return str(value.value) if isinstance(value, enum.Enum) else str(value)
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    """(inner type, nullable) for Optional[X] / X | None; other unions are returned as-is."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        nullable = len(args) < len(get_args(annotation))
+        if len(args) == 1:
+            return args[0], nullable
+        return Union[tuple(args)], nullable
+    return annotation, False
+
+
+def _arrow_type(pa: Any, annotation: Any) -> Tuple[Any, Optional[Callable[[Any], Any]]]:
+    """
+    Arrow type for a Python annotation, plus a converter for values Arrow can't
+    take as-is. Types without a natural Arrow equivalent (dicts, Any, mixed
+    unions) are stored as JSON strings; enums and decimals as strings.
+    """
+    annotation, _ = _unwrap_optional(annotation)
+    origin = get_origin(annotation)
+
+    if annotation is bool:
+        return pa.bool_(), None
+    if annotation is int:
+        return pa.int64(), None
+    if annotation is float:
+        return pa.float64(), None
+    if annotation is str:
+        return pa.string(), None
+    if annotation is bytes:
+        return pa.binary(), None
+    if annotation is datetime.datetime:
+        return pa.timestamp("us"), None
+    if annotation is datetime.date:
+        return pa.date32(), None
+    if isinstance(annotation, type) and issubclass(annotation, (enum.Enum, decimal.Decimal)):
+        return pa.string(), _str_value
+    if origin is Literal and all(isinstance(a, str) for a in get_args(annotation)):
+        return pa.string(), None
+    if origin in (list, tuple, set, frozenset) and get_args(annotation):
+        args = get_args(annotation)
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return pa.string(), _json_value
+        item_type, converter = _arrow_type(pa, args[0])
+        if converter is None:
+            return pa.list_(item_type), lambda v: None if v is None else list(v)
+        return pa.list_(item_type), lambda v: None if v is None else [converter(x) for x in v]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        struct = model_arrow_schema(annotation)
+        if any(_arrow_type(pa, f.annotation)[1] for f in annotation.model_fields.values()):
+            return pa.string(), _json_value
+        return pa.struct(list(struct)), None
+    return pa.string(), _json_value
+
+
+def model_arrow_schema(model: Type[BaseModel]) -> Any:
+    """
+    Arrow schema for a Pydantic model.
+
+    Field nullability follows the annotation (Optional[X] is nullable); field
+    descriptions are kept as Arrow field metadata.
+    """
+    pa = _pyarrow()
+    fields = []
+    for name, info in model.model_fields.items():
+        arrow_type, _ = _arrow_type(pa, info.annotation)
+        _, nullable = _unwrap_optional(info.annotation)
+        metadata = {"description": info.description} if info.description else None
+        nullable = nullable or not info.is_required()
+        fields.append(
+            pa.field(info.alias or name, arrow_type, nullable=nullable, metadata=metadata)
+        )
+    return pa.schema(fields)
+
+
+class ParquetExporter:
+    """
+    Incremental Parquet writer for items of one Pydantic model.
+
+    Each write_batch() call becomes one row group. The file is only valid
+    (readable) after close().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: Type[BaseModel],
+        compression: str = "zstd",
+        **writer_options: Any,
+    ):
+        """
+        Args:
+            path: Output .parquet file.
+            model: Pydantic model the items validate against.
+            compression: Parquet codec ("zstd", "snappy", "gzip", "none").
+            **writer_options: Extra pyarrow.parquet.ParquetWriter options.
+        """
+        self._pa = _pyarrow()
+        self.path = path
+        self.model = model
+        self.schema = model_arrow_schema(model)
+        self.rows_written = 0
+        self.row_groups_written = 0
+        self._converters: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+            (info.alias or name, _arrow_type(self._pa, info.annotation)[1])
+            for name, info in model.model_fields.items()
+        ]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        self._writer = self._pa.parquet.ParquetWriter(
+            self._file, self.schema, compression=compression, **writer_options
+        )
+
+    def __enter__(self) -> "ParquetExporter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def record_batch(self, items: Iterable[Union[BaseModel, Dict[str, Any]]]) -> Any:
+        """Build a RecordBatch column-wise from models or dicts (keyed by field name/alias)."""
+        rows = [
+            item.model_dump(by_alias=True) if isinstance(item, BaseModel) else item
+            for item in items
+        ]
+        columns = []
+        for (name, converter), field in zip(self._converters, self.schema):
+            values = [row.get(name) for row in rows]
+            if converter is not None:
+                values = [converter(v) for v in values]
+            columns.append(self._pa.array(values, type=field.type))
+        return self._pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+    def write_batch(self, items: Iterable[Union[BaseModel, Dict[str, Any]]]) -> None:
+        """Append items as one row group."""
+        batch = self.record_batch(items)
+        if batch.num_rows == 0:
+            return
+        self._writer.write_batch(batch, row_group_size=batch.num_rows)
+        self.rows_written += batch.num_rows
+        self.row_groups_written += 1
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Write the Parquet footer and close the file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Sink writing spec items to Parquet, one row group per batch.
+
+    Use a larger batch_size than for row-oriented sinks; row groups of a few
+    thousand rows or more compress and scan well.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: Type[BaseModel],
+        compression: str = "zstd",
+        batch_size: int = 10_000,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            path: Output .parquet file (created on the first batch).
+            model: Pydantic model of the items (e.g. ProductPriceSpec).
+            compression: Parquet codec.
+            batch_size: Rows per row group.
+            **kwargs: Sink options (flush_interval, queue_size, fsync).
+        """
+        _pyarrow()
+        super().__init__(batch_size=batch_size, **kwargs)
+        self.path = path
+        self.model = model
+        self.compression = compression
+        self.exporter: Optional[ParquetExporter] = None
+
+    def _to_record(self, item: Any) -> Any:
+        # Keep native values (datetimes, nested models); the exporter converts column-wise.
+        if isinstance(item, BaseModel):
+            return item.model_dump(by_alias=True)
+        return item
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        if self.exporter is None:
+            self.exporter = ParquetExporter(self.path, self.model, compression=self.compression)
+        self.exporter.write_batch(records)
+
+    def _sync(self) -> None:
+        if self.exporter is not None:
+            self.exporter.sync()
+
+    def _close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
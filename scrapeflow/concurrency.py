@@ -0,0 +1,250 @@
+"""
+Latency-driven adaptive concurrency limits per host.
+
+The rate limiter bounds how often requests start. This module bounds how many
+are in flight, and finds that number per host from round-trip times, as TCP
+Vegas does for congestion windows. RTT stays flat while a server keeps up and
+grows once requests queue on its side. Each sample estimates that queue from
+the no-load RTT: the smallest RTT seen, which is only forgotten (over
+`rtt_window` samples) by requests sent while the host was lightly loaded, so
+sustained load can't pass for the baseline:
+
+    queue = limit * (1 - min_rtt / rtt)
+    queue <= queue_low  * log10(limit)  ->  limit += log10(limit)
+    queue >= queue_high * log10(limit)  ->  limit -= log10(limit)
+
+where log10(limit) is at least 1. Timeouts and 429/503 responses cut the
+limit by `backoff_ratio`. The limit only grows while the host is actually
+busy (in flight >= limit / 2), so idle hosts don't drift up to max_limit.
+
+Decisions go to the monitor as counters and gauges. Only the first
+`max_host_gauges` hosts get their own limit/RTT gauges; every host is
+covered by the mean gauges, so metrics stay bounded on huge crawls.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Set
+
+from scrapeflow.config import ConcurrencyLimitConfig
+from scrapeflow.exceptions import ScrapeFlowTimeoutError
+
+
+class _HostLimit:
+    __slots__ = ("limit", "in_flight", "min_rtt", "last_rtt", "waiters")
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.min_rtt: Optional[float] = None
+        self.last_rtt: Optional[float] = None
+        self.waiters: Deque[asyncio.Future] = deque()
+
+
+class Slot:
+    """One in-flight request; call drop() to report it as rejected by the server."""
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter", key: str):
+        self.limiter = limiter
+        self.key = key
+        self.dropped = False
+        self._in_flight_at_start = 0
+        self._started = 0.0
+
+    def drop(self) -> None:
+        self.dropped = True
+
+    def start_timer(self) -> None:
+        """Restart the RTT clock, e.g. after a rate-limit wait taken inside the slot."""
+        self._started = time.monotonic()
+
+    async def __aenter__(self) -> "Slot":
+        self._in_flight_at_start = await self.limiter.acquire(self.key)
+        self._started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        rtt: Optional[float] = time.monotonic() - self._started
+        if exc_val is not None:
+            # Timeouts mean overload; other failures say nothing about latency.
+            self.dropped = self.dropped or isinstance(
+                exc_val, (ScrapeFlowTimeoutError, asyncio.TimeoutError)
+            )
+            rtt = None
+        self.limiter.release(
+            self.key, rtt=rtt, dropped=self.dropped, in_flight=self._in_flight_at_start
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """Per-host in-flight limits adjusted from measured RTT (Vegas style)."""
+
+    def __init__(self, config: Optional[ConcurrencyLimitConfig] = None, monitor: Any = None):
+        """
+        Args:
+            config: Limits and tuning (initial/min/max limit, queue thresholds, ...).
+            monitor: Optional MonitorPort; receives the counters concurrency.increases /
+                     concurrency.decreases / concurrency.drops / concurrency.waits,
+                     the gauges concurrency.limit.<host> / concurrency.rtt_ms.<host>
+                     for up to `max_host_gauges` hosts, and concurrency.hosts /
+                     concurrency.mean_limit / concurrency.mean_rtt_ms over all
+                     hosts (refreshed at most once a second).
+        """
+        self.config = config or ConcurrencyLimitConfig(enabled=True)
+        self.monitor = monitor
+        self._hosts: "OrderedDict[str, _HostLimit]" = OrderedDict()
+        self._gauged_hosts: Set[str] = set()
+        self._means_published = -math.inf
+
+    def slot(self, key: str) -> Slot:
+        """`async with limiter.slot(host) as slot:` around one request."""
+        return Slot(self, key)
+
+    def limit(self, key: str) -> int:
+        """Current in-flight limit of `key`."""
+        state = self._hosts.get(key)
+        return int(state.limit) if state is not None else self.config.initial_limit
+
+    def limits(self) -> Dict[str, int]:
+        return {key: int(state.limit) for key, state in self._hosts.items()}
+
+    def rtts(self) -> Dict[str, float]:
+        """Last measured RTT in seconds of every host with a sample."""
+        return {
+            key: state.last_rtt for key, state in self._hosts.items() if state.last_rtt is not None
+        }
+
+    def in_flight(self, key: str) -> int:
+        state = self._hosts.get(key)
+        return state.in_flight if state is not None else 0
+
+    def _state(self, key: str) -> _HostLimit:
+        state = self._hosts.get(key)
+        if state is not None:
+            self._hosts.move_to_end(key)
+            return state
+        # Forget idle hosts first so memory stays bounded.
+        for _ in range(len(self._hosts)):
+            if len(self._hosts) < self.config.max_hosts:
+                break
+            oldest_key, oldest = next(iter(self._hosts.items()))
+            if oldest.in_flight or oldest.waiters:
+                self._hosts.move_to_end(oldest_key)
+            else:
+                del self._hosts[oldest_key]
+        state = self._hosts[key] = _HostLimit(float(self.config.initial_limit))
+        return state
+
+    async def acquire(self, key: str) -> int:
+        """
+        Wait for a free slot on `key`.
+
+        Returns the number of requests in flight on `key` when the slot was
+        taken (including it), for release(in_flight=...).
+        """
+        state = self._state(key)
+        if state.in_flight < int(state.limit) and not state.waiters:
+            state.in_flight += 1
+            return state.in_flight
+        self._count("concurrency.waits")
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            # _release_slot resolves the waiter with the in-flight count at the grant.
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot(state)  # granted, then cancelled
+            else:
+                state.waiters.remove(waiter)
+            raise
+
+    def release(
+        self,
+        key: str,
+        rtt: Optional[float] = None,
+        dropped: bool = False,
+        in_flight: Optional[int] = None,
+    ) -> None:
+        """
+        Free a slot and update the limit.
+
+        Args:
+            key: Host the slot was taken on.
+            rtt: Measured round trip in seconds (None: no usable sample).
+            dropped: The request timed out or was throttled (429/503).
+            in_flight: Requests in flight when this one started (growth is
+                       skipped while the host was under half its limit).
+        """
+        state = self._hosts.get(key)
+        if state is None:
+            return
+        if dropped:
+            self._decrease(state, self.config.backoff_ratio, "concurrency.drops")
+        elif rtt is not None and rtt > 0:
+            self._sample(state, rtt, state.in_flight if in_flight is None else in_flight)
+        self._publish(key, state)
+        self._release_slot(state)
+
+    def _sample(self, state: _HostLimit, rtt: float, in_flight: int) -> None:
+        config = self.config
+        state.last_rtt = rtt
+        if state.min_rtt is None or rtt < state.min_rtt:
+            state.min_rtt = rtt
+        elif in_flight <= max(1.0, state.limit / 4):
+            # Re-learn a host that got permanently slower, from unloaded samples only.
+            state.min_rtt += (rtt - state.min_rtt) / config.rtt_window
+
+        step = max(1.0, math.log10(state.limit))
+        queue = state.limit * (1 - state.min_rtt / rtt)
+        if queue <= config.queue_low * step:
+            if in_flight < state.limit / 2:
+                return  # app-limited: no evidence the host can take more
+            limit = min(float(config.max_limit), state.limit + step)
+            if limit > state.limit:
+                self._count("concurrency.increases")
+        elif queue >= config.queue_high * step:
+            limit = max(float(config.min_limit), state.limit - step)
+            self._count("concurrency.decreases")
+        else:
+            return
+        state.limit = limit
+
+    def _decrease(self, state: _HostLimit, ratio: float, counter: str) -> None:
+        state.limit = max(float(self.config.min_limit), state.limit * ratio)
+        self._count(counter)
+
+    def _release_slot(self, state: _HostLimit) -> None:
+        state.in_flight -= 1
+        while state.waiters and state.in_flight < int(state.limit):
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                state.in_flight += 1
+                waiter.set_result(state.in_flight)
+
+    def _publish(self, key: str, state: _HostLimit) -> None:
+        set_gauge = getattr(self.monitor, "set_gauge", None)
+        if set_gauge is None:
+            return
+        if key in self._gauged_hosts or len(self._gauged_hosts) < self.config.max_host_gauges:
+            self._gauged_hosts.add(key)
+            set_gauge(f"concurrency.limit.{key}", int(state.limit))
+            if state.last_rtt is not None:
+                set_gauge(f"concurrency.rtt_ms.{key}", state.last_rtt * 1000)
+        now = time.monotonic()
+        if now - self._means_published < 1.0:
+            return
+        self._means_published = now
+        limits = self.limits()
+        rtts = self.rtts()
+        set_gauge("concurrency.hosts", len(limits))
+        set_gauge("concurrency.mean_limit", sum(limits.values()) / len(limits))
+        if rtts:
+            set_gauge("concurrency.mean_rtt_ms", sum(rtts.values()) / len(rtts) * 1000)
+
+    def _count(self, name: str) -> None:
+        increment = getattr(self.monitor, "increment", None)
+        if increment is not None:
+            increment(name)
@@ -34,6 +34,35 @@ class RateLimitConfig:
     requests_per_second: float = 1.0
     requests_per_minute: Optional[float] = None
     burst_size: int = 5
+    # One bucket per host at the rate above (KeyedRateLimiter), instead of one global bucket.
+    per_host: bool = False
+    global_requests_per_second: Optional[float] = None  # cap across all hosts (per_host only)
+    max_hosts: int = 10_000  # host buckets kept; least recently used are evicted
+    host_idle_ttl: float = 300.0  # seconds before an idle host bucket is evicted
+    # State file shared by every process on this machine (SharedRateLimiter + MmapBackend),
+    # so their combined rate stays within the limits above.
+    shared_path: Optional[str] = None
+    # AIMD: back off on 429/503, timeouts and rising latency; speed up on sustained success.
+    adaptive: bool = False
+    min_requests_per_second: float = 0.1
+    max_requests_per_second: Optional[float] = None  # AIMD ceiling (default: requests_per_second)
+    max_host_gauges: int = 20  # adaptive hosts given a rate_limit.rps.<host> gauge
+
+
+@dataclass
+class ConcurrencyLimitConfig:
+    """Configuration for latency-driven per-host concurrency limits (AdaptiveConcurrencyLimiter)."""
+
+    enabled: bool = False
+    initial_limit: int = 4  # requests in flight per host before any RTT is measured
+    min_limit: int = 1
+    max_limit: int = 64
+    queue_low: float = 3.0  # grow while fewer requests than this (x log10 limit) queue at the host
+    queue_high: float = 6.0  # shrink once at least this many (x log10 limit) queue
+    rtt_window: int = 100  # lightly loaded samples over which the no-load RTT is re-learned
+    backoff_ratio: float = 0.9  # limit multiplier on timeouts and 429/503
+    max_hosts: int = 10_000  # host states kept; idle ones are forgotten first
+    max_host_gauges: int = 20  # hosts given their own limit/RTT gauges; all are in the means
 
 
 @dataclass
@@ -60,6 +89,21 @@ class BrowserConfig:
     args: List[str] = field(default_factory=list)
     proxy: Optional[Dict[str, str]] = None
     storage_state_path: Optional[str] = None  # Load cookies/session from file on start
+    page_pool_min_size: int = 0  # Pages pre-warmed at start for crawl_many()
+    page_pool_max_size: int = 8  # Max pages leased concurrently
+    page_max_uses: Optional[int] = 100  # Recycle a pooled page after N leases
+    # Playwright resource types to abort, e.g. ["image", "font", "media", "stylesheet"]
+    block_resource_types: List[str] = field(default_factory=list)
+    # Glob patterns (fnmatch) of URLs to abort, e.g. ["*doubleclick.net*", "*.mp4"]
+    blocked_url_patterns: List[str] = field(default_factory=list)
+    use_browser_server: bool = False  # Connect to a shared, long-lived browser server
+    browser_server_endpoint: Optional[str] = None  # Explicit ws:// endpoint to connect to
+    browser_server_state_path: Optional[str] = None  # Server state file (default: per-user dir)
+    http_cache_dir: Optional[str] = None  # On-disk HTTP cache for navigations (None = off)
+    http_cache_max_bytes: int = 512 * 1024 * 1024  # LRU-evict cached bodies beyond this size
+    http_cache_errors: bool = False  # Also cache 404/410 responses
+    har_path: Optional[str] = None  # HAR archive (.har or .zip) to record to or replay from
+    har_mode: str = "record"  # "record" network traffic to har_path, or "replay" it offline
 
 
 @dataclass
@@ -87,7 +131,13 @@ class EthicalCrawlingConfig:
 
     respect_robots_txt: bool = True
     user_agent_for_robots: str = "ScrapeFlow"
-    max_pages_per_domain: Optional[int] = None
+    # Apply robots.txt Crawl-delay/Request-rate per host. Needs RateLimitConfig.per_host=True;
+    # with the default global bucket the engine only logs a warning.
+    honor_crawl_delay: bool = True
+    max_crawl_delay: float = 60.0  # Cap on an honored delay, in seconds
+    max_pages_per_domain: Optional[int] = None  # Per host, per crawl_many() call
+    max_concurrency_per_domain: Optional[int] = None  # crawl_many() requests in flight per host
+    min_delay_per_domain: float = 0.0  # crawl_many() seconds between request starts per host
     honor_noindex: bool = True
     data_retention_days: Optional[int] = None  # GDPR: document retention
     anonymize_ip: bool = False  # GDPR: minimize personal data
@@ -101,6 +151,7 @@ class ScrapeFlowConfig:
     browser: BrowserConfig = field(default_factory=BrowserConfig)
     retry: RetryConfig = field(default_factory=RetryConfig)
     rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    concurrency_limit: ConcurrencyLimitConfig = field(default_factory=ConcurrencyLimitConfig)
     anti_detection: AntiDetectionConfig = field(default_factory=AntiDetectionConfig)
     ethical_crawling: EthicalCrawlingConfig = field(
         default_factory=EthicalCrawlingConfig
@@ -108,4 +159,5 @@ class ScrapeFlowConfig:
     log_level: str = "INFO"
     log_file: Optional[str] = None
     debug: bool = False
+    checkpoint_path: str = "scrapeflow_checkpoints.db"  # SQLite store for crawl_many(job_id=...)
 
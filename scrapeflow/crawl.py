@@ -0,0 +1,19 @@
+"""Result types for concurrent multi-URL crawls."""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of crawling a single URL with ScrapeFlow.crawl_many()."""
+
+    url: str
+    data: Any = None
+    error: Optional[Exception] = None
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """True when navigation and extraction both completed without error."""
+        return self.error is None
@@ -1,19 +1,35 @@
 """Main ScrapeFlow engine that orchestrates all components."""
 
+from __future__ import annotations
+
 import asyncio
-from typing import Optional, Dict, Any, Callable
-from playwright.async_api import Page
+import inspect
+import itertools
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterable, AsyncIterator, Set
 
 from scrapeflow.config import ScrapeFlowConfig
 from scrapeflow.anti_detection import AntiDetectionManager
-from scrapeflow.rate_limiter import RateLimiter
-from scrapeflow.retry import RetryHandler, ErrorClassifier
+from scrapeflow.rate_limiter import (
+    AdaptiveRateLimiter,
+    CostPolicy,
+    KeyedRateLimiter,
+    RateLimiter,
+)
+from scrapeflow.retry import RetryHandler, ErrorClassifier, parse_retry_after
 from scrapeflow.monitoring import Logger, PerformanceMonitor
 from scrapeflow.workflow import Workflow, Step, WorkflowResult
 from scrapeflow.workflow_executor import WorkflowExecutor
+from scrapeflow.crawl import CrawlResult
+from scrapeflow.checkpoint import CrawlCheckpoint
+from scrapeflow.concurrency import AdaptiveConcurrencyLimiter
+from scrapeflow.frontier import URLFrontier
+from scrapeflow.scheduler import HostScheduler, host_of
+from scrapeflow.sinks import Sink
+from scrapeflow.readiness import ReadyExtractor
+from scrapeflow.render_mode import RenderModeRouter
 from scrapeflow.robots import RobotsChecker
 from scrapeflow.registry import LoginHandler
-from scrapeflow.browser_runtime import PlaywrightBrowserRuntime
 from scrapeflow.ports import (
     RateLimiterPort,
     RetryHandlerPort,
@@ -25,9 +41,30 @@ from scrapeflow.ports import (
 from scrapeflow.exceptions import (
     ScrapeFlowError,
     ScrapeFlowTimeoutError,
+    ScrapeFlowBlockedError,
+    ScrapeFlowHTTPError,
     ScrapeFlowRobotsDisallowedError,
 )
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+def _content_length(response: Any) -> Optional[int]:
+    """Transferred size of a response from its Content-Length header, if known."""
+    headers = getattr(response, "headers", None) or {}
+    length = next((v for k, v in headers.items() if k.lower() == "content-length"), None)
+    return int(length) if length and str(length).isdigit() else None
+
+
+def _accepts(func: Callable, name: str) -> bool:
+    """Whether `func` takes the keyword argument `name` (older ports do not)."""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in params or any(p.kind is p.VAR_KEYWORD for p in params.values())
+
 
 class ScrapeFlow:
     """Main ScrapeFlow engine for web scraping workflows."""
@@ -43,27 +80,74 @@ class ScrapeFlow:
         robots_checker: Optional[RobotsCheckerPort] = None,
         runtime: Optional[BrowserRuntimePort] = None,
         workflow_executor: Optional[WorkflowExecutor] = None,
+        render_router: Optional[RenderModeRouter] = None,
+        frontier: Optional[URLFrontier] = None,
+        sink: Optional[Sink] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        cost_policy: Optional[CostPolicy] = None,
     ):
         self.config = config or ScrapeFlowConfig()
         self.page: Optional[Page] = None
 
         # Initialize components
         self.anti_detection = AntiDetectionManager(self.config.anti_detection)
-        self.rate_limiter = rate_limiter or RateLimiter(self.config.rate_limit)
+        self.rate_limiter = rate_limiter or self._default_rate_limiter()
         self.retry_handler = retry_handler or RetryHandler(self.config.retry)
         self.logger = logger or Logger(
             name="scrapeflow", level=self.config.log_level, log_file=self.config.log_file
         )
         self.monitor = monitor or PerformanceMonitor()
+        # Per-host in-flight limits learned from navigation RTT (None = unlimited).
+        if concurrency_limiter is None and self.config.concurrency_limit.enabled:
+            concurrency_limiter = AdaptiveConcurrencyLimiter(
+                self.config.concurrency_limit, monitor=self.monitor
+            )
+        self.concurrency_limiter = concurrency_limiter
+        # Weighs each request's rate-limit tokens by kind and past size (None = 1 per request).
+        self.cost_policy = cost_policy
         self.robots_checker = robots_checker or RobotsChecker(
             user_agent=self.config.ethical_crawling.user_agent_for_robots,
             respect_robots=self.config.ethical_crawling.respect_robots_txt,
         )
-        self.runtime = runtime or PlaywrightBrowserRuntime(self.config, self.anti_detection)
+        if runtime is None:
+            # Imported lazily so engines on other runtimes never load Playwright.
+            from scrapeflow.browser_runtime import PlaywrightBrowserRuntime
+
+            runtime = PlaywrightBrowserRuntime(
+                self.config, self.anti_detection, monitor=self.monitor
+            )
+        self.runtime = runtime
         self.workflow_executor = workflow_executor or WorkflowExecutor()
+        self.render_router = render_router
+        # Shared URL dedup for paginate() and workflows (context["frontier"]).
+        self.frontier = frontier
+        # Streaming output for paginate() and workflows (context["sink"]); owned by the caller.
+        self.sink = sink
+        # Crawl-delays need a per-host limiter; warn once when there is none.
+        self._crawl_delay_warned = False
+        # Hosts with their own rate_limit.rps.<host> gauge (bounded by max_host_gauges).
+        self._rate_gauge_hosts: Set[str] = set()
+        self._rate_means_published = float("-inf")
 
         self._is_running = False
 
+    def _default_rate_limiter(self) -> RateLimiterPort:
+        """Limiter described by config.rate_limit (shared, per-host and/or adaptive)."""
+        config = self.config.rate_limit
+        if config.shared_path:
+            if config.adaptive:
+                raise ValueError(
+                    "RateLimitConfig.adaptive is not supported with shared_path: "
+                    "shared buckets have a fixed rate"
+                )
+            from scrapeflow.shared_rate_limiter import SharedRateLimiter
+
+            return SharedRateLimiter(config)
+        bucket = AdaptiveRateLimiter if config.adaptive else RateLimiter
+        if config.per_host:
+            return KeyedRateLimiter(config, limiter_factory=lambda key: bucket(config))
+        return bucket(config)
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
@@ -80,6 +164,8 @@ class ScrapeFlow:
 
         self.logger.info("Starting ScrapeFlow engine...")
         await self.runtime.start()
+        if self.render_router:
+            await self.render_router.start()
         self.page = self.runtime.page
 
         self._is_running = True
@@ -92,43 +178,448 @@ class ScrapeFlow:
 
         self.logger.info("Closing ScrapeFlow engine...")
         await self.runtime.close()
+        if self.render_router:
+            await self.render_router.close()
+        if self.sink is not None:
+            await self.sink.flush()
         self.page = None
 
         self._is_running = False
         self.logger.info("ScrapeFlow engine closed")
 
     async def navigate(self, url: str, wait_until: str = "load", timeout: Optional[int] = None):
-        """Navigate to a URL with rate limiting, robots.txt check, and retry logic."""
+        """
+        Navigate to a URL with rate limiting, robots.txt check, and retry logic.
+
+        Returns the navigation response. HTTP errors raise ScrapeFlowHTTPError
+        (or ScrapeFlowBlockedError for 429/503); only transient ones are retried.
+        """
         if not self._is_running:
             await self.start()
 
-        # Check robots.txt before navigating
+        await self._ensure_allowed(url)
+        return await self._navigate_with_policies(url, wait_until, timeout)
+
+    async def _ensure_allowed(self, url: str) -> None:
+        """
+        Raise ScrapeFlowRobotsDisallowedError if robots.txt disallows the URL.
+
+        Otherwise apply the site's Crawl-delay / Request-rate to its host bucket
+        (EthicalCrawlingConfig.honor_crawl_delay).
+        """
         if not await self.robots_checker.can_fetch(url):
             self.logger.warning(f"robots.txt disallows: {url}")
             raise ScrapeFlowRobotsDisallowedError(f"robots.txt disallows fetching: {url}")
+        if self.config.ethical_crawling.honor_crawl_delay:
+            await self._apply_crawl_delay(url)
+
+    async def _apply_crawl_delay(self, url: str) -> None:
+        """Slow the URL's host to the pace its robots.txt asks for, if any."""
+        get_crawl_delay = getattr(self.robots_checker, "get_crawl_delay", None)
+        if get_crawl_delay is None:
+            return
+        delay = await get_crawl_delay(url)
+        if delay is not None and delay <= 0:
+            delay = None
+        elif delay is not None:
+            delay = min(delay, self.config.ethical_crawling.max_crawl_delay)
+        host = host_of(url)
+        set_min_interval = getattr(self.rate_limiter, "set_min_interval", None)
+        # Applied even without a delay, so a removed Crawl-delay stops slowing the host.
+        # Applied delays are listed by the limiter's min_intervals().
+        if set_min_interval is not None and set_min_interval(host, delay):
+            return
+        if delay is not None and not self._crawl_delay_warned:
+            self._crawl_delay_warned = True
+            self.logger.warning(
+                f"robots.txt asks for {delay:g}s between requests to {host}, but the rate "
+                "limiter is not per host; set RateLimitConfig.per_host=True to honor it"
+            )
+
+    def _raise_for_status(self, url: str, response: Any) -> None:
+        """
+        Turn an HTTP error response into a classified exception.
+
+        429/503 raise ScrapeFlowBlockedError carrying the server's Retry-After;
+        other 4xx/5xx raise ScrapeFlowHTTPError, which ErrorClassifier treats
+        as retryable only for 408/5xx. A None response (e.g. same-document
+        navigation) is accepted.
+        """
+        status = getattr(response, "status", None) if response is not None else None
+        if status is None:
+            return
+        self._increment(f"http_status.{status}")
+        if status < 400:
+            return
+        headers = dict(getattr(response, "headers", None) or {})
+        if status in (429, 503):
+            retry_after = parse_retry_after(
+                next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+            )
+            raise ScrapeFlowBlockedError(
+                f"HTTP {status} for {url}",
+                retry_after=retry_after,
+                status_code=status,
+                headers=headers,
+            )
+        raise ScrapeFlowHTTPError(f"HTTP {status} for {url}", status, url=url, headers=headers)
+
+    def _observe_rate(self, host: str, **outcome: Any) -> None:
+        """
+        Feed a navigation outcome to an adaptive limiter and publish its rate.
+
+        A single bucket's rate is the gauge rate_limit.rps. Per-host rates go to
+        rate_limit.rps.<host> for the first RateLimitConfig.max_host_gauges
+        hosts, and to rate_limit.hosts / rate_limit.mean_rps over all hosts
+        (refreshed at most once a second), so metrics stay bounded.
+        """
+        observe = getattr(self.rate_limiter, "observe", None)
+        if observe is None:
+            return
+        rate = observe(host, **outcome)
+        set_gauge = getattr(self.monitor, "set_gauge", None)
+        if rate is None or set_gauge is None:
+            return
+        rates = getattr(self.rate_limiter, "rates", None)
+        if rates is None:
+            set_gauge("rate_limit.rps", rate)
+            return
+        gauged = self._rate_gauge_hosts
+        if host in gauged or len(gauged) < self.config.rate_limit.max_host_gauges:
+            gauged.add(host)
+            set_gauge(f"rate_limit.rps.{host}", rate)
+        now = time.monotonic()
+        if now - self._rate_means_published >= 1.0:
+            self._rate_means_published = now
+            per_host = rates()
+            set_gauge("rate_limit.hosts", len(per_host))
+            set_gauge("rate_limit.mean_rps", sum(per_host.values()) / max(1, len(per_host)))
+
+    async def _acquire_rate(self, host: str, kind: str) -> None:
+        """Take a rate-limit token for `host`, weighted by the cost policy if any."""
+        acquire = self.rate_limiter.acquire
+        if not _accepts(acquire, "key"):
+            await acquire()  # limiter written against the original acquire() port
+        elif self.cost_policy is None:
+            await acquire(key=host)
+        else:
+            await acquire(key=host, cost=self.cost_policy.cost(host, kind))
+
+    def _increment(self, name: str) -> None:
+        """Bump a monitor counter; monitors without increment() are skipped."""
+        increment = getattr(self.monitor, "increment", None)
+        if increment is not None:
+            increment(name)
+
+    async def _navigate_with_policies(
+        self,
+        url: str,
+        wait_until: str,
+        timeout: Optional[int],
+        page: Optional[Page] = None,
+        runtime: Optional[BrowserRuntimePort] = None,
+    ) -> Any:
+        """
+        Rate-limited, retried, monitored navigation.
+
+        Navigates the engine's main page when `page` is None, otherwise the
+        leased page passed in by crawl_many(). `runtime` overrides the engine
+        runtime (used by the render-mode router for the static fast path).
+
+        The response status is checked on every attempt: transient failures
+        (timeouts, network errors, 408/429/5xx) are retried, honouring
+        Retry-After; permanent ones (404, 410, robots denials, ...) fail fast.
 
+        Returns:
+            The navigation response from the runtime (may be None).
+        """
+        runtime = runtime or self.runtime
         start_time = self.monitor.start_request()
 
         async def _navigate():
-            await self.rate_limiter.acquire()
+            host = host_of(url)
+            kind = getattr(runtime, "request_kind", "navigation")
             timeout_ms = timeout or self.config.browser.timeout
-            await self.runtime.goto(url, wait_until=wait_until, timeout=timeout_ms)
-            self.page = self.runtime.page
 
-        try:
-            await self.retry_handler.execute_with_retry(
-                _navigate,
-                retryable_exceptions=(
-                    Exception,
-                ),  # Most navigation errors are retryable
+            started: Optional[float] = None  # set once the request is actually sent
+
+            async def _goto(slot=None):
+                nonlocal started
+                # Inside the concurrency slot, so requests queued on a full host don't
+                # spend rate budget while they wait and then start back to back.
+                await self._acquire_rate(host, kind)
+                started = time.monotonic()  # after the concurrency and rate waits
+                if slot is not None:
+                    slot.start_timer()
+                if page is None:
+                    response = await runtime.goto(url, wait_until=wait_until, timeout=timeout_ms)
+                    self.page = runtime.page
+                    return response
+                return await runtime.goto(url, wait_until=wait_until, timeout=timeout_ms, page=page)
+
+            try:
+                if self.concurrency_limiter is None:
+                    response = await _goto()
+                else:
+                    async with self.concurrency_limiter.slot(host) as slot:
+                        response = await _goto(slot)
+                        if getattr(response, "status", None) in (429, 503):
+                            slot.drop()
+            except Exception as e:
+                if started is not None:  # failures while waiting say nothing about the host
+                    self._observe_rate(host, latency=time.monotonic() - started, error=e)
+                raise
+            self._observe_rate(
+                host, status=getattr(response, "status", None), latency=time.monotonic() - started
             )
+            if self.cost_policy is not None:
+                nbytes = _content_length(response)
+                if nbytes is not None:
+                    self.cost_policy.record(host, kind, nbytes)
+            self._raise_for_status(url, response)
+            return response
+
+        try:
+            execute = self.retry_handler.execute_with_retry
+            if _accepts(execute, "should_retry"):
+                response = await execute(
+                    _navigate,
+                    retryable_exceptions=(Exception,),
+                    should_retry=ErrorClassifier.is_retryable,
+                )
+            else:
+                response = await execute(_navigate, retryable_exceptions=(Exception,))
             self.monitor.end_request(start_time, success=True)
             self.logger.info(f"Successfully navigated to {url}")
+            return response
         except Exception as e:
             self.monitor.end_request(start_time, success=False, error=e)
             self.logger.error(f"Failed to navigate to {url}: {str(e)}")
             raise
 
+    async def extract(
+        self,
+        url: str,
+        extractor: Any,
+        wait_until: str = "load",
+        timeout: Optional[int] = None,
+    ) -> Any:
+        """
+        Fetch `url` on a leased page and run `extractor.extract(page)` on it.
+
+        With a `render_router`, each domain is probed once (HTTP vs. browser)
+        and later requests use the cheapest runtime that still validates.
+        """
+        if not self._is_running:
+            await self.start()
+        await self._ensure_allowed(url)
+        if self.render_router:
+            return await self.render_router.extract(self, url, extractor, wait_until, timeout)
+        async with self.runtime.acquire_page() as page:
+            await self._navigate_with_policies(url, wait_until, timeout, page=page)
+            return await extractor.extract(page)
+
+    async def navigate_and_extract(
+        self,
+        url: str,
+        extractor: Any,
+        timeout: Optional[int] = None,
+        readiness_timeout: Optional[int] = None,
+    ) -> Any:
+        """
+        Extract as soon as the page holds what the extractor needs.
+
+        Navigates to `domcontentloaded` instead of `load`, then waits
+        concurrently for the extractor's required selectors (see
+        SpecificationExtractor.required_selectors) for at most
+        `readiness_timeout` ms before extracting. Extractors without
+        required selectors are run straight after DOMContentLoaded.
+
+        Args:
+            url: URL to fetch.
+            extractor: SpecificationExtractor, HybridExtractor or any object with extract(page).
+            timeout: Navigation timeout in milliseconds (defaults to browser timeout).
+            readiness_timeout: Cap on the selector wait in milliseconds
+                               (defaults to the navigation timeout).
+        """
+        cap = readiness_timeout or timeout or self.config.browser.timeout
+        ready_extractor = ReadyExtractor(extractor, cap, monitor=self.monitor)
+        return await self.extract(
+            url, ready_extractor, wait_until="domcontentloaded", timeout=timeout
+        )
+
+    async def crawl_many(
+        self,
+        urls: Iterable[str],
+        extract_func: Callable,
+        concurrency: int = 4,
+        wait_until: str = "load",
+        timeout: Optional[int] = None,
+        lookahead: int = 1000,
+        job_id: Optional[str] = None,
+    ) -> AsyncIterator[CrawlResult]:
+        """
+        Crawl many URLs concurrently, yielding results as they complete.
+
+        Each URL gets its own page leased from the runtime, and still goes
+        through robots.txt, rate limiting, retry and monitoring. At most
+        `concurrency` URLs are in flight overall. URLs are queued per host and
+        served round-robin, honouring EthicalCrawlingConfig's
+        max_concurrency_per_domain, min_delay_per_domain and
+        max_pages_per_domain, so a slow host never blocks the others. `urls`
+        is consumed lazily, buffering at most `lookahead` queued URLs.
+
+        Args:
+            urls: URLs to crawl.
+            extract_func: Function(page, context) -> extracted data (sync or async).
+            concurrency: Maximum number of pages navigating at once.
+            wait_until: Playwright load state to wait for on each page.
+            timeout: Navigation timeout in milliseconds (defaults to browser timeout).
+            lookahead: URLs read ahead of dispatch to find work for idle hosts.
+            job_id: Checkpoint the crawl under this id in `config.checkpoint_path`:
+                    URL status and results are persisted in batches, URLs the
+                    job already finished are skipped, and resume(job_id)
+                    continues after a crash.
+
+        Yields:
+            CrawlResult per URL, in completion order. Failures are yielded with
+            `error` set rather than raised, so one bad URL does not stop the crawl.
+            URLs beyond a host's page budget are yielded with a ScrapeFlowError.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not self._is_running:
+            await self.start()
+
+        ethics = self.config.ethical_crawling
+        scheduler = HostScheduler(
+            max_concurrency_per_host=ethics.max_concurrency_per_domain,
+            min_interval_per_host=ethics.min_delay_per_domain,
+            max_pages_per_host=ethics.max_pages_per_domain,
+        )
+        checkpoint = None
+        if job_id is not None:
+            checkpoint = CrawlCheckpoint(self.config.checkpoint_path, job_id)
+        loop = asyncio.get_running_loop()
+        claiming: Optional[asyncio.Future] = None
+        url_iter = iter(urls)
+        exhausted = False
+        pending: Dict[asyncio.Future, str] = {}
+
+        def _record(result: CrawlResult) -> CrawlResult:
+            if checkpoint is not None:
+                if result.success:
+                    checkpoint.mark_done(result.url, result.data)
+                else:
+                    checkpoint.mark_failed(result.url, result.error)
+            return result
+
+        try:
+            while True:
+                skipped = []
+                wanted = max(lookahead, concurrency) - len(scheduler)
+                if not exhausted and wanted > 0:
+                    batch = list(itertools.islice(url_iter, wanted))
+                    exhausted = len(batch) < wanted
+                    if checkpoint is not None and batch:
+                        # One lookup per batch, off the event loop.
+                        claiming = loop.run_in_executor(None, checkpoint.claim_many, batch)
+                        batch = await claiming
+                    skipped = [url for url in batch if not scheduler.push(url)]
+                for url in skipped:
+                    self._increment("skipped.max_pages_per_domain")
+                    yield _record(
+                        CrawlResult(
+                            url=url,
+                            error=ScrapeFlowError(f"max_pages_per_domain reached for {url}"),
+                        )
+                    )
+
+                while len(pending) < concurrency:
+                    url = scheduler.next_ready()
+                    if url is None:
+                        break
+                    task = asyncio.ensure_future(
+                        self._crawl_one(url, extract_func, wait_until, timeout)
+                    )
+                    pending[task] = url
+
+                if not pending:
+                    if exhausted and not len(scheduler):
+                        if checkpoint is not None:
+                            checkpoint.mark_finished()
+                        return
+                    await asyncio.sleep(scheduler.next_wakeup() or 0)
+                    continue
+
+                # Wake early if a host leaves its delay while a slot is free.
+                wakeup = scheduler.next_wakeup() if len(pending) < concurrency else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=wakeup, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    scheduler.done(pending.pop(task))
+                    yield _record(task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if checkpoint is not None:
+                if claiming is not None and not claiming.done():
+                    await asyncio.wait([claiming])  # never close the db under a running claim
+                checkpoint.close()
+
+    async def resume(
+        self,
+        job_id: str,
+        extract_func: Callable,
+        urls: Iterable[str] = (),
+        **crawl_kwargs: Any,
+    ) -> AsyncIterator[CrawlResult]:
+        """
+        Continue a checkpointed crawl_many(job_id=...) after a crash or restart.
+
+        Crawls the job's unfinished URLs (queued or in flight when it stopped)
+        and those that failed transiently, then any `urls` the job has not
+        seen yet. Completed results are
+        available via CrawlCheckpoint(config.checkpoint_path, job_id).results().
+
+        Args:
+            job_id: Job to resume.
+            extract_func: Function(page, context) -> extracted data (sync or async).
+            urls: Optional URL source to continue with, e.g. the original input;
+                  URLs the job already finished are skipped.
+            **crawl_kwargs: Passed to crawl_many (concurrency, wait_until, ...).
+        """
+        reader = CrawlCheckpoint(self.config.checkpoint_path, job_id)
+        try:
+            remaining = itertools.chain(reader.pending_urls(), urls)
+            async for result in self.crawl_many(
+                remaining, extract_func, job_id=job_id, **crawl_kwargs
+            ):
+                yield result
+        finally:
+            reader.close()
+
+    async def _crawl_one(
+        self,
+        url: str,
+        extract_func: Callable,
+        wait_until: str,
+        timeout: Optional[int],
+    ) -> CrawlResult:
+        """Navigate a leased page to `url` and run `extract_func` on it."""
+        started = time.monotonic()
+        try:
+            await self._ensure_allowed(url)
+            async with self.runtime.acquire_page() as page:
+                await self._navigate_with_policies(url, wait_until, timeout, page=page)
+                data = await self._execute_function(extract_func, page, {"url": url})
+            return CrawlResult(url=url, data=data, duration=time.monotonic() - started)
+        except Exception as e:
+            return CrawlResult(url=url, error=e, duration=time.monotonic() - started)
+
     async def click(self, selector: str, timeout: Optional[int] = None):
         """Click an element with retry logic."""
         if not self._is_running:
@@ -25,9 +25,27 @@ class ScrapeFlowTimeoutError(ScrapeFlowError):
 class ScrapeFlowBlockedError(ScrapeFlowError):
     """Raised when the scraper is blocked or rate-limited."""
 
-    def __init__(self, message: str, retry_after: int = None):
+    def __init__(
+        self,
+        message: str,
+        retry_after: float = None,
+        status_code: int = None,
+        headers: dict = None,
+    ):
         super().__init__(message)
         self.retry_after = retry_after
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class ScrapeFlowHTTPError(ScrapeFlowError):
+    """Raised when navigation returns an HTTP error status."""
+
+    def __init__(self, message: str, status_code: int, url: str = None, headers: dict = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers or {}
 
 
 class ScrapeFlowValidationError(ScrapeFlowError):
@@ -1,10 +1,14 @@
 """Data extraction utilities and helpers."""
 
-from typing import Any, Dict, List, Optional, Union
-from playwright.async_api import Page, Locator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Locator
 
 # Page and Locator both have .locator() - support both for nested extraction
-PageOrLocator = Union[Page, Locator]
+PageOrLocator = Union["Page", "Locator"]
 
 
 class Extractor:
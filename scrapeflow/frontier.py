@@ -0,0 +1,220 @@
+"""
+URL frontier: canonicalization, memory-compact dedup and priority scheduling.
+
+URLs are canonicalized before dedup so trivially different spellings of the
+same page (host case, default ports, tracking parameters, fragments) are
+visited once. Seen URLs go into a Bloom filter, a few bytes per URL, sized
+for tens of millions of entries. It is backed by an exact LRU set of recent
+URLs for the fast common case.
+"""
+
+import hashlib
+import heapq
+import itertools
+import math
+from collections import OrderedDict
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters that only track campaigns/clicks and never change page content.
+TRACKING_PARAMS: FrozenSet[str] = frozenset(
+    {
+        "gclid",
+        "dclid",
+        "fbclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "mkt_tok",
+        "spm",
+    }
+)
+TRACKING_PREFIXES: Tuple[str, ...] = ("utm_", "pk_", "piwik_")
+
+
+def canonicalize_url(
+    url: str,
+    strip_params: Optional[Iterable[str]] = None,
+    sort_query: bool = True,
+) -> str:
+    """
+    Canonical form of a URL for deduplication.
+
+    Lower-cases scheme and host, drops default ports and the fragment,
+    defaults an empty path to "/", removes tracking parameters (utm_*,
+    gclid, fbclid, ... plus `strip_params`) and sorts the remaining query.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:  # IPv6 literal
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{host}"
+    if port is not None and DEFAULT_PORTS.get(scheme) != port:
+        netloc += f":{port}"
+
+    extra = frozenset(p.lower() for p in strip_params or ())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and key.lower() not in extra
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    if sort_query:
+        query.sort()
+    path = parts.path or "/"
+    return urlunsplit((scheme, netloc, path, urlencode(query, doseq=True), ""))
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Expected number of distinct items.
+            error_rate: Target false-positive rate at `capacity` items.
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be > 0 and 0 < error_rate < 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> List[int]:
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest.
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """Add an item; return True if it was (definitely) not present before."""
+        added = False
+        for p in self._positions(item):
+            mask = 1 << (p & 7)
+            if not self._bits[p >> 3] & mask:
+                self._bits[p >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+
+class URLFrontier:
+    """
+    Priority queue of URLs to visit, deduplicated on canonical form.
+
+    Higher `priority` is popped first; ties pop in insertion order. A URL is
+    considered seen from the moment it is added (or visited) and is never
+    queued twice. Dedup uses the canonical form; the URL is fetched as given.
+    Bloom false positives can skip a tiny fraction of unseen URLs (at most
+    `error_rate` at `capacity`); they never cause revisits.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10_000_000,
+        error_rate: float = 0.001,
+        recent_size: int = 100_000,
+        strip_params: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            capacity: Expected distinct URLs (10M at 0.1% uses ~18 MB).
+            error_rate: Bloom filter false-positive rate at `capacity`.
+            recent_size: Size of the exact LRU set of recently seen URLs.
+            strip_params: Extra query parameters to drop during canonicalization.
+        """
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.recent_size = recent_size
+        self.strip_params = tuple(strip_params or ())
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self.duplicates = 0
+
+    def canonicalize(self, url: str) -> str:
+        return canonicalize_url(url, self.strip_params)
+
+    def _seen(self, canonical: str) -> bool:
+        if canonical in self._recent:
+            self._recent.move_to_end(canonical)
+            return True
+        return canonical in self.bloom
+
+    def _mark(self, canonical: str) -> None:
+        self.bloom.add(canonical)
+        self._recent[canonical] = None
+        if len(self._recent) > self.recent_size:
+            self._recent.popitem(last=False)
+
+    def seen(self, url: str) -> bool:
+        """True if the URL (in canonical form) was already added or visited."""
+        return self._seen(self.canonicalize(url))
+
+    def visit(self, url: str) -> bool:
+        """Mark a URL as seen without queuing it; False if it was already seen."""
+        canonical = self.canonicalize(url)
+        if self._seen(canonical):
+            self.duplicates += 1
+            return False
+        self._mark(canonical)
+        return True
+
+    def add(self, url: str, priority: float = 0.0) -> bool:
+        """Queue a URL unless already seen; return True if it was queued."""
+        canonical = self.canonicalize(url)
+        if self._seen(canonical):
+            self.duplicates += 1
+            return False
+        self._mark(canonical)
+        heapq.heappush(self._heap, (-priority, next(self._counter), url))
+        return True
+
+    def add_many(self, urls: Iterable[str], priority: float = 0.0) -> int:
+        """Queue several URLs; return how many were new."""
+        return sum(self.add(url, priority) for url in urls)
+
+    def pop(self) -> Optional[str]:
+        """Highest-priority queued URL (as it was added), or None if empty."""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self):
+        """Drain the frontier in priority order (URLs added while iterating are included)."""
+        while self._heap:
+            yield self.pop()
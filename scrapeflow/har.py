@@ -0,0 +1,151 @@
+"""
+HAR replay for offline, deterministic runs.
+
+Record a crawl with the browser runtime (BrowserConfig(har_path=..., har_mode="record")),
+then replay it either in the browser (har_mode="replay", Playwright's
+route_from_har) or without any browser or network using HarReplayRuntime,
+which serves archived documents into StaticPage. The latter lets extraction
+benchmarks and regression tests run on CI boxes with no network access.
+"""
+
+import base64
+import json
+import zipfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urldefrag, urljoin
+
+from scrapeflow.exceptions import ScrapeFlowError
+from scrapeflow.http_runtime import StaticPage, StaticResponse
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class HarArchive:
+    """Read-only index of a HAR file (.har JSON, or .zip with attached bodies)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip: Optional[zipfile.ZipFile] = None
+        if path.endswith(".zip"):
+            self._zip = zipfile.ZipFile(path)
+            with self._zip.open("har.har") as f:
+                har = json.load(f)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                har = json.load(f)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        for entry in har["log"]["entries"]:
+            request = entry["request"]
+            if request.get("method", "GET").upper() != "GET":
+                continue
+            # First recorded response wins, so replays are deterministic.
+            self._entries.setdefault(urldefrag(request["url"])[0], entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def urls(self) -> List[str]:
+        return list(self._entries)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(urldefrag(url)[0])
+
+    def body(self, entry: Dict[str, Any]) -> bytes:
+        content = entry["response"].get("content", {})
+        if "_file" in content:
+            if self._zip is None:
+                raise ScrapeFlowError(
+                    f"HAR entry references {content['_file']} but {self.path} is not a zip"
+                )
+            return self._zip.read(content["_file"])
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+
+def _headers(entry: Dict[str, Any]) -> Dict[str, str]:
+    return {h["name"].lower(): h["value"] for h in entry["response"].get("headers", [])}
+
+
+class HarReplayRuntime:
+    """
+    BrowserRuntimePort serving responses from a HAR archive; no browser, no network.
+
+    Pages are StaticPage instances, so SpecificationExtractor and
+    HybridExtractor (selector path) run unchanged. Only documents recorded in
+    the archive can be visited; anything else raises ScrapeFlowError.
+    """
+
+    def __init__(self, har_path: str, max_redirects: int = 10):
+        """
+        Args:
+            har_path: HAR file recorded with BrowserConfig(har_mode="record").
+            max_redirects: Recorded redirects followed per navigation.
+        """
+        self.har_path = har_path
+        self.max_redirects = max_redirects
+        self.archive: Optional[HarArchive] = None
+        self._page: Optional[StaticPage] = None
+        self._is_running = False
+
+    @property
+    def page(self) -> Optional[StaticPage]:
+        return self._page
+
+    async def start(self) -> None:
+        if self._is_running:
+            return
+        self.archive = HarArchive(self.har_path)
+        self._page = StaticPage()
+        self._is_running = True
+
+    async def close(self) -> None:
+        if not self._is_running:
+            return
+        self.archive.close()
+        self.archive = None
+        self._page = None
+        self._is_running = False
+
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[StaticPage]:
+        if not self._is_running:
+            raise RuntimeError("HAR replay runtime is not started.")
+        yield StaticPage()
+
+    async def goto(
+        self,
+        url: str,
+        wait_until: str = "load",
+        timeout: Optional[int] = None,
+        page: Optional[StaticPage] = None,
+    ) -> StaticResponse:
+        """Load the archived response for `url` (following recorded redirects) into the page."""
+        target = page or self._page
+        if not self._is_running or target is None:
+            raise RuntimeError("HAR replay runtime is not started.")
+
+        current = url
+        for _ in range(self.max_redirects + 1):
+            entry = self.archive.get(current)
+            if entry is None:
+                raise ScrapeFlowError(f"{current} is not in HAR archive {self.har_path}")
+            status = entry["response"]["status"]
+            headers = _headers(entry)
+            location = entry["response"].get("redirectURL") or headers.get("location")
+            if status in _REDIRECT_STATUSES and location:
+                current = urljoin(current, location)
+                continue
+            html = self.archive.body(entry).decode("utf-8", errors="replace")
+            target.set_content(html, current)
+            target.status = status
+            target.headers = headers
+            return StaticResponse(url=current, status=status, headers=headers)
+        raise ScrapeFlowError(f"Too many recorded redirects for {url}")
@@ -0,0 +1,315 @@
+"""
+On-disk HTTP cache for browser navigations.
+
+Used by PlaywrightBrowserRuntime through context route interception: fresh
+responses are served from disk without touching the network, stale ones are
+revalidated with If-None-Match / If-Modified-Since, and the cache directory is
+kept under a byte budget with least-recently-used eviction.
+
+Each entry is a `<key>.json` metadata file plus a `<key>.body` file, both
+written to a temporary file and renamed into place, so a crash never leaves a
+truncated body to be served. The metadata file's mtime records last use, so
+LRU order survives restarts. Set-Cookie is never stored: one response's
+session cookie must not be replayed to later requests.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Mapping, Optional
+
+# Hop-by-hop and encoding headers that no longer describe the stored (decoded) body.
+_DROP_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive")
+)
+# Per-response state that must not be replayed from the cache.
+_PRIVATE_HEADERS = frozenset(("set-cookie", "set-cookie2"))
+CACHEABLE_STATUSES = frozenset((200, 203, 300, 301, 308))
+ERROR_STATUSES = frozenset((404, 410))  # cached only with cache_errors=True
+
+
+def storable_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Lower-cased headers minus those that no longer describe a decoded body."""
+    return {k.lower(): v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+
+
+def _cacheable_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {k: v for k, v in storable_headers(headers).items() if k not in _PRIVATE_HEADERS}
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into {directive: argument-or-None}."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    if value is None or not re.fullmatch(r"\d+", value):
+        return None
+    return float(value)
+
+
+def freshness_lifetime(headers: Mapping[str, str], now: float) -> float:
+    """
+    Seconds a response stays fresh (RFC 9111 4.2.1): max-age, then Expires,
+    then the 10%-of-age heuristic for responses carrying Last-Modified.
+    """
+    cc = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in cc:
+        return 0.0
+    max_age = _seconds(cc.get("max-age"))
+    if max_age is not None:
+        return max_age
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        date = _http_date(headers.get("date")) or now
+        return max(0.0, expires - date)
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        date = _http_date(headers.get("date")) or now
+        return min(max(0.0, (date - last_modified) / 10), 86400.0)
+    return 0.0
+
+
+@dataclass
+class CacheEntry:
+    """Metadata of a cached response; the body lives in a sibling file."""
+
+    key: str
+    url: str
+    status: int
+    headers: Dict[str, str]
+    vary: List[str] = field(default_factory=list)
+    stored_at: float = 0.0
+    initial_age: float = 0.0
+    lifetime: float = 0.0
+    size: int = 0
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return self.initial_age + (now - self.stored_at) < self.lifetime
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Size-bounded, Vary-aware on-disk HTTP cache. Thread-safe; I/O is synchronous."""
+
+    def __init__(
+        self, directory: str, max_bytes: int = 512 * 1024 * 1024, cache_errors: bool = False
+    ):
+        """
+        Args:
+            directory: Cache directory (created if missing).
+            max_bytes: Total body bytes kept on disk before LRU eviction.
+            cache_errors: Also cache 404/410 responses (dead links are refetched otherwise).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.cache_errors = cache_errors
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[str, int]" = OrderedDict()  # key -> body size
+        self._vary: Dict[str, List[str]] = {}  # url -> Vary header names
+        self._urls: Dict[str, str] = {}  # key -> url
+        self._variants: Dict[str, int] = {}  # url -> stored keys, to drop _vary with the last
+        self.total_bytes = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _load_index(self) -> None:
+        metas = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".tmp"):  # left by a crash mid-write
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                metas.append((os.path.getmtime(path), meta))
+            except (OSError, ValueError):
+                continue
+        for _, meta in sorted(metas, key=lambda item: item[0]):
+            self._add(meta["key"], meta["url"], meta.get("vary", []), meta["size"])
+
+    @staticmethod
+    def _key(url: str, vary: List[str], request_headers: Mapping[str, str]) -> str:
+        parts = [url] + [f"{name}:{request_headers.get(name, '')}" for name in vary]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, request_headers: Mapping[str, str]) -> Optional[CacheEntry]:
+        """Return the stored entry matching the URL and the request's Vary headers."""
+        request_headers = {k.lower(): v for k, v in request_headers.items()}
+        with self._lock:
+            vary = self._vary.get(url)
+            if vary is None:
+                return None
+            key = self._key(url, vary, request_headers)
+            if key not in self._lru:
+                return None
+            try:
+                with open(self._path(key, "json"), "r", encoding="utf-8") as f:
+                    entry = CacheEntry(**json.load(f))
+            except (OSError, ValueError, TypeError):
+                self._forget(key)
+                return None
+            self._touch(key)
+            return entry
+
+    def read_body(self, entry: CacheEntry) -> Optional[bytes]:
+        try:
+            with open(self._path(entry.key, "body"), "rb") as f:
+                return f.read()
+        except OSError:
+            with self._lock:
+                self._forget(entry.key)
+            return None
+
+    def store(
+        self,
+        url: str,
+        request_headers: Mapping[str, str],
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> Optional[CacheEntry]:
+        """Store a response if its status and Cache-Control allow it; return the entry."""
+        headers = _cacheable_headers(headers)
+        request_headers = {k.lower(): v for k, v in request_headers.items()}
+        cc = parse_cache_control(headers.get("cache-control"))
+        vary = sorted(
+            {v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()}
+        )
+        cacheable = status in CACHEABLE_STATUSES or (self.cache_errors and status in ERROR_STATUSES)
+        if not cacheable or "no-store" in cc or "*" in vary:
+            return None
+        if len(body) > self.max_bytes:
+            return None
+
+        now = time.time()
+        entry = CacheEntry(
+            key=self._key(url, vary, request_headers),
+            url=url,
+            status=status,
+            headers=headers,
+            vary=vary,
+            stored_at=now,
+            initial_age=_seconds(headers.get("age")) or 0.0,
+            lifetime=freshness_lifetime(headers, now),
+            size=len(body),
+        )
+        if entry.lifetime <= 0 and not (entry.etag or entry.last_modified):
+            return None  # could never be served or revalidated
+
+        with self._lock:
+            tmp_path = self._path(entry.key, "body.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, self._path(entry.key, "body"))
+            self._write_meta(entry)
+            self._add(entry.key, url, vary, entry.size)
+            self._evict()
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Update a revalidated entry (304 Not Modified) with the new headers."""
+        entry.headers.update(_cacheable_headers(headers))
+        now = time.time()
+        entry.stored_at = now
+        entry.initial_age = _seconds(entry.headers.get("age")) or 0.0
+        entry.lifetime = freshness_lifetime(entry.headers, now)
+        with self._lock:
+            if entry.key in self._lru:
+                self._write_meta(entry)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._lru):
+                self._forget(key)
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        tmp_path = self._path(entry.key, "json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(entry), f)
+        os.replace(tmp_path, self._path(entry.key, "json"))
+
+    def _touch(self, key: str) -> None:
+        self._lru.move_to_end(key)
+        try:
+            os.utime(self._path(key, "json"))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        while self.total_bytes > self.max_bytes and self._lru:
+            oldest = next(iter(self._lru))
+            self._forget(oldest)
+            self.evictions += 1
+
+    def _add(self, key: str, url: str, vary: List[str], size: int) -> None:
+        if key not in self._lru:
+            self._variants[url] = self._variants.get(url, 0) + 1
+        self.total_bytes += size - self._lru.pop(key, 0)
+        self._lru[key] = size
+        self._urls[key] = url
+        self._vary[url] = vary
+
+    def _forget(self, key: str) -> None:
+        if key in self._lru:
+            url = self._urls.pop(key)
+            self._variants[url] -= 1
+            if not self._variants[url]:
+                del self._variants[url]
+                del self._vary[url]
+        self.total_bytes -= self._lru.pop(key, 0)
+        for suffix in ("json", "body"):
+            try:
+                os.remove(self._path(key, suffix))
+            except OSError:
+                pass
@@ -0,0 +1,299 @@
+"""
+HTTP-only fast-path runtime for server-rendered sites.
+
+Implements BrowserRuntimePort with pooled aiohttp connections instead of a
+Chromium page. The exposed page is a StaticPage: a minimal, read-only subset
+of Playwright's Page/Locator API backed by a fast HTML parser (selectolax),
+so SpecificationExtractor, FieldSpec and ItemSpec run unchanged.
+
+Requires selectolax: pip install selectolax (or scrapeflow-py[http]).
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from scrapeflow.config import ScrapeFlowConfig
+from scrapeflow.anti_detection import AntiDetectionManager
+from scrapeflow.exceptions import ScrapeFlowTimeoutError
+
+
+def _parse_html(html: str) -> Any:
+    """Lazy-import selectolax and parse HTML."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        raise ImportError(
+            "selectolax is required for HttpRuntime. Install with: pip install selectolax"
+        )
+    return LexborHTMLParser(html)
+
+
+@dataclass
+class StaticResponse:
+    """Result of an HttpRuntime fetch; mirrors the parts of Playwright's Response we use."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+
+
+def _accept_encoding() -> str:
+    """Advertise brotli only when aiohttp can decode it."""
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+class StaticLocator:
+    """Read-only, Playwright-compatible locator over parsed HTML nodes."""
+
+    def __init__(self, resolve):
+        self._resolve = resolve
+
+    def _nodes(self) -> List[Any]:
+        return self._resolve()
+
+    def locator(self, selector: str) -> "StaticLocator":
+        def resolve() -> List[Any]:
+            seen = set()
+            matches = []
+            for parent in self._nodes():
+                for node in parent.css(selector):
+                    # Playwright scopes nested locators to descendants only.
+                    if node.mem_id == parent.mem_id or node.mem_id in seen:
+                        continue
+                    seen.add(node.mem_id)
+                    matches.append(node)
+            return matches
+
+        return StaticLocator(resolve)
+
+    def nth(self, index: int) -> "StaticLocator":
+        def resolve() -> List[Any]:
+            nodes = self._nodes()
+            try:
+                return [nodes[index]]
+            except IndexError:
+                return []
+
+        return StaticLocator(resolve)
+
+    @property
+    def first(self) -> "StaticLocator":
+        return self.nth(0)
+
+    @property
+    def last(self) -> "StaticLocator":
+        return self.nth(-1)
+
+    async def count(self) -> int:
+        return len(self._nodes())
+
+    async def all(self) -> List["StaticLocator"]:
+        return [self.nth(i) for i in range(len(self._nodes()))]
+
+    def _single(self) -> Any:
+        nodes = self._nodes()
+        if not nodes:
+            raise ValueError("Locator resolved to no elements")
+        return nodes[0]
+
+    async def text_content(self) -> Optional[str]:
+        return self._single().text(deep=True)
+
+    async def inner_text(self) -> str:
+        return self._single().text(deep=True, separator="")
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return self._single().attributes.get(name)
+
+    async def inner_html(self) -> str:
+        return self._single().inner_html or ""
+
+
+class StaticPage:
+    """
+    Page-like view of a fetched HTML document.
+
+    Supports the read-only surface used by extractors: locator(), url,
+    content(), title() and wait_for_selector(). Interactive methods (click,
+    fill) are not available; use PlaywrightBrowserRuntime for those sites.
+    """
+
+    def __init__(self, html: str = "", url: str = "about:blank"):
+        self.status: Optional[int] = None
+        self.headers: Dict[str, str] = {}
+        self.set_content(html, url)
+
+    def set_content(self, html: str, url: Optional[str] = None) -> None:
+        """Replace the document (and optionally the URL) of this page."""
+        self._html = html
+        self._tree = None
+        if url is not None:
+            self.url = url
+
+    def _tree_root(self) -> Any:
+        if self._tree is None:
+            self._tree = _parse_html(self._html or "<html></html>")
+        return self._tree.root
+
+    def locator(self, selector: str) -> StaticLocator:
+        return StaticLocator(lambda: [self._tree_root()]).locator(selector)
+
+    async def content(self) -> str:
+        return self._html
+
+    async def title(self) -> str:
+        node = self._tree_root().css_first("title")
+        return node.text(deep=True).strip() if node else ""
+
+    async def wait_for_selector(
+        self, selector: str, timeout: Optional[float] = None, state: str = "visible"
+    ) -> Optional[StaticLocator]:
+        """Static documents never change: succeed if present, fail immediately if not."""
+        locator = self.locator(selector)
+        present = await locator.count() > 0
+        if state in ("detached", "hidden"):
+            if present:
+                raise ScrapeFlowTimeoutError(f"Selector still present: {selector}")
+            return None
+        if not present:
+            raise ScrapeFlowTimeoutError(f"Selector not found in static document: {selector}")
+        return locator.first
+
+    def is_closed(self) -> bool:
+        return False
+
+
+class HttpRuntime:
+    """
+    Infrastructure adapter fetching pages over plain HTTP with aiohttp.
+
+    Connections are pooled and kept alive across requests; responses are
+    transparently decompressed (gzip/deflate, plus br when brotli is installed).
+    """
+
+    # Rate-limit kind for CostPolicy: a bare document fetch, no subresources.
+    request_kind = "static"
+
+    def __init__(
+        self,
+        config: Optional[ScrapeFlowConfig] = None,
+        anti_detection: Optional[AntiDetectionManager] = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 8,
+        keepalive_timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            config: ScrapeFlowConfig (timeout, proxy, user agents).
+            anti_detection: Source of rotated user agents and proxies.
+            connection_limit: Total pooled connections.
+            connection_limit_per_host: Pooled connections per host.
+            keepalive_timeout: Seconds an idle connection is kept open.
+            headers: Extra default request headers.
+        """
+        self.config = config or ScrapeFlowConfig()
+        self.anti_detection = anti_detection or AntiDetectionManager(self.config.anti_detection)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.extra_headers = headers or {}
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._page: Optional[StaticPage] = None
+        self._is_running = False
+
+    @property
+    def page(self) -> Optional[StaticPage]:
+        return self._page
+
+    async def start(self) -> None:
+        if self._is_running:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        headers = {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": _accept_encoding(),
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        user_agent = self.anti_detection.get_user_agent()
+        if user_agent:
+            headers["User-Agent"] = user_agent
+        headers.update(self.extra_headers)
+        self.session = aiohttp.ClientSession(connector=connector, headers=headers)
+        self._page = StaticPage()
+        self._is_running = True
+
+    async def close(self) -> None:
+        if not self._is_running:
+            return
+        if self.session:
+            await self.session.close()
+            self.session = None
+        self._page = None
+        self._is_running = False
+
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[StaticPage]:
+        """Pages are plain objects here, so each lease gets a fresh one."""
+        if not self._is_running:
+            raise RuntimeError("HTTP runtime is not started.")
+        yield StaticPage()
+
+    def _proxy_kwargs(self) -> Dict[str, Any]:
+        proxy = self.config.browser.proxy or self.anti_detection.get_proxy()
+        if not proxy or not proxy.get("server"):
+            return {}
+        kwargs: Dict[str, Any] = {"proxy": proxy["server"]}
+        if proxy.get("username"):
+            kwargs["proxy_auth"] = aiohttp.BasicAuth(proxy["username"], proxy.get("password", ""))
+        return kwargs
+
+    async def goto(
+        self,
+        url: str,
+        wait_until: str = "load",
+        timeout: Optional[int] = None,
+        page: Optional[StaticPage] = None,
+    ) -> StaticResponse:
+        """
+        Fetch `url` and load the HTML into `page` (or the main page). `wait_until` is ignored.
+
+        Timeouts raise ScrapeFlowTimeoutError and transport failures raise
+        ConnectionError, so the engine's retry classification treats them
+        like their browser counterparts.
+        """
+        target = page or self._page
+        if not self.session or target is None:
+            raise RuntimeError("HTTP runtime is not started.")
+        timeout_ms = timeout or self.config.browser.timeout
+        try:
+            async with self.session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=timeout_ms / 1000),
+                **self._proxy_kwargs(),
+            ) as resp:
+                html = await resp.text(errors="replace")
+                target.set_content(html, str(resp.url))
+                target.status = resp.status
+                target.headers = {k.lower(): v for k, v in resp.headers.items()}
+        except asyncio.TimeoutError as e:
+            raise ScrapeFlowTimeoutError(f"Timed out after {timeout_ms}ms fetching {url}") from e
+        except aiohttp.ClientError as e:
+            raise ConnectionError(f"Failed to fetch {url}: {e}") from e
+        return StaticResponse(url=target.url, status=target.status, headers=target.headers)
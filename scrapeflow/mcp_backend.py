@@ -8,10 +8,13 @@ Spiders can rely on field descriptions rather than fragile XPaths when
 using semantic extraction backends.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from playwright.async_api import Page
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 from scrapeflow.extractors import Extractor
 
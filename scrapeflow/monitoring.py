@@ -19,6 +19,8 @@ class ScrapeMetrics:
     total_duration: float = 0.0
     average_response_time: float = 0.0
     errors_by_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    counters: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    gauges: Dict[str, float] = field(default_factory=dict)
     start_time: Optional[float] = None
     end_time: Optional[float] = None
 
@@ -42,6 +44,33 @@ class ScrapeMetrics:
         """Record a retry."""
         self.retry_count += 1
 
+    def increment(self, name: str, value: float = 1):
+        """Increment a named counter (e.g. blocked_requests, cache_hits)."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float):
+        """Set a named gauge to its current value (e.g. rate_limit.mean_rps)."""
+        self.gauges[name] = value
+
+    def merge(self, other: "ScrapeMetrics") -> "ScrapeMetrics":
+        """Fold another metrics object (e.g. from a worker process) into this one."""
+        self.total_requests += other.total_requests
+        self.successful_requests += other.successful_requests
+        self.failed_requests += other.failed_requests
+        self.retry_count += other.retry_count
+        self.total_duration += other.total_duration
+        for error_type, count in other.errors_by_type.items():
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + count
+        for name, value in other.counters.items():
+            self.increment(name, value)
+        self.gauges.update(other.gauges)
+        starts = [t for t in (self.start_time, other.start_time) if t is not None]
+        ends = [t for t in (self.end_time, other.end_time) if t is not None]
+        self.start_time = min(starts) if starts else None
+        self.end_time = max(ends) if ends else None
+        self._update_average()
+        return self
+
     def _update_average(self):
         """Update average response time."""
         if self.total_requests > 0:
@@ -64,6 +93,8 @@ class ScrapeMetrics:
             "average_response_time": self.average_response_time,
             "success_rate": self.get_success_rate(),
             "errors_by_type": dict(self.errors_by_type),
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
         }
 
 
@@ -195,6 +226,14 @@ class PerformanceMonitor:
         """Record a retry."""
         self.metrics.record_retry()
 
+    def increment(self, name: str, value: float = 1):
+        """Increment a named counter."""
+        self.metrics.increment(name, value)
+
+    def set_gauge(self, name: str, value: float):
+        """Set a named gauge."""
+        self.metrics.set_gauge(name, value)
+
     def get_metrics(self) -> ScrapeMetrics:
         """Get current metrics."""
         self.metrics.end_time = time.time()
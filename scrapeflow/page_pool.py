@@ -0,0 +1,179 @@
+"""
+Page pool for concurrent crawling on a shared browser context.
+
+Creating a page costs tens of milliseconds plus the stealth init scripts, so
+pages are pre-warmed, leased, reset on release, and recycled after a fixed
+number of uses to bound per-page memory growth.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class _PooledPage:
+    """Bookkeeping for a page owned by the pool."""
+
+    page: Any
+    uses: int = 0
+    listeners: List[Tuple[str, Callable[..., Any]]] = field(default_factory=list)
+
+
+class PagePool:
+    """
+    Bounded pool of reusable pages.
+
+    At most `max_size` pages are leased at once; further acquire() calls wait
+    for a release. `min_size` pages are created by start() so work never pays
+    page-creation latency up front.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        min_size: int = 0,
+        max_size: int = 8,
+        max_uses: Optional[int] = 100,
+    ):
+        """
+        Args:
+            factory: Async callable creating a ready-to-use page.
+            min_size: Pages to pre-warm and keep available.
+            max_size: Maximum number of pages leased concurrently.
+            max_uses: Recycle a page after this many leases (None = never).
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self._idle: List[_PooledPage] = []
+        self._leased: Dict[int, _PooledPage] = {}
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._closed = False
+        self.created = 0
+        self.recycled = 0
+
+    @property
+    def size(self) -> int:
+        """Total pages currently owned by the pool (idle + leased)."""
+        return len(self._idle) + len(self._leased)
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def leased_count(self) -> int:
+        return len(self._leased)
+
+    async def _create(self) -> _PooledPage:
+        page = await self.factory()
+        self.created += 1
+        return _PooledPage(page=page)
+
+    async def start(self) -> None:
+        """Pre-warm `min_size` pages concurrently."""
+        missing = self.min_size - self.size
+        if missing > 0:
+            entries = await asyncio.gather(*(self._create() for _ in range(missing)))
+            self._idle.extend(entries)
+
+    async def acquire(self) -> Any:
+        """Lease a page, waiting if `max_size` pages are already leased."""
+        if self._closed:
+            raise RuntimeError("Page pool is closed.")
+        await self._semaphore.acquire()
+        try:
+            entry = self._idle.pop() if self._idle else await self._create()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        entry.uses += 1
+        self._leased[id(entry.page)] = entry
+        return entry.page
+
+    async def release(self, page: Any, discard: bool = False) -> None:
+        """
+        Return a leased page to the pool.
+
+        The page is reset (routes and add_listener() handlers cleared,
+        navigated to about:blank) before reuse. Pages that fail to reset, have reached
+        `max_uses`, or are explicitly discarded are closed instead.
+        """
+        entry = self._leased.pop(id(page), None)
+        if entry is None:
+            return
+        try:
+            worn_out = self.max_uses is not None and entry.uses >= self.max_uses
+            if not (discard or worn_out or self._closed):
+                discard = not await self._reset(entry)
+            else:
+                discard = True
+
+            if discard:
+                if worn_out:
+                    self.recycled += 1
+                await self._close_page(entry.page)
+                if not self._closed and self.size < self.min_size:
+                    self._idle.append(await self._create())
+            else:
+                self._idle.append(entry)
+        finally:
+            self._semaphore.release()
+
+    def add_listener(self, page: Any, event: str, handler: Callable[..., Any]) -> None:
+        """
+        Register an event handler on a leased page for the rest of the lease.
+
+        The handler is removed through page.remove_listener() when the page is
+        released. Handlers attached with page.on() directly are not tracked;
+        release such pages with discard=True so they are not reused.
+        """
+        entry = self._leased.get(id(page))
+        if entry is None:
+            raise ValueError("Page is not leased from this pool.")
+        page.on(event, handler)
+        entry.listeners.append((event, handler))
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """Async context manager wrapping acquire()/release()."""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def _reset(self, entry: _PooledPage) -> bool:
+        """Reset page state between leases; return False if the page is unusable."""
+        page = entry.page
+        try:
+            if page.is_closed():
+                return False
+            listeners, entry.listeners = entry.listeners, []
+            for event, handler in listeners:
+                page.remove_listener(event, handler)
+            await page.unroute_all(behavior="ignoreErrors")
+            await page.goto("about:blank")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _close_page(page: Any) -> None:
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        """Close all idle pages; leased pages are closed when released."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._close_page(entry.page) for entry in idle))
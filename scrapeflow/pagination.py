@@ -7,7 +7,9 @@ Control max_pages, max_results, and max_wait_time for multi-page crawls.
 import time
 from typing import Any, AsyncIterator, Callable, Optional
 
+from scrapeflow.frontier import URLFrontier
 from scrapeflow.registry import PaginationHandler
+from scrapeflow.sinks import Sink
 
 
 async def paginate(
@@ -16,6 +18,8 @@ async def paginate(
     handler: PaginationHandler,
     extract_func: Callable,
     config: Optional[Any] = None,
+    frontier: Optional[URLFrontier] = None,
+    sink: Optional[Sink] = None,
 ) -> AsyncIterator[Any]:
     """
     Paginate through pages, yielding extracted data per page.
@@ -26,6 +30,11 @@ async def paginate(
         handler: PaginationHandler with next_selector, has_next
         extract_func: Async function(page, context) -> extracted data
         config: Optional PaginationConfig (max_pages, max_results, max_wait_time)
+        frontier: Optional URLFrontier (defaults to engine.frontier); pages whose
+                  canonical URL was already visited end pagination, so "next"
+                  links that loop back are not refetched
+        sink: Optional Sink (defaults to engine.sink); each page's data is
+              written to it before being yielded, one item per list element
 
     Yields:
         Extracted data from each page
@@ -35,6 +44,10 @@ async def paginate(
     max_results = getattr(config, "max_results", None)
     max_wait_time = getattr(config, "max_wait_time", None)
 
+    frontier = frontier if frontier is not None else getattr(engine, "frontier", None)
+    if frontier is not None:
+        frontier.visit(base_url)  # the start page is always fetched, e.g. after frontier.pop()
+    sink = sink if sink is not None else getattr(engine, "sink", None)
     url = base_url
     page_count = 0
     total_results = 0
@@ -48,6 +61,8 @@ async def paginate(
 
         await engine.navigate(url)
         data = await extract_func(engine.page, {"url": url})
+        if sink is not None and data is not None:
+            await sink.put_many(data if isinstance(data, list) else [data])
         yield data
 
         if isinstance(data, list):
@@ -79,3 +94,5 @@ async def paginate(
 
         from urllib.parse import urljoin
         url = urljoin(url, href)
+        if frontier is not None and not frontier.visit(url):
+            break
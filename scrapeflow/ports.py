@@ -1,15 +1,31 @@
 """Architecture ports (protocols) for dependency inversion."""
 
-from typing import Any, Awaitable, Callable, Optional, Protocol
-from playwright.async_api import Page
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Optional,
+    Protocol,
+)
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 class RateLimiterPort(Protocol):
+    # Limiters whose acquire() also takes `key` and `cost` keywords are given the
+    # request's host and cost; plain acquire() limiters are called without them.
     async def acquire(self) -> None:
         ...
 
 
 class RetryHandlerPort(Protocol):
+    # Handlers whose execute_with_retry() also takes `should_retry` are given the
+    # engine's error classifier, so permanent failures (404, ...) fail fast.
     async def execute_with_retry(
         self,
         func: Callable[[], Awaitable[Any]],
@@ -67,5 +83,10 @@ class BrowserRuntimePort(Protocol):
     async def close(self) -> None:
         ...
 
-    async def goto(self, url: str, wait_until: str, timeout: int) -> None:
+    def acquire_page(self) -> AsyncContextManager[Page]:
+        ...
+
+    async def goto(
+        self, url: str, wait_until: str, timeout: int, page: Optional[Page] = None
+    ) -> Optional[Any]:
         ...
@@ -0,0 +1,292 @@
+"""
+Multi-process sharded crawl executor.
+
+A single event loop driving Playwright saturates one core on protocol and
+validation work. ShardedCrawlExecutor splits a URL list (or a workflow
+fan-out) across worker processes, each owning its own ScrapeFlow engine and
+browser runtime, and streams results and metrics back to the parent.
+
+Everything sent to workers (extract functions, engine/workflow factories,
+config) must be picklable, i.e. defined at module level.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import queue as queue_module
+import zlib
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from scrapeflow.config import ScrapeFlowConfig
+from scrapeflow.crawl import CrawlResult
+from scrapeflow.exceptions import ScrapeFlowError
+from scrapeflow.monitoring import ScrapeMetrics
+from scrapeflow.workflow import WorkflowResult
+
+_RESULT = "result"
+_METRICS = "metrics"
+_FAILED = "failed"
+_DONE = "done"
+
+
+def shard_urls(urls: Iterable[str], num_shards: int, by: str = "host") -> List[List[str]]:
+    """
+    Split URLs into `num_shards` lists.
+
+    Args:
+        urls: URLs to shard.
+        num_shards: Number of shards.
+        by: "host" keeps every URL of a host in the same shard, so per-process
+            rate limiting stays polite per host; "round_robin" spreads URLs
+            evenly regardless of host.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be at least 1")
+    if by not in ("host", "round_robin"):
+        raise ValueError(f"Unknown sharding strategy: {by}")
+    shards: List[List[str]] = [[] for _ in range(num_shards)]
+    for i, url in enumerate(urls):
+        if by == "host":
+            host = (urlparse(url).hostname or "").encode("utf-8")
+            index = zlib.crc32(host) % num_shards
+        else:
+            index = i % num_shards
+        shards[index].append(url)
+    return shards
+
+
+def _default_engine_factory(config: ScrapeFlowConfig) -> Any:
+    from scrapeflow.engine import ScrapeFlow
+
+    return ScrapeFlow(config)
+
+
+def _portable(result: CrawlResult) -> bytes:
+    """Pickle a result, degrading unpicklable data/errors to a ScrapeFlowError."""
+    try:
+        return pickle.dumps(result)
+    except Exception as e:
+        error = result.error
+        message = f"{type(error).__name__}: {error}" if error else f"Unpicklable result: {e}"
+        return pickle.dumps(
+            CrawlResult(url=result.url, error=ScrapeFlowError(message), duration=result.duration)
+        )
+
+
+def _sanitize_workflow_result(result: WorkflowResult) -> WorkflowResult:
+    """Drop context entries (engine, pages, ...) that cannot cross a process boundary."""
+    context = {}
+    for key, value in result.context.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        context[key] = value
+    return WorkflowResult(
+        success=result.success,
+        steps_completed=result.steps_completed,
+        steps_failed=result.steps_failed,
+        final_data=result.final_data,
+        context=context,
+        error=result.error,
+    )
+
+
+async def _run_worker(
+    kind: str, items: List[Any], payload: Dict[str, Any], out: Any, worker_id: int
+) -> None:
+    engine = payload["engine_factory"](payload["config"])
+    async with engine:
+        if kind == "crawl":
+            async for result in engine.crawl_many(
+                items,
+                payload["extract_func"],
+                concurrency=payload["concurrency"],
+                wait_until=payload["wait_until"],
+                timeout=payload["timeout"],
+            ):
+                out.put((_RESULT, worker_id, _portable(result)))
+        else:
+            loop = asyncio.get_running_loop()
+            for item in items:
+                started = loop.time()
+                try:
+                    workflow = payload["workflow_factory"](item)
+                    workflow_result = _sanitize_workflow_result(await engine.run_workflow(workflow))
+                    result = CrawlResult(
+                        url=str(item),
+                        data=workflow_result,
+                        error=workflow_result.error,
+                        duration=loop.time() - started,
+                    )
+                except Exception as e:
+                    result = CrawlResult(url=str(item), error=e, duration=loop.time() - started)
+                out.put((_RESULT, worker_id, _portable(result)))
+        metrics = engine.get_metrics()
+        if isinstance(metrics, ScrapeMetrics):
+            out.put((_METRICS, worker_id, pickle.dumps(metrics)))
+
+
+def _worker_main(worker_id: int, kind: str, items: List[Any], payload: Dict[str, Any], out: Any):
+    """Process entrypoint: run one shard on a fresh event loop."""
+    try:
+        asyncio.run(_run_worker(kind, items, payload, out, worker_id))
+    except BaseException as e:
+        out.put((_FAILED, worker_id, pickle.dumps(f"{type(e).__name__}: {e}")))
+        raise
+    finally:
+        out.put((_DONE, worker_id, b""))
+
+
+class ShardedCrawlExecutor:
+    """
+    Run crawls across N worker processes, one ScrapeFlow engine per worker.
+
+    Results are yielded in completion order as they stream back; per-worker
+    ScrapeMetrics are merged into `metrics` once each worker finishes.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        config: Optional[ScrapeFlowConfig] = None,
+        engine_factory: Optional[Callable[[ScrapeFlowConfig], Any]] = None,
+        concurrency: int = 4,
+        shard_by: str = "host",
+        start_method: str = "spawn",
+        poll_interval: float = 0.5,
+    ):
+        """
+        Args:
+            num_workers: Worker processes (default: CPU count).
+            config: ScrapeFlowConfig passed to every worker engine.
+            engine_factory: Module-level callable(config) -> ScrapeFlow, for
+                            custom runtimes/components in workers.
+            concurrency: crawl_many() concurrency inside each worker.
+            shard_by: "host" or "round_robin" (see shard_urls).
+            start_method: multiprocessing start method.
+            poll_interval: Seconds between liveness checks of workers.
+        """
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.config = config or ScrapeFlowConfig()
+        self.engine_factory = engine_factory or _default_engine_factory
+        self.concurrency = concurrency
+        self.shard_by = shard_by
+        self.start_method = start_method
+        self.poll_interval = poll_interval
+        self.metrics = ScrapeMetrics()
+
+    async def crawl(
+        self,
+        urls: Iterable[str],
+        extract_func: Callable,
+        wait_until: str = "load",
+        timeout: Optional[int] = None,
+    ) -> AsyncIterator[CrawlResult]:
+        """Shard `urls` across workers and yield CrawlResults as they complete."""
+        shards = shard_urls(urls, self.num_workers, by=self.shard_by)
+        payload = {
+            "engine_factory": self.engine_factory,
+            "config": self.config,
+            "extract_func": extract_func,
+            "concurrency": self.concurrency,
+            "wait_until": wait_until,
+            "timeout": timeout,
+        }
+        async for result in self._stream("crawl", shards, payload):
+            yield result
+
+    async def run_workflows(
+        self, workflow_factory: Callable[[Any], Any], inputs: Iterable[Any]
+    ) -> AsyncIterator[CrawlResult]:
+        """
+        Fan a workflow out over `inputs`, one Workflow per input.
+
+        `workflow_factory(input)` builds the Workflow inside the worker. Each
+        yielded CrawlResult has `url=str(input)` and `data` set to the
+        WorkflowResult (context stripped of unpicklable values).
+        """
+        items = list(inputs)
+        shards: List[List[Any]] = [items[i :: self.num_workers] for i in range(self.num_workers)]
+        payload = {
+            "engine_factory": self.engine_factory,
+            "config": self.config,
+            "workflow_factory": workflow_factory,
+        }
+        async for result in self._stream("workflow", shards, payload):
+            yield result
+
+    async def _stream(
+        self, kind: str, shards: List[List[Any]], payload: Dict[str, Any]
+    ) -> AsyncIterator[CrawlResult]:
+        self.metrics = ScrapeMetrics()
+        ctx = multiprocessing.get_context(self.start_method)
+        out = ctx.Queue()
+        workers: Dict[int, Tuple[Any, Dict[str, int]]] = {}
+        for worker_id, items in enumerate(shards):
+            if not items:
+                continue
+            process = ctx.Process(
+                target=_worker_main, args=(worker_id, kind, items, payload, out), daemon=True
+            )
+            process.start()
+            outstanding: Dict[str, int] = {}
+            for item in items:
+                outstanding[str(item)] = outstanding.get(str(item), 0) + 1
+            workers[worker_id] = (process, outstanding)
+
+        loop = asyncio.get_running_loop()
+        running = set(workers)
+        failures: Dict[int, str] = {}
+        try:
+            while running:
+                try:
+                    tag, worker_id, body = await loop.run_in_executor(
+                        None, out.get, True, self.poll_interval
+                    )
+                except queue_module.Empty:
+                    for worker_id in list(running):
+                        process, outstanding = workers[worker_id]
+                        if not process.is_alive() and out.empty():
+                            running.discard(worker_id)
+                            reason = failures.get(worker_id, f"exit code {process.exitcode}")
+                            for result in self._lost(worker_id, reason, outstanding):
+                                yield result
+                    continue
+
+                if tag == _RESULT:
+                    result = pickle.loads(body)
+                    outstanding = workers[worker_id][1]
+                    if outstanding.get(result.url, 0) > 1:
+                        outstanding[result.url] -= 1
+                    else:
+                        outstanding.pop(result.url, None)
+                    yield result
+                elif tag == _METRICS:
+                    self.metrics.merge(pickle.loads(body))
+                elif tag == _FAILED:
+                    failures[worker_id] = pickle.loads(body)
+                elif tag == _DONE:
+                    running.discard(worker_id)
+                    outstanding = workers[worker_id][1]
+                    reason = failures.get(worker_id, "worker finished")
+                    for result in self._lost(worker_id, reason, outstanding):
+                        yield result
+        finally:
+            for process, _ in workers.values():
+                process.join(timeout=self.poll_interval)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+    @staticmethod
+    def _lost(worker_id: int, reason: str, outstanding: Dict[str, int]) -> List[CrawlResult]:
+        """Error results for items a worker never reported (crash or engine failure)."""
+        lost = []
+        for item, count in outstanding.items():
+            error = ScrapeFlowError(f"Worker {worker_id} did not finish {item}: {reason}")
+            lost.extend(CrawlResult(url=item, error=error) for _ in range(count))
+        outstanding.clear()
+        return lost
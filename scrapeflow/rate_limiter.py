@@ -2,21 +2,32 @@
 
 import asyncio
 import time
-from typing import Optional
-from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+from collections import OrderedDict, deque
 from scrapeflow.config import RateLimitConfig
+from scrapeflow.exceptions import ScrapeFlowTimeoutError
 
 
 class RateLimiter:
-    """Token bucket rate limiter for controlling request rate."""
+    """
+    Rate limiter using GCRA (generic cell rate algorithm): a token bucket by virtual scheduling.
 
-    def __init__(self, config: RateLimitConfig):
+    Each acquire() reserves the next free slot on a monotonic clock,
+    synchronously, and then sleeps until that slot without holding any lock.
+    Thousands of concurrent waiters are therefore scheduled in one step each
+    and wake exactly on their own slots, with no drift between grants.
+    `burst_size` requests may go back to back after an idle period.
+
+    Requests may weigh more or less than one token (`cost`), so the budget
+    can track server load rather than request count: a cost-0.25 API call
+    uses a quarter of the interval a full page load does.
+    """
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = time.monotonic):
         self.config = config
-        self.tokens = config.burst_size
-        self.last_update = time.time()
-        self._lock = asyncio.Lock()
+        self.clock = clock
 
-        # Calculate token refill rate
+        # Emission interval: seconds between requests at the sustained rate
         if config.requests_per_second:
             self.refill_rate = 1.0 / config.requests_per_second
         elif config.requests_per_minute:
@@ -25,38 +36,108 @@ class RateLimiter:
             self.refill_rate = 1.0  # Default: 1 request per second
 
         self.max_tokens = config.burst_size
+        # Per-request floor in seconds, whatever the cost (robots.txt Crawl-delay).
+        self.min_interval: Optional[float] = None
+        # Theoretical arrival time: when the bucket would next be empty-at-rest.
+        self._tat = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Requests that could start right now without waiting (0..burst_size)."""
+        if self.min_interval:
+            return 1.0 if self._tat <= self.clock() else 0.0
+        tolerance = self.refill_rate * (self.max_tokens - 1)
+        available = (self.clock() + tolerance - self._tat) / self.refill_rate + 1
+        return max(0.0, min(float(self.max_tokens), available))
 
-    async def acquire(self):
-        """Acquire a token, waiting if necessary."""
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_update
+    def limit_interval(self, seconds: Optional[float]) -> None:
+        """
+        Space requests at least `seconds` apart whatever their cost, with no burst
+        (e.g. robots.txt Crawl-delay). Replaces any earlier floor; None or 0 removes it.
+        """
+        self.min_interval = seconds or None
 
-            # Refill tokens based on elapsed time
-            tokens_to_add = elapsed / self.refill_rate
-            self.tokens = min(self.max_tokens, self.tokens + tokens_to_add)
-            self.last_update = now
+    def _charge(self, cost: float) -> float:
+        """Seconds of schedule a request of `cost` tokens takes up."""
+        charge = self.refill_rate * cost
+        return max(charge, self.min_interval) if self.min_interval else charge
 
-            # If no tokens available, wait
-            if self.tokens < 1:
-                wait_time = self.refill_rate - (self.tokens * self.refill_rate)
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-                self.last_update = time.time()
-            else:
-                self.tokens -= 1
+    def reserve(self, cost: float = 1.0) -> float:
+        """
+        Reserve the next slot for `cost` tokens; return seconds to wait for it (0 if it is now).
+
+        A request costing more than burst_size tokens waits even on an idle bucket.
+        """
+        now = self.clock()
+        charge = self._charge(cost)
+        tat = max(self._tat, now)
+        self._tat = tat + charge
+        # Under a floor there is no burst: each request starts at its slot, then holds the floor.
+        window = charge if self.min_interval else self.refill_rate * self.max_tokens
+        return max(0.0, self._tat - window - now)
+
+    async def acquire(self, key: Optional[str] = None, cost: float = 1.0):
+        """Acquire `cost` tokens, waiting if necessary. `key` is ignored (one global bucket)."""
+        charge = self._charge(cost)
+        wait = self.reserve(cost)
+        if wait <= 0:
+            return
+        reserved_tat = self._tat
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Hand the slot back if nobody reserved after us.
+            if self._tat == reserved_tat:
+                self._tat -= charge
+            raise
 
 
 class AdaptiveRateLimiter(RateLimiter):
-    """Rate limiter that adapts based on detected rate limits."""
+    """
+    Rate limiter that adapts to the server with AIMD (additive increase, multiplicative decrease).
+
+    observe() is fed every navigation outcome. 429/503 responses, timeouts and
+    rising latency (the recent average above `latency_factor` times the
+    long-run baseline) divide the rate by `backoff_factor`, at most once per
+    `decrease_cooldown` seconds so one burst of errors counts once. Every
+    `success_threshold` successes add `increase_step` requests per second, up
+    to `max_rate`.
+    """
 
-    def __init__(self, config: RateLimitConfig):
-        super().__init__(config)
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        clock: Callable[[], float] = time.monotonic,
+        increase_step: Optional[float] = None,
+        success_threshold: int = 10,
+        latency_factor: float = 2.0,
+        decrease_cooldown: float = 1.0,
+    ):
+        """
+        Args:
+            config: Starting rate, burst, and the AIMD bounds
+                    (min_requests_per_second, max_requests_per_second).
+            clock: Monotonic time source.
+            increase_step: Requests per second added per increase (default: 10% of the start rate).
+            success_threshold: Consecutive successes before each increase.
+            latency_factor: Recent/baseline latency ratio treated as overload.
+            decrease_cooldown: Minimum seconds between observed-overload decreases.
+        """
+        super().__init__(config, clock)
         self.backoff_factor = 1.5
-        self.min_rate = 0.1  # Minimum 1 request per 10 seconds
-        self.current_rate = config.requests_per_second or (
-            60.0 / config.requests_per_minute if config.requests_per_minute else 1.0
-        )
+        self.min_rate = config.min_requests_per_second  # Default: 1 request per 10 seconds
+        self.current_rate = 1.0 / self.refill_rate
+        self.max_rate = config.max_requests_per_second or self.current_rate
+        self._configured_max_rate = self.max_rate
+        self.increase_step = increase_step or self.current_rate * 0.1
+        self.success_threshold = success_threshold
+        self.latency_factor = latency_factor
+        self.decrease_cooldown = decrease_cooldown
+        self._successes = 0
+        self._latency_samples = 0
+        self._baseline_latency = 0.0  # slow EWMA
+        self._recent_latency = 0.0  # fast EWMA
+        self._last_decrease = float("-inf")
 
     def backoff(self):
         """Increase wait time when rate limited."""
@@ -64,14 +145,259 @@ class AdaptiveRateLimiter(RateLimiter):
             self.min_rate, self.current_rate / self.backoff_factor
         )
         self.refill_rate = 1.0 / self.current_rate
+        self._successes = 0
 
     def speed_up(self):
-        """Gradually increase rate when successful."""
-        original_rate = (
-            self.config.requests_per_second
-            or (60.0 / self.config.requests_per_minute if self.config.requests_per_minute else 1.0)
-        )
-        if self.current_rate < original_rate:
-            self.current_rate = min(original_rate, self.current_rate * 1.1)
+        """Additively increase the rate, up to max_rate."""
+        if self.current_rate < self.max_rate:
+            self.current_rate = min(self.max_rate, self.current_rate + self.increase_step)
             self.refill_rate = 1.0 / self.current_rate
 
+    def limit_interval(self, seconds: Optional[float]) -> None:
+        """Also cap the rate at 1 / `seconds`, so AIMD moves below the floor only."""
+        super().limit_interval(seconds)
+        self.max_rate = self._configured_max_rate
+        if self.min_interval:
+            self.max_rate = min(self.max_rate, 1.0 / self.min_interval)
+        self.min_rate = min(self.config.min_requests_per_second, self.max_rate)
+        self.current_rate = min(self.current_rate, self.max_rate)
+        self.refill_rate = 1.0 / self.current_rate
+
+    def _latency_rising(self, latency: float) -> bool:
+        self._latency_samples += 1
+        if self._latency_samples == 1:
+            self._baseline_latency = self._recent_latency = latency
+            return False
+        self._recent_latency += 0.3 * (latency - self._recent_latency)
+        self._baseline_latency += 0.02 * (latency - self._baseline_latency)
+        return (
+            self._latency_samples >= 5
+            and self._recent_latency > self.latency_factor * self._baseline_latency
+        )
+
+    def observe(
+        self,
+        key: Optional[str] = None,
+        status: Optional[int] = None,
+        latency: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> float:
+        """
+        Feed one request outcome into the AIMD controller.
+
+        Args:
+            key: Ignored (this limiter is one bucket).
+            status: HTTP status, if a response arrived.
+            latency: Seconds until the response (time to first byte, or the
+                     navigation time as its proxy).
+            error: Exception raised by the request, if any.
+
+        Returns:
+            The current rate in requests per second.
+        """
+        overloaded = status in (429, 503) or isinstance(
+            error, (ScrapeFlowTimeoutError, asyncio.TimeoutError)
+        )
+        ok = error is None and (status is None or status < 400)
+        if ok and latency is not None and self._latency_rising(latency):
+            overloaded = True
+        if overloaded:
+            now = self.clock()
+            if now - self._last_decrease >= self.decrease_cooldown:
+                self._last_decrease = now
+                self.backoff()
+        elif ok:
+            self._successes += 1
+            if self._successes >= self.success_threshold:
+                self._successes = 0
+                self.speed_up()
+        return self.current_rate
+
+
+class _Bucket:
+    __slots__ = ("limiter", "active", "last_used")
+
+    def __init__(self, limiter: RateLimiter, now: float):
+        self.limiter = limiter
+        self.active = 0
+        self.last_used = now
+
+
+class KeyedRateLimiter:
+    """
+    One token bucket per key (normally the hostname), plus an optional global cap.
+
+    Buckets are created on first use and kept in LRU order. A bucket idle for
+    `host_idle_ttl` seconds (by then refilled to its burst anyway) is evicted,
+    and so is the least recently used one once `max_hosts` are held. Memory
+    stays bounded on crawls touching millions of hosts. Buckets with waiters
+    are never evicted.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        limiter_factory: Optional[Callable[[str], RateLimiter]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            config: Per-key rate and burst, global cap, max_hosts and host_idle_ttl.
+            limiter_factory: Builds the bucket for a key (default: RateLimiter(config)).
+            clock: Monotonic time source used for idle eviction.
+        """
+        self.config = config
+        self.limiter_factory = limiter_factory or (lambda key: RateLimiter(config))
+        self.clock = clock
+        self.global_limiter: Optional[RateLimiter] = None
+        if config.global_requests_per_second:
+            self.global_limiter = RateLimiter(
+                RateLimitConfig(
+                    requests_per_second=config.global_requests_per_second,
+                    burst_size=config.burst_size,
+                )
+            )
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._buckets
+
+    def limiter_for(self, key: str) -> RateLimiter:
+        """The bucket for `key`, created if needed."""
+        return self._bucket(key).limiter
+
+    def _bucket(self, key: str) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+        now = self.clock()
+        self._evict(now)
+        bucket = self._buckets[key] = _Bucket(self.limiter_factory(key), now)
+        return bucket
+
+    def _evict(self, now: float) -> None:
+        for _ in range(len(self._buckets)):
+            key, bucket = next(iter(self._buckets.items()))
+            full = len(self._buckets) >= self.config.max_hosts
+            if not full and now - bucket.last_used < self.config.host_idle_ttl:
+                return
+            if bucket.active:
+                self._buckets.move_to_end(key)
+                continue
+            del self._buckets[key]
+            self.evictions += 1
+
+    def observe(self, key: Optional[str] = None, **outcome: Any) -> Optional[float]:
+        """
+        Pass a request outcome to `key`'s bucket if it adapts (AdaptiveRateLimiter).
+
+        Returns the bucket's current rate, or None for fixed-rate buckets.
+        """
+        observe = getattr(self.limiter_for(key or ""), "observe", None)
+        return observe(key, **outcome) if observe is not None else None
+
+    def set_min_interval(self, key: str, seconds: Optional[float]) -> bool:
+        """
+        Space `key`'s requests at least `seconds` apart, with no burst.
+
+        Used for robots.txt Crawl-delay; the engine re-applies it before each
+        request, so evicted buckets pick it up again and a lowered or removed
+        delay (None or 0) takes effect. Returns True (applied).
+        """
+        self.limiter_for(key).limit_interval(seconds)
+        return True
+
+    def min_intervals(self) -> Dict[str, float]:
+        """Per-request floors (robots.txt Crawl-delays) of held buckets that have one."""
+        return {
+            key: bucket.limiter.min_interval
+            for key, bucket in self._buckets.items()
+            if bucket.limiter.min_interval
+        }
+
+    def rates(self) -> Dict[str, float]:
+        """Current requests per second of every held bucket."""
+        return {
+            key: 1.0 / max(bucket.limiter.refill_rate, bucket.limiter.min_interval or 0.0)
+            for key, bucket in self._buckets.items()
+        }
+
+    async def acquire(self, key: Optional[str] = None, cost: float = 1.0):
+        """Wait for `cost` tokens from `key`'s bucket, then from the global cap if set."""
+        bucket = self._bucket(key or "")
+        bucket.active += 1
+        try:
+            await bucket.limiter.acquire(cost=cost)
+            # Taken after the host token, so hosts waiting on their own rate hold no global slot.
+            if self.global_limiter is not None:
+                await self.global_limiter.acquire(cost=cost)
+        finally:
+            bucket.active -= 1
+            bucket.last_used = self.clock()
+
+
+class CostPolicy:
+    """
+    Rate-limit cost of a request, in tokens (1.0 = one plain page load).
+
+    The base cost comes from the request kind: "navigation" for a browser
+    page load with its subresources, "static" for a plain HTTP fetch
+    (HttpRuntime), or any kind a caller passes to cost(). With
+    `reference_bytes` set, the cost also scales with the average response
+    size recorded for the host and kind, so hosts serving heavy pages use
+    more of their budget per request. Costs are clamped to [min_cost, max_cost].
+    """
+
+    def __init__(
+        self,
+        kind_costs: Optional[Dict[str, float]] = None,
+        reference_bytes: Optional[int] = None,
+        min_cost: float = 0.1,
+        max_cost: float = 10.0,
+        smoothing: float = 0.2,
+        max_hosts: int = 10_000,
+    ):
+        """
+        Args:
+            kind_costs: Cost per request kind, merged over the defaults
+                        {"navigation": 1.0, "static": 0.25}. Unknown kinds cost 1.0.
+            reference_bytes: Response size that costs the kind's base cost
+                             (None: ignore recorded sizes).
+            min_cost: Lower bound of any cost.
+            max_cost: Upper bound of any cost.
+            smoothing: Weight of the newest size in the running average (EWMA).
+            max_hosts: (host, kind) averages kept; the least recently used go first.
+        """
+        self.kind_costs = {"navigation": 1.0, "static": 0.25, **(kind_costs or {})}
+        self.reference_bytes = reference_bytes
+        self.min_cost = min_cost
+        self.max_cost = max_cost
+        self.smoothing = smoothing
+        self.max_hosts = max_hosts
+        self._average_bytes: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+    def cost(self, key: Optional[str] = None, kind: str = "navigation") -> float:
+        """Tokens one `kind` request to `key` should take."""
+        cost = self.kind_costs.get(kind, 1.0)
+        if self.reference_bytes:
+            average = self._average_bytes.get((key or "", kind))
+            if average is not None:
+                cost *= average / self.reference_bytes
+        return min(self.max_cost, max(self.min_cost, cost))
+
+    def record(self, key: Optional[str], kind: str, nbytes: int) -> None:
+        """Fold one response size into the running average for `key` and `kind`."""
+        entry = (key or "", kind)
+        average = self._average_bytes.get(entry)
+        if average is None:
+            if len(self._average_bytes) >= self.max_hosts:
+                self._average_bytes.popitem(last=False)
+            self._average_bytes[entry] = float(nbytes)
+            return
+        self._average_bytes[entry] = average + self.smoothing * (nbytes - average)
+        self._average_bytes.move_to_end(entry)
@@ -0,0 +1,74 @@
+"""
+Spec-driven page readiness.
+
+Instead of waiting for the `load` event (every ad, tracker and font), pages
+are navigated to `domcontentloaded` and considered ready as soon as the
+selectors an extractor actually needs are attached, bounded by a cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+async def _wait_for_any(page: Page, selectors: Sequence[str], timeout_ms: float) -> bool:
+    """True as soon as one of `selectors` is attached, False if none is within the timeout."""
+    tasks = [
+        asyncio.ensure_future(page.wait_for_selector(s, state="attached", timeout=timeout_ms))
+        for s in selectors
+    ]
+    try:
+        while tasks:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            tasks = list(pending)
+            ready = False
+            # Retrieve every exception before deciding, so none is logged as unretrieved.
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    ready = True
+            if ready:
+                return True
+        return False
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def wait_until_ready(
+    page: Page, selector_groups: Sequence[Tuple[str, ...]], timeout_ms: float
+) -> bool:
+    """
+    Wait concurrently until every group has at least one attached selector.
+
+    Returns False if the cap was hit first; the caller extracts anyway and
+    lets validation decide.
+    """
+    if not selector_groups:
+        return True
+    results = await asyncio.gather(
+        *(_wait_for_any(page, group, timeout_ms) for group in selector_groups)
+    )
+    return all(results)
+
+
+class ReadyExtractor:
+    """Extractor wrapper that waits for the wrapped extractor's required selectors."""
+
+    def __init__(self, extractor: Any, timeout_ms: float, monitor: Optional[Any] = None):
+        self.extractor = extractor
+        self.timeout_ms = timeout_ms
+        self.monitor = monitor
+        required = getattr(extractor, "required_selectors", None)
+        self.selector_groups = required() if required else []
+
+    async def extract(self, page: Page) -> Any:
+        if not await wait_until_ready(page, self.selector_groups, self.timeout_ms):
+            increment = getattr(self.monitor, "increment", None)
+            if increment is not None:
+                increment("readiness_timeouts")
+        return await self.extractor.extract(page)
@@ -8,8 +8,6 @@ and reusable across extraction jobs.
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
-from scrapeflow.schema_library import product_price_item_spec, job_listing_item_spec
-
 
 @dataclass
 class SelectorComponent:
@@ -167,12 +165,16 @@ def get_registry() -> SelectorRegistry:
 def register_product_price_schema(registry: Optional[SelectorRegistry] = None) -> None:
     """Register the product/price schema to the registry."""
     reg = registry or _default_registry
+    from scrapeflow.schema_library import product_price_item_spec
+
     reg.register_schema("product_price", {"products": product_price_item_spec()})
 
 
 def register_job_listing_schema(registry: Optional[SelectorRegistry] = None) -> None:
     """Register the job listing schema to the registry."""
     reg = registry or _default_registry
+    from scrapeflow.schema_library import job_listing_item_spec
+
     reg.register_schema("job_listing", {"jobs": job_listing_item_spec()})
 
 
@@ -0,0 +1,246 @@
+"""
+Automatic per-domain render-mode detection (static HTTP vs. browser).
+
+The first request to a domain is probed twice: once over plain HTTP and once
+in the browser, with the same SpecificationExtractor. If the static result
+validates and matches the browser result, the domain is served over HTTP from
+then on; otherwise it stays on the browser. Transient transport failures
+(timeouts, connection errors, 429/503) decide nothing. Verdicts are kept in a
+persistent per-domain table.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from scrapeflow.retry import ErrorClassifier
+
+
+class RenderMode(str, Enum):
+    """How a domain must be fetched to produce a valid extraction."""
+
+    STATIC = "static"
+    BROWSER = "browser"
+
+
+class RenderModeTable:
+    """
+    Per-domain render-mode verdicts, optionally persisted to a JSON file.
+
+    set() only marks the table dirty; the router writes it in an executor at
+    most every `save_interval` seconds (save_if_due) and on close, so large
+    crawls don't rewrite the whole file on the event loop for every domain.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        reprobe_after: Optional[float] = None,
+        save_interval: float = 5.0,
+    ):
+        """
+        Args:
+            path: JSON file to load/save verdicts (None = in-memory only).
+            reprobe_after: Seconds after which a verdict expires and the
+                           domain is probed again (None = never).
+            save_interval: Minimum seconds between writes of a dirty table.
+        """
+        self.path = path
+        self.reprobe_after = reprobe_after
+        self.save_interval = save_interval
+        self._verdicts: Dict[str, Dict[str, Any]] = {}
+        self._version = 0  # bumped by every set()
+        self._saved_version = 0
+        self._last_save = float("-inf")
+        self._write_lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._verdicts = json.load(f)
+
+    @property
+    def dirty(self) -> bool:
+        return self._version != self._saved_version
+
+    def get(self, domain: str) -> Optional[RenderMode]:
+        """Return the current verdict for a domain, or None if unknown or expired."""
+        entry = self._verdicts.get(domain)
+        if not entry:
+            return None
+        age = time.time() - entry["decided_at"]
+        if self.reprobe_after is not None and age > self.reprobe_after:
+            return None
+        return RenderMode(entry["mode"])
+
+    def set(self, domain: str, mode: RenderMode) -> None:
+        """Record a verdict; it is persisted by the next save."""
+        self._verdicts[domain] = {"mode": mode.value, "decided_at": time.time()}
+        self._version += 1
+
+    def save(self) -> None:
+        """Write the table now (atomic replace)."""
+        self._write(dict(self._verdicts), self._version)
+
+    async def save_if_due(self) -> None:
+        """Write a dirty table in an executor, at most every save_interval seconds."""
+        if not self.path or not self.dirty:
+            return
+        now = time.monotonic()
+        if now - self._last_save < self.save_interval:
+            return
+        self._last_save = now
+        # Snapshot on the loop; entries are replaced, never mutated, so a shallow copy is enough.
+        snapshot = dict(self._verdicts)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, snapshot, self._version
+        )
+
+    def _write(self, verdicts: Dict[str, Dict[str, Any]], version: int) -> None:
+        if not self.path:
+            return
+        with self._write_lock:
+            if version <= self._saved_version:
+                return  # a newer snapshot is already on disk
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(verdicts, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._saved_version = version
+
+    def to_dict(self) -> Dict[str, str]:
+        return {domain: entry["mode"] for domain, entry in self._verdicts.items()}
+
+
+def _comparable(result: Any) -> Any:
+    """Normalize an extraction result (Pydantic model or plain data) for comparison."""
+    if hasattr(result, "model_dump"):
+        return result.model_dump()
+    return result
+
+
+class RenderModeRouter:
+    """
+    Route extractions through the cheapest runtime that still validates.
+
+    Used via ScrapeFlow.extract(); the engine's own runtime is the browser
+    runtime and `static_runtime` (e.g. HttpRuntime) is the fast path.
+    """
+
+    def __init__(self, static_runtime: Any, table: Optional[RenderModeTable] = None):
+        self.static_runtime = static_runtime
+        self.table = table or RenderModeTable()
+        self._probe_locks: Dict[str, asyncio.Lock] = {}
+
+    async def start(self) -> None:
+        await self.static_runtime.start()
+
+    async def close(self) -> None:
+        await self.static_runtime.close()
+        if self.table.dirty:
+            await asyncio.get_running_loop().run_in_executor(None, self.table.save)
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    async def _fetch_and_extract(
+        self, engine: Any, runtime: Any, url: str, extractor: Any, wait_until: str, timeout: Any
+    ) -> Any:
+        async with runtime.acquire_page() as page:
+            await engine._navigate_with_policies(
+                url, wait_until, timeout, page=page, runtime=runtime
+            )
+            return await extractor.extract(page)
+
+    async def _try_static(
+        self, engine: Any, url: str, extractor: Any, wait_until: str, timeout: Any
+    ) -> Tuple[bool, Any]:
+        """
+        Extract over HTTP; (False, None) if the fetched page doesn't validate.
+
+        Navigation errors (timeouts, 404s, 429/503, ...) are re-raised: only a
+        page that was served but fails extraction says the domain needs a
+        browser.
+        """
+        runtime = self.static_runtime
+        async with runtime.acquire_page() as page:
+            await engine._navigate_with_policies(
+                url, wait_until, timeout, page=page, runtime=runtime
+            )
+            try:
+                return True, await extractor.extract(page)
+            except Exception as e:
+                engine.logger.debug(f"Static extraction failed for {url}: {e}")
+                return False, None
+
+    async def probe(
+        self, engine: Any, url: str, extractor: Any, wait_until: str = "load", timeout: Any = None
+    ) -> Tuple[RenderMode, Any]:
+        """
+        Fetch `url` both ways, compare, record the verdict for its domain.
+
+        Returns (verdict, browser result) so the probe request is not wasted.
+        If the static fetch fails transiently, no verdict is recorded (the
+        domain is probed again next time) and BROWSER is returned. A static
+        fetch refused for good (e.g. 403 to non-browser clients) while the
+        browser got the page is a BROWSER verdict.
+        """
+        browser_result = await self._fetch_and_extract(
+            engine, engine.runtime, url, extractor, wait_until, timeout
+        )
+        domain = self.domain_of(url)
+        try:
+            valid, static_result = await self._try_static(
+                engine, url, extractor, wait_until, timeout
+            )
+        except Exception as e:
+            if ErrorClassifier.is_retryable(e):
+                engine.logger.debug(f"Render mode for {domain} undecided: {e}")
+                return RenderMode.BROWSER, browser_result
+            engine.logger.debug(f"Static fetch refused for {url}: {e}")
+            valid, static_result = False, None
+        same = valid and _comparable(static_result) == _comparable(browser_result)
+        mode = RenderMode.STATIC if same else RenderMode.BROWSER
+        self.table.set(domain, mode)
+        await self.table.save_if_due()
+        engine.logger.info(f"Render mode for {domain}: {mode.value}")
+        return mode, browser_result
+
+    async def extract(
+        self, engine: Any, url: str, extractor: Any, wait_until: str = "load", timeout: Any = None
+    ) -> Any:
+        """Extract `url`, probing its domain first if no verdict is known."""
+        domain = self.domain_of(url)
+        mode = self.table.get(domain)
+        if mode is None:
+            lock = self._probe_locks.setdefault(domain, asyncio.Lock())
+            try:
+                async with lock:
+                    mode = self.table.get(domain)
+                    if mode is None:
+                        _, result = await self.probe(engine, url, extractor, wait_until, timeout)
+                        return result
+            finally:
+                # Settled domains never take the lock again; queued waiters hold their own ref.
+                if self.table.get(domain) is not None:
+                    self._probe_locks.pop(domain, None)
+
+        if mode == RenderMode.STATIC:
+            # Navigation errors (dead links, throttling) propagate; the verdict stands.
+            valid, result = await self._try_static(engine, url, extractor, wait_until, timeout)
+            if valid:
+                return result
+            # Served but no longer validates (site started rendering client-side): demote.
+            self.table.set(domain, RenderMode.BROWSER)
+            await self.table.save_if_due()
+            engine.logger.warning(
+                f"Static extraction no longer validates for {domain}; using browser"
+            )
+
+        return await self._fetch_and_extract(
+            engine, engine.runtime, url, extractor, wait_until, timeout
+        )
@@ -3,15 +3,9 @@
 import asyncio
 import random
 import logging
-from typing import Callable, Any, Optional, Type, Tuple
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    Retrying,
-    RetryError,
-)
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Any, Mapping, Optional, Type, Tuple
 from scrapeflow.config import RetryConfig
 from scrapeflow.exceptions import (
     ScrapeFlowRetryError,
@@ -22,6 +16,29 @@ from scrapeflow.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Case-insensitive header lookup (Playwright lower-cases header names)."""
+    for key, value in headers.items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
 class RetryHandler:
     """Handles retry logic with exponential backoff and jitter."""
 
@@ -40,9 +57,21 @@ class RetryHandler:
         func: Callable,
         *args,
         retryable_exceptions: Optional[Tuple[Type[Exception], ...]] = None,
+        should_retry: Optional[Callable[[Exception], bool]] = None,
         **kwargs,
     ) -> Any:
-        """Execute a function with retry logic."""
+        """
+        Execute a function with retry logic.
+
+        Args:
+            retryable_exceptions: Exception types eligible for retry.
+            should_retry: Optional finer-grained check (e.g. ErrorClassifier.is_retryable);
+                          errors it rejects are re-raised immediately.
+
+        A server-suggested delay (Retry-After) replaces the backoff delay when
+        longer. If it exceeds `max_delay`, the error is raised at once rather
+        than retried too early.
+        """
         retryable = retryable_exceptions or self.config.retryable_exceptions
         max_retries = self.config.max_retries
         delay = self.config.initial_delay
@@ -54,6 +83,15 @@ class RetryHandler:
                 else:
                     return func(*args, **kwargs)
             except retryable as e:
+                if should_retry is not None and not should_retry(e):
+                    raise
+                suggested_delay = ErrorClassifier.get_retry_delay(e)
+                if suggested_delay is not None and suggested_delay > self.config.max_delay:
+                    logger.warning(
+                        f"Not retrying {func.__name__}: server asked to wait "
+                        f"{suggested_delay:.0f}s (max_delay {self.config.max_delay:.0f}s)"
+                    )
+                    raise
                 if attempt == max_retries:
                     logger.error(
                         f"Max retries ({max_retries}) exceeded for {func.__name__}"
@@ -71,6 +109,8 @@ class RetryHandler:
                     self.config.max_delay,
                 )
                 delay = self._add_jitter(delay)
+                if suggested_delay is not None:
+                    delay = max(delay, suggested_delay)
 
                 logger.warning(
                     f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {str(e)}. "
@@ -98,11 +138,13 @@ class ErrorClassifier:
             return True
 
         # HTTP errors that might be temporary
-        if hasattr(error, "status_code"):
+        if getattr(error, "status_code", None) is not None:
             status = error.status_code
-            # 429 (Too Many Requests), 500, 502, 503, 504 are retryable
-            if status in (429, 500, 502, 503, 504):
+            # 408, 429 (Too Many Requests), 500, 502, 503, 504 are retryable
+            if status in (408, 429, 500, 502, 503, 504):
                 return True
+            # Any other HTTP status (404, 410, 403, ...) will not change on retry
+            return False
 
         # ScrapeFlow specific errors
         if isinstance(error, ScrapeFlowRetryError):
@@ -120,13 +162,13 @@ class ErrorClassifier:
     @staticmethod
     def get_retry_delay(error: Exception) -> Optional[float]:
         """Get suggested retry delay for an error."""
-        if isinstance(error, ScrapeFlowBlockedError):
+        if isinstance(error, ScrapeFlowBlockedError) and error.retry_after is not None:
             return error.retry_after
 
-        if hasattr(error, "status_code") and error.status_code == 429:
+        if getattr(error, "status_code", None) in (429, 503):
             # Check for Retry-After header
-            if hasattr(error, "headers") and "Retry-After" in error.headers:
-                return float(error.headers["Retry-After"])
+            headers = getattr(error, "headers", None) or {}
+            return parse_retry_after(_header(headers, "Retry-After"))
 
         return None
 
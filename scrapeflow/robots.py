@@ -6,22 +6,90 @@ layer so compliance is built-in, not retrofitted.
 """
 
 import asyncio
+import math
+import re
 import time
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
-import aiohttp
-
 from scrapeflow.exceptions import ScrapeFlowError
 
+# Request-rate: <requests>/<period>[s|m|h|d], optionally followed by a time window.
+_REQUEST_RATE_RE = re.compile(r"^(\d+)\s*/\s*(\d+(?:\.\d+)?)\s*([smhd]?)", re.IGNORECASE)
+_PERIOD_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _parse_crawl_delay(value: str) -> Optional[float]:
+    try:
+        delay = float(value)
+    except ValueError:
+        return None
+    return delay if math.isfinite(delay) and delay >= 0 else None
+
+
+def _parse_request_rate(value: str) -> Optional[float]:
+    """Seconds per request for a Request-rate value such as 1/5 or 30/1m."""
+    match = _REQUEST_RATE_RE.match(value)
+    if not match or int(match.group(1)) == 0:
+        return None
+    period = float(match.group(2)) * _PERIOD_SECONDS[match.group(3).lower()]
+    return period / int(match.group(1))
+
+
+def parse_crawl_delay(lines: Iterable[str], user_agent: str) -> Optional[float]:
+    """
+    Seconds to wait between requests, as asked by robots.txt for `user_agent`.
+
+    Reads Crawl-delay and Request-rate from the groups naming the agent, or
+    from the "*" groups when none does, and returns the stricter of the two.
+    Agents match as in urllib.robotparser (the name before "/", as a
+    case-insensitive substring). Unlike urllib.robotparser, fractional delays
+    ("Crawl-delay: 0.5") and Request-rate periods with units ("1/10m") are
+    accepted. Returns None when no applicable directive is present.
+    """
+    token = user_agent.split("/")[0].strip().lower()
+    specific: List[float] = []
+    default: List[float] = []
+    agents: List[str] = []
+    in_rules = False
+    for raw in lines:
+        line = raw.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        field, value = (part.strip() for part in line.split(":", 1))
+        field = field.lower()
+        if field == "user-agent":
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+            continue
+        if not agents:
+            continue
+        in_rules = True
+        if field == "crawl-delay":
+            delay = _parse_crawl_delay(value)
+        elif field == "request-rate":
+            delay = _parse_request_rate(value)
+        else:
+            continue
+        if delay is None:
+            continue
+        if any(agent != "*" and agent in token for agent in agents):
+            specific.append(delay)
+        elif "*" in agents:
+            default.append(delay)
+    delays = specific or default
+    return max(delays) if delays else None
+
 
 class RobotsChecker:
     """
     Check robots.txt compliance before crawling.
 
     Fetches and parses robots.txt, caches results, and provides can_fetch()
-    to determine if a URL is allowed for a given user agent.
+    to determine if a URL is allowed for a given user agent, and
+    get_crawl_delay() for the pace the site asks that agent to keep.
     """
 
     def __init__(
@@ -39,7 +107,8 @@ class RobotsChecker:
         self.user_agent = user_agent
         self.respect_robots = respect_robots
         self.cache_ttl = cache_ttl
-        self._cache: dict[str, tuple[RobotFileParser, float]] = {}
+        # site -> (parser, crawl delay, fetched at)
+        self._cache: Dict[str, Tuple[RobotFileParser, Optional[float], float]] = {}
         self._lock = asyncio.Lock()
 
     def _get_robots_url(self, url: str) -> str:
@@ -48,21 +117,40 @@ class RobotsChecker:
         base = f"{parsed.scheme}://{parsed.netloc}"
         return urljoin(base, "/robots.txt")
 
-    async def _fetch_robots(self, robots_url: str) -> RobotFileParser:
-        """Fetch and parse robots.txt."""
+    async def _fetch_robots_text(self, robots_url: str) -> str:
+        """Fetch robots.txt; an error or non-200 response counts as empty (allow all)."""
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.get(robots_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status == 200:
-                        content = await resp.text()
-                    else:
-                        content = ""
+                        return await resp.text()
             except Exception:
-                content = ""
+                pass
+        return ""
 
+    async def _fetch_robots(self, robots_url: str) -> Tuple[RobotFileParser, Optional[float]]:
+        """Fetch and parse robots.txt into a parser and this agent's crawl delay."""
+        lines = (await self._fetch_robots_text(robots_url)).splitlines()
         rp = RobotFileParser()
-        rp.parse(content.splitlines())
-        return rp
+        rp.parse(lines)
+        return rp, parse_crawl_delay(lines, self.user_agent)
+
+    async def _rules(self, url: str) -> Tuple[RobotFileParser, Optional[float]]:
+        """Cached robots.txt rules for the URL's site, refetched after cache_ttl."""
+        parsed = urlparse(url)
+        base = f"{parsed.scheme}://{parsed.netloc}"
+
+        async with self._lock:
+            now = time.time()
+            cached = self._cache.get(base)
+            if cached is not None and now - cached[2] < self.cache_ttl:
+                return cached[0], cached[1]
+
+            rp, delay = await self._fetch_robots(self._get_robots_url(url))
+            self._cache[base] = (rp, delay, now)
+            return rp, delay
 
     async def can_fetch(self, url: str) -> bool:
         """
@@ -73,41 +161,20 @@ class RobotsChecker:
         if not self.respect_robots:
             return True
 
-        parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        robots_url = self._get_robots_url(url)
-
-        async with self._lock:
-            now = time.time()
-            if base in self._cache:
-                rp, cached_at = self._cache[base]
-                if now - cached_at < self.cache_ttl:
-                    return rp.can_fetch(self.user_agent, url)
-
-            rp = await self._fetch_robots(robots_url)
-            self._cache[base] = (rp, now)
-            return rp.can_fetch(self.user_agent, url)
+        rp, _ = await self._rules(url)
+        return rp.can_fetch(self.user_agent, url)
 
     async def get_crawl_delay(self, url: str) -> Optional[float]:
         """
-        Get Crawl-delay in seconds if specified in robots.txt.
+        Seconds to wait between requests to the URL's site, per robots.txt.
 
-        Note: Crawl-delay is non-standard (used by some bots) but we support it
-        for maximum compliance.
+        The stricter of Crawl-delay and Request-rate for the configured user
+        agent (see parse_crawl_delay). Both are non-standard (used by some
+        bots) but we support them for maximum compliance. None if robots.txt
+        sets neither, or respect_robots=False.
         """
         if not self.respect_robots:
             return None
 
-        parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        robots_url = self._get_robots_url(url)
-
-        async with self._lock:
-            if base not in self._cache:
-                rp = await self._fetch_robots(robots_url)
-                self._cache[base] = (rp, time.time())
-            rp, _ = self._cache[base]
-
-        # RobotFileParser doesn't expose crawl_delay; we'd need a custom parser.
-        # For now return None; rate limiting is handled by RateLimiter.
-        return None
+        _, delay = await self._rules(url)
+        return delay
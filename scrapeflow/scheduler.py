@@ -0,0 +1,142 @@
+"""
+Per-host politeness scheduling for crawl_many().
+
+One FIFO queue per host, served round-robin so a slow or rate-limited host
+never blocks the others. Each host has its own concurrency cap and request
+interval, and a page budget (EthicalCrawlingConfig.max_pages_per_domain).
+The scheduler is synchronous and clock-driven; the engine asks it which URL
+may start now and how long to sleep when none can.
+"""
+
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, MutableMapping, Optional
+from urllib.parse import urlparse
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+class HostScheduler:
+    """Round-robin per-host queues with concurrency caps, intervals and page budgets."""
+
+    def __init__(
+        self,
+        max_concurrency_per_host: Optional[int] = None,
+        min_interval_per_host: float = 0.0,
+        max_pages_per_host: Optional[int] = None,
+        page_counts: Optional[MutableMapping[str, int]] = None,
+        key_func: Callable[[str], str] = host_of,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_concurrency_per_host: Requests in flight per host (None = unbounded).
+            min_interval_per_host: Seconds between request starts on one host.
+            max_pages_per_host: Page budget per host (None = unlimited).
+            page_counts: Pages already dispatched per host; pass a shared dict
+                         to enforce the budget across several crawls.
+            key_func: Maps a URL to its politeness key (default: hostname).
+            clock: Monotonic time source.
+        """
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.min_interval_per_host = min_interval_per_host
+        self.max_pages_per_host = max_pages_per_host
+        self.page_counts = page_counts if page_counts is not None else {}
+        self.key_func = key_func
+        self.clock = clock
+        self._queues: Dict[str, Deque[str]] = {}
+        self._ring: Deque[str] = deque()  # hosts with queued URLs, in service order
+        self._in_flight: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+        self._queued = 0
+
+    def __len__(self) -> int:
+        """Number of queued (not yet dispatched) URLs."""
+        return self._queued
+
+    @property
+    def in_flight(self) -> int:
+        return sum(self._in_flight.values())
+
+    def _budget_left(self, host: str) -> Optional[int]:
+        if self.max_pages_per_host is None:
+            return None
+        queued = len(self._queues.get(host, ()))
+        return self.max_pages_per_host - self.page_counts.get(host, 0) - queued
+
+    def push(self, url: str) -> bool:
+        """Queue a URL; False if its host's page budget is already used up."""
+        host = self.key_func(url)
+        budget = self._budget_left(host)
+        if budget is not None and budget <= 0:
+            return False
+        queue = self._queues.get(host)
+        if queue is None:
+            queue = self._queues[host] = deque()
+            self._ring.append(host)
+        queue.append(url)
+        self._queued += 1
+        return True
+
+    def _eligible(self, host: str, now: float) -> bool:
+        cap = self.max_concurrency_per_host
+        if cap is not None and self._in_flight.get(host, 0) >= cap:
+            return False
+        return now >= self._next_start.get(host, 0.0)
+
+    def next_ready(self) -> Optional[str]:
+        """
+        Pop the next URL that may start now, visiting hosts round-robin.
+
+        Returns None when every queued host is at its concurrency cap or
+        inside its interval.
+        """
+        now = self.clock()
+        for _ in range(len(self._ring)):
+            host = self._ring[0]
+            self._ring.rotate(-1)
+            if not self._eligible(host, now):
+                continue
+            queue = self._queues[host]
+            url = queue.popleft()
+            self._queued -= 1
+            if not queue:
+                del self._queues[host]
+                self._ring.remove(host)
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            if self.min_interval_per_host > 0:
+                self._next_start[host] = now + self.min_interval_per_host
+                if len(self._next_start) > 2 * len(self._ring) + 64:
+                    self._prune(now)
+            self.page_counts[host] = self.page_counts.get(host, 0) + 1
+            return url
+        return None
+
+    def _prune(self, now: float) -> None:
+        """Drop interval entries that have already passed (they no longer delay anything)."""
+        self._next_start = {h: t for h, t in self._next_start.items() if t > now}
+
+    def done(self, url: str) -> None:
+        """Release the host slot held by a dispatched URL."""
+        host = self.key_func(url)
+        remaining = self._in_flight.get(host, 0) - 1
+        if remaining > 0:
+            self._in_flight[host] = remaining
+        else:
+            self._in_flight.pop(host, None)
+
+    def next_wakeup(self) -> Optional[float]:
+        """
+        Seconds until a queued host leaves its interval, 0 if one is ready,
+        or None if queued hosts are only waiting for in-flight requests.
+        """
+        now = self.clock()
+        cap = self.max_concurrency_per_host
+        waits = [
+            max(0.0, self._next_start.get(host, 0.0) - now)
+            for host in self._ring
+            if cap is None or self._in_flight.get(host, 0) < cap
+        ]
+        return min(waits) if waits else None
@@ -0,0 +1,273 @@
+"""
+Rate limiting shared across worker processes.
+
+Several processes crawling the same host (e.g. ShardedCrawlExecutor
+workers) each had their own RateLimiter, so the combined rate was N times
+RateLimitConfig.requests_per_second. SharedRateLimiter keeps the GCRA state
+(one theoretical arrival time per bucket) in a backend that every process
+updates atomically:
+
+- MmapBackend: a small memory-mapped file guarded by flock, for processes on
+  one machine. An acquire costs one lock, a hash probe and a 16-byte write.
+- RedisBackend: a Lua script on a Redis-compatible server (Redis, Valkey,
+  KeyDB, ...), using the server's clock, for workers on several machines.
+"""
+
+import asyncio
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from scrapeflow.config import RateLimitConfig
+
+_SLOT = struct.Struct("<Qd")  # key hash (0 = empty), theoretical arrival time
+_HEADER = struct.Struct("<8sI")
+_MAGIC = b"SFRL0001"
+GLOBAL_KEY = "__global__"
+
+
+class RateLimitBackend(ABC):
+    """Atomic GCRA reservation store shared by SharedRateLimiter instances."""
+
+    @abstractmethod
+    async def reserve(self, key: str, interval: float, tolerance: float) -> float:
+        """
+        Reserve the next slot of `key`'s bucket.
+
+        Args:
+            key: Bucket name.
+            interval: Seconds between requests at the sustained rate.
+            tolerance: Burst allowance in seconds (interval * (burst - 1)).
+
+        Returns:
+            Seconds the caller must wait before its slot.
+        """
+
+    def close(self) -> None:
+        pass
+
+
+def _key_hash(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class MmapBackend(RateLimitBackend):
+    """
+    Buckets in a memory-mapped file shared by processes on one machine (POSIX).
+
+    The file holds a fixed open-addressing table of `slots` buckets. A bucket
+    whose arrival time has passed is idle (equivalent to a full bucket), so
+    another key may take its slot over; the table only fills up when more
+    than `slots` keys are rate limited at the same moment. Times come from
+    time.monotonic(), which is system-wide on Linux and macOS.
+    """
+
+    def __init__(self, path: Optional[str] = None, slots: int = 4096):
+        """
+        Args:
+            path: Shared state file (default: scrapeflow-ratelimit.bin in the temp dir).
+                  Every cooperating process must use the same path.
+            slots: Bucket capacity; must match across processes using the file.
+        """
+        try:
+            import fcntl
+            import mmap
+        except ImportError:
+            raise ImportError("MmapBackend requires a POSIX system (fcntl, mmap)")
+        self._fcntl = fcntl
+        self.path = path or os.path.join(tempfile.gettempdir(), "scrapeflow-ratelimit.bin")
+        self.slots = slots
+        size = _HEADER.size + slots * _SLOT.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                current = os.fstat(self._fd).st_size
+                if current == 0:
+                    os.ftruncate(self._fd, size)
+                    os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots), 0)
+                else:
+                    magic, existing = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+                    if magic != _MAGIC or existing != slots or current != size:
+                        raise ValueError(
+                            f"{self.path} is not a rate limit table with {slots} slots"
+                        )
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        # flock does not exclude threads sharing this descriptor.
+        self._thread_lock = threading.Lock()
+
+    def _find_slot(self, key_hash: int, now: float) -> int:
+        """Offset of the key's slot: its own, else the first idle or empty one on its probe path."""
+        start = key_hash % self.slots
+        reusable: Optional[int] = None
+        for i in range(self.slots):
+            offset = _HEADER.size + ((start + i) % self.slots) * _SLOT.size
+            stored_hash, tat = _SLOT.unpack_from(self._map, offset)
+            if stored_hash == key_hash:
+                return offset
+            if stored_hash == 0:
+                return reusable if reusable is not None else offset
+            if reusable is None and tat <= now:
+                reusable = offset
+        if reusable is None:
+            raise RuntimeError(
+                f"Shared rate limit table {self.path} is full ({self.slots} busy buckets)"
+            )
+        return reusable
+
+    def reserve_now(self, key: str, interval: float, tolerance: float) -> float:
+        """Synchronous reserve(); the lock is held for a few microseconds."""
+        key_hash = _key_hash(key)
+        with self._thread_lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                now = time.monotonic()
+                offset = self._find_slot(key_hash, now)
+                stored_hash, tat = _SLOT.unpack_from(self._map, offset)
+                if stored_hash != key_hash or tat < now:
+                    tat = now
+                _SLOT.pack_into(self._map, offset, key_hash, tat + interval)
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+        return max(0.0, tat - tolerance - now)
+
+    async def reserve(self, key: str, interval: float, tolerance: float) -> float:
+        return self.reserve_now(key, interval, tolerance)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            os.close(self._fd)
+            self._map = None
+
+
+_GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then tat = now end
+local ttl = math.ceil((tat + interval - now) * 1000) + 1000
+redis.call('SET', KEYS[1], string.format('%.6f', tat + interval), 'PX', ttl)
+local wait = tat - tolerance - now
+if wait < 0 then wait = 0 end
+return string.format('%.6f', wait)
+"""
+
+
+class RedisBackend(RateLimitBackend):
+    """Buckets on a Redis-compatible server, updated by one atomic Lua script per acquire."""
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "scrapeflow:ratelimit:",
+    ):
+        """
+        Args:
+            client: A redis.asyncio.Redis (or compatible) client; built from `url` if None.
+            url: Server URL used when no client is given.
+            prefix: Key prefix for bucket state (keys expire once idle).
+        """
+        if client is None:
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError:
+                raise ImportError(
+                    "redis is required for RedisBackend. Install with: pip install redis"
+                )
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_GCRA_SCRIPT)
+
+    async def reserve(self, key: str, interval: float, tolerance: float) -> float:
+        wait = await self._script(keys=[self.prefix + key], args=[interval, tolerance])
+        return float(wait.decode() if isinstance(wait, bytes) else wait)
+
+
+class SharedRateLimiter:
+    """
+    RateLimiterPort whose GCRA buckets live in a backend shared by all processes.
+
+    With RateLimitConfig.per_host each hostname gets its own bucket, otherwise
+    all requests share one; global_requests_per_second adds a cap across hosts.
+    Callers sleep locally; only the reservation touches shared state.
+    """
+
+    def __init__(self, config: RateLimitConfig, backend: Optional[RateLimitBackend] = None):
+        """
+        Args:
+            config: Rate, burst, per_host and global cap.
+            backend: Shared state (default: MmapBackend(config.shared_path)).
+        """
+        self.config = config
+        self.backend = backend or MmapBackend(config.shared_path)
+        if config.requests_per_second:
+            self.interval = 1.0 / config.requests_per_second
+        elif config.requests_per_minute:
+            self.interval = 60.0 / config.requests_per_minute
+        else:
+            self.interval = 1.0
+        self.global_interval: Optional[float] = None
+        if config.per_host and config.global_requests_per_second:
+            self.global_interval = 1.0 / config.global_requests_per_second
+        # Per-host floors (robots.txt Crawl-delay), LRU-bounded by max_hosts.
+        self._min_intervals: "OrderedDict[str, float]" = OrderedDict()
+
+    def set_min_interval(self, key: str, seconds: Optional[float]) -> bool:
+        """
+        Space `key`'s requests at least `seconds` apart whatever their cost, with no burst.
+
+        Replaces any earlier floor; None or 0 removes it. Returns False (not
+        applied) unless buckets are per host. Each process applies the floor
+        itself, so every process must see the same delay.
+        """
+        if not self.config.per_host:
+            return False
+        self._min_intervals.pop(key, None)
+        if seconds:
+            self._min_intervals[key] = seconds
+            if len(self._min_intervals) > self.config.max_hosts:
+                self._min_intervals.popitem(last=False)
+        return True
+
+    def min_intervals(self) -> Dict[str, float]:
+        """Per-request floors (robots.txt Crawl-delays) by host."""
+        return dict(self._min_intervals)
+
+    async def _take(self, bucket: str, charge: float, tolerance: float) -> None:
+        wait = await self.backend.reserve(bucket, charge, tolerance)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def acquire(self, key: Optional[str] = None, cost: float = 1.0) -> None:
+        # Weighted GCRA: advance by interval * cost, and let the whole charge fit the burst.
+        burst = self.config.burst_size
+        bucket = (key or "") if self.config.per_host else ""
+        floor = self._min_intervals.get(bucket)
+        if floor is None:
+            await self._take(bucket, self.interval * cost, self.interval * (burst - cost))
+        else:
+            # Crawl-delay: at least `floor` per request whatever its cost, and no burst.
+            await self._take(bucket, max(self.interval * cost, floor), 0.0)
+        if self.global_interval is not None:
+            interval = self.global_interval
+            await self._take(GLOBAL_KEY, interval * cost, interval * (burst - cost))
+
+    def close(self) -> None:
+        self.backend.close()
@@ -0,0 +1,369 @@
+"""
+Streaming result sinks with backpressure.
+
+Producers (paginate(), workflow steps, crawl loops) `await sink.put(item)`
+into a bounded asyncio queue. A background writer drains the queue in
+batches, writing each batch in a worker thread, so memory stays flat
+however many items a crawl produces. When the writer falls behind, put()
+blocks instead of buffering.
+
+fsync policies: "never" (leave it to the OS), "batch" (after every batch),
+"close" (on flush(), rotation and close(); the default).
+"""
+
+import asyncio
+import csv
+import dataclasses
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+FSYNC_POLICIES = ("never", "batch", "close")
+
+_CLOSE = object()
+
+
+class _Flush:
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+
+
+def to_record(item: Any) -> Dict[str, Any]:
+    """Convert an item (Pydantic model, dataclass, dict or scalar) to a JSON-ready dict."""
+    if hasattr(item, "model_dump"):
+        return item.model_dump(mode="json")
+    if dataclasses.is_dataclass(item) and not isinstance(item, type):
+        return dataclasses.asdict(item)
+    if isinstance(item, dict):
+        return item
+    return {"value": item}
+
+
+class Sink(ABC):
+    """Base class: bounded queue, background batching writer, fsync policy."""
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        queue_size: Optional[int] = None,
+        fsync: str = "close",
+    ):
+        """
+        Args:
+            batch_size: Maximum items written per batch.
+            flush_interval: Seconds a partial batch may wait before being written.
+            queue_size: Items buffered before put() applies backpressure
+                        (default: 4 batches).
+            fsync: "never", "batch" or "close".
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size or batch_size * 4
+        self.fsync = fsync
+        self.items_written = 0
+        self.batches_written = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    async def __aenter__(self) -> "Sink":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def _ensure_started(self) -> None:
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} is closed")
+        if self._error is not None:
+            raise self._error
+        if self._writer is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._writer = asyncio.ensure_future(self._run())
+
+    async def put(self, item: Any) -> None:
+        """Queue an item, waiting while the queue is full."""
+        self._ensure_started()
+        await self._queue.put(item)
+
+    async def put_many(self, items: Iterable[Any]) -> None:
+        for item in items:
+            await self.put(item)
+
+    async def flush(self) -> None:
+        """
+        Wait until everything queued so far is written (and fsynced unless fsync="never").
+
+        Does nothing on a closed sink: close() already wrote everything.
+        """
+        if self._writer is None or self._closed:
+            return
+        self._ensure_started()
+        marker = _Flush(asyncio.get_running_loop().create_future())
+        if await self._put_control(marker):
+            await asyncio.wait({marker.future, self._writer}, return_when=asyncio.FIRST_COMPLETED)
+        if not marker.future.done():
+            marker.future.cancel()
+            raise self._error or RuntimeError(f"{type(self).__name__} writer stopped")
+        marker.future.result()
+
+    async def close(self) -> None:
+        """Write remaining items and release the underlying file or database."""
+        if self._closed:
+            return
+        if self._writer is not None:
+            if self._error is None:
+                await self._put_control(_CLOSE)
+            await asyncio.gather(self._writer, return_exceptions=True)
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(None, self._close)
+        if self._error is not None:
+            raise self._error
+
+    async def _put_control(self, item: Any) -> bool:
+        """Queue a control item; False if the writer died first (a full queue would never drain)."""
+        put = asyncio.ensure_future(self._queue.put(item))
+        await asyncio.wait({put, self._writer}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            return False
+        return True
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch: List[Any] = [await self._queue.get()]
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size and not self._is_control(batch[-1]):
+                    try:
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                control = batch.pop() if self._is_control(batch[-1]) else None
+                if batch:
+                    records = [self._to_record(item) for item in batch]
+                    await loop.run_in_executor(None, self._write_batch_and_sync, records)
+                if control is _CLOSE:
+                    return
+                if isinstance(control, _Flush):
+                    if self.fsync != "never":
+                        await loop.run_in_executor(None, self._sync)
+                    control.future.set_result(None)
+        except BaseException as e:
+            self._error = e
+            self._fail_waiters(e)
+            raise
+
+    @staticmethod
+    def _is_control(item: Any) -> bool:
+        return item is _CLOSE or isinstance(item, _Flush)
+
+    def _fail_waiters(self, error: BaseException) -> None:
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if isinstance(item, _Flush) and not item.future.done():
+                item.future.set_exception(error)
+
+    def _to_record(self, item: Any) -> Dict[str, Any]:
+        return to_record(item)
+
+    def _write_batch_and_sync(self, records: List[Dict[str, Any]]) -> None:
+        self._write_batch(records)
+        self.items_written += len(records)
+        self.batches_written += 1
+        if self.fsync == "batch":
+            self._sync()
+
+    @abstractmethod
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Write one batch of records (runs in a worker thread)."""
+
+    @abstractmethod
+    def _sync(self) -> None:
+        """Force written data to stable storage."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Release resources, syncing first unless fsync is "never"."""
+
+
+class _RotatingFileSink(Sink):
+    """File sink appending to `path`, optionally rotating into numbered parts by size."""
+
+    def __init__(self, path: str, rotate_bytes: Optional[int] = None, **kwargs: Any):
+        """
+        Args:
+            path: Output file. With rotation, parts are named `<stem>-00000<ext>`, ...
+            rotate_bytes: Start a new part once the current one reaches this size.
+            **kwargs: Sink options (batch_size, flush_interval, queue_size, fsync).
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self.rotate_bytes = rotate_bytes
+        self.paths: List[str] = []
+        self._file = None
+        self._part = self._last_existing_part() if rotate_bytes else 0
+
+    def _part_path(self, part: int) -> str:
+        if not self.rotate_bytes:
+            return self.path
+        stem, ext = os.path.splitext(self.path)
+        return f"{stem}-{part:05d}{ext}"
+
+    def _last_existing_part(self) -> int:
+        part = 0
+        while os.path.exists(self._part_path(part + 1)):
+            part += 1
+        return part
+
+    def _ensure_open(self) -> None:
+        if self._file is None:
+            path = self._part_path(self._part)
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8", newline="")
+            self.paths.append(path)
+            self._on_open()
+
+    def _on_open(self) -> None:
+        pass
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        self._ensure_open()
+        self._write_records(records)
+        self._file.flush()
+        if self.rotate_bytes and self._file.tell() >= self.rotate_bytes:
+            self._close_file()
+            self._part += 1
+
+    @abstractmethod
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        ...
+
+    def _sync(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            if self.fsync != "never":
+                self._sync()
+            self._file.close()
+            self._file = None
+
+    def _close(self) -> None:
+        self._close_file()
+
+
+class JSONLSink(_RotatingFileSink):
+    """One JSON object per line."""
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        self._file.write(
+            "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in records)
+        )
+
+
+class CSVSink(_RotatingFileSink):
+    """CSV with a header per file; nested values are JSON-encoded."""
+
+    def __init__(self, path: str, fieldnames: Optional[List[str]] = None, **kwargs: Any):
+        """
+        Args:
+            path: Output file.
+            fieldnames: Columns (default: keys of the first item). Extra keys are dropped.
+            **kwargs: _RotatingFileSink and Sink options.
+        """
+        super().__init__(path, **kwargs)
+        self.fieldnames = fieldnames
+        self._csv: Optional[csv.DictWriter] = None
+
+    def _on_open(self) -> None:
+        self._csv = None
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        if self.fieldnames is None:
+            self.fieldnames = list(records[0])
+        if self._csv is None:
+            self._csv = csv.DictWriter(
+                self._file, fieldnames=self.fieldnames, extrasaction="ignore"
+            )
+            if self._file.tell() == 0:
+                self._csv.writeheader()
+        self._csv.writerows(
+            {
+                k: json.dumps(v, ensure_ascii=False) if isinstance(v, (dict, list)) else v
+                for k, v in record.items()
+            }
+            for record in records
+        )
+
+
+class SQLiteSink(Sink):
+    """Rows of JSON in a SQLite table (WAL), one transaction per batch."""
+
+    def __init__(self, path: str, table: str = "items", **kwargs: Any):
+        """
+        Args:
+            path: SQLite database file.
+            table: Table to append to; created as (id, data JSON, created_at).
+            **kwargs: Sink options. fsync maps to PRAGMA synchronous
+                      ("batch" = FULL, "close" = NORMAL, "never" = OFF).
+        """
+        super().__init__(**kwargs)
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.path = path
+        self.table = table
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Only the writer task uses the connection, one batch at a time.
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            synchronous = {"batch": "FULL", "close": "NORMAL", "never": "OFF"}[self.fsync]
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(id INTEGER PRIMARY KEY, data TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.executemany(
+                f"INSERT INTO {self.table} (data, created_at) VALUES (?, ?)",
+                [(json.dumps(r, ensure_ascii=False, default=str), now) for r in records],
+            )
+
+    def _sync(self) -> None:
+        if self._conn is not None:
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            if self.fsync != "never":
+                self._sync()
+            self._conn.close()
+            self._conn = None
@@ -6,11 +6,15 @@ their types, and validation rules. Aligns with specification-driven extraction
 best practices for decoupling field definitions from page structure.
 """
 
+from __future__ import annotations
+
 import re
 from urllib.parse import urljoin
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 from pydantic import BaseModel, Field, field_validator
-from playwright.async_api import Page, Locator
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Locator
 
 from scrapeflow.extractors import Extractor
 from scrapeflow.exceptions import ScrapeFlowValidationError
@@ -170,6 +174,30 @@ class SpecificationExtractor:
         raw = await self._extract_raw(page)
         return self._validate(raw)
 
+    def required_selectors(self) -> List[Tuple[str, ...]]:
+        """
+        Selectors that must be on the page before extraction can validate.
+
+        One tuple per required field (a FieldSpec with required=True, or a
+        required model field without a spec default); any selector in the
+        tuple (primary or fallback) satisfies it. For ItemSpec fields the
+        items_selector is used.
+        """
+        groups: List[Tuple[str, ...]] = []
+        for key, spec in self.schema.items():
+            field_info = self.model.model_fields.get(key)
+            model_required = bool(field_info and field_info.is_required())
+            if isinstance(spec, ItemSpec):
+                if model_required:
+                    groups.append((spec.items_selector,))
+            elif isinstance(spec, str):
+                if model_required:
+                    groups.append((spec,))
+            elif spec.required or (model_required and spec.default is None):
+                selectors = [spec.selector] if isinstance(spec.selector, str) else spec.selector
+                groups.append(tuple(selectors))
+        return groups
+
     async def _extract_raw(self, page: Page) -> Dict[str, Any]:
         """Extract raw data from page using schema."""
         result: Dict[str, Any] = {}
@@ -282,6 +310,9 @@ class HybridExtractor:
         self.use_llm_fallback = use_llm_fallback
         self._mcp = mcp_backend
 
+    def required_selectors(self) -> List[Tuple[str, ...]]:
+        return self.spec_extractor.required_selectors()
+
     def _get_mcp(self):
         if self._mcp is not None:
             return self._mcp
@@ -14,6 +14,10 @@ class WorkflowExecutor:
         final_data = None
 
         workflow.context["scraper"] = engine
+        if getattr(engine, "frontier", None) is not None:
+            workflow.context.setdefault("frontier", engine.frontier)
+        if getattr(engine, "sink", None) is not None:
+            workflow.context.setdefault("sink", engine.sink)
 
         for step in workflow.steps:
             if not step.should_execute(workflow.context):
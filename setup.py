@@ -26,13 +26,18 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "playwright>=1.40.0",
+        "playwright>=1.41.0",
         "aiohttp>=3.9.0",
         "tenacity>=8.2.0",
         "pydantic>=2.0.0",
         "mistralai>=1.0.0",
         "python-dotenv>=1.0.0",
     ],
+    extras_require={
+        "http": ["selectolax>=0.3.21", "Brotli>=1.1.0"],
+        "parquet": ["pyarrow>=12.0.0"],
+        "redis": ["redis>=4.2.0"],
+    },
     include_package_data=True,
 )
 
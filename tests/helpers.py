@@ -0,0 +1,177 @@
+"""Shared fakes for engine-level tests: stand-ins for every injected port."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.http_runtime import StaticPage
+
+
+class FakeRuntime:
+    def __init__(self):
+        self.page = object()
+        self.started = False
+        self.closed = False
+        self.goto_calls = 0
+        self.last_goto = None
+
+    async def start(self) -> None:
+        self.started = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def goto(self, url: str, wait_until: str, timeout: int, page=None) -> None:
+        self.goto_calls += 1
+        self.last_goto = (url, wait_until, timeout)
+        if page is not None:
+            page.url = url
+            await asyncio.sleep(0.01)
+
+
+class FakePage:
+    def __init__(self):
+        self.url = "about:blank"
+
+
+class PooledFakeRuntime(FakeRuntime):
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @asynccontextmanager
+    async def acquire_page(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            yield FakePage()
+        finally:
+            self.in_flight -= 1
+
+
+class FakeRateLimiter:
+    def __init__(self):
+        self.acquire_calls = 0
+
+    async def acquire(self) -> None:
+        self.acquire_calls += 1
+
+
+class KeyedFakeRateLimiter(FakeRateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+        self.costs = []
+
+    async def acquire(self, key=None, cost=1.0) -> None:
+        self.acquire_calls += 1
+        self.keys.append(key)
+        self.costs.append(cost)
+
+
+class FakeRetryHandler:
+    async def execute_with_retry(self, func, retryable_exceptions=None):
+        return await func()
+
+
+class FakeLogger:
+    def debug(self, message: str, **kwargs):
+        pass
+
+    def info(self, message: str, **kwargs):
+        pass
+
+    def warning(self, message: str, **kwargs):
+        pass
+
+    def error(self, message: str, **kwargs):
+        pass
+
+
+class FakeMonitor:
+    def __init__(self):
+        self.success = 0
+        self.failure = 0
+        self.counters = {}
+        self.gauges = {}
+
+    def start_request(self) -> float:
+        return 0.0
+
+    def end_request(self, start_time: float, success: bool, error=None) -> None:
+        if success:
+            self.success += 1
+        else:
+            self.failure += 1
+
+    def record_retry(self) -> None:
+        pass
+
+    def increment(self, name: str, value: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def get_metrics(self):
+        return {"success": self.success, "failure": self.failure}
+
+    def reset(self):
+        self.success = 0
+        self.failure = 0
+
+
+class FakeRobotsChecker:
+    def __init__(self, allowed: bool, crawl_delay=None):
+        self.allowed = allowed
+        self.crawl_delay = crawl_delay
+
+    async def can_fetch(self, url: str) -> bool:
+        return self.allowed
+
+    async def get_crawl_delay(self, url: str):
+        return self.crawl_delay
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+
+class StatusRuntime(FakeRuntime):
+    """Runtime returning a scripted sequence of responses."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+
+    async def goto(self, url, wait_until, timeout, page=None):
+        await super().goto(url, wait_until, timeout, page=page)
+        return self.responses.pop(0)
+
+
+class LoopingSite:
+    """Engine stand-in whose 'next' links cycle 1 -> 2 -> 1."""
+
+    def __init__(self, frontier=None):
+        self.frontier = frontier
+        self.visited = []
+        self.page = StaticPage()
+
+    async def navigate(self, url):
+        self.visited.append(url)
+        target = "/2" if url.endswith("/1") else "/1?utm_source=loop"
+        self.page.set_content(f'<a class="next" href="{target}">next</a>', url)
+
+
+def make_scraper(runtime, allowed=True, monitor=None, limiter=None):
+    return ScrapeFlow(
+        runtime=runtime,
+        rate_limiter=limiter or FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=monitor or FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=allowed),
+    )
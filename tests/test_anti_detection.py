@@ -0,0 +1,37 @@
+"""Tests for stealth script bundling."""
+
+import pytest
+
+from scrapeflow.anti_detection import AntiDetectionManager, StealthMode
+from scrapeflow.config import AntiDetectionConfig
+
+
+class ScriptRecorder:
+    def __init__(self):
+        self.scripts = []
+
+    async def add_init_script(self, script):
+        self.scripts.append(script)
+
+
+def test_bundle_contains_every_patch_in_isolated_blocks():
+    bundle = StealthMode.bundle()
+    assert bundle.count("try {") == len(StealthMode.PATCHES)
+    for body in StealthMode.PATCHES.values():
+        assert body in bundle
+
+
+@pytest.mark.asyncio
+async def test_context_stealth_is_a_single_registration():
+    context = ScriptRecorder()
+    await AntiDetectionManager(AntiDetectionConfig()).apply_stealth_to_context(context)
+    assert context.scripts == [StealthMode.bundle()]
+
+
+@pytest.mark.asyncio
+async def test_stealth_disabled_registers_nothing():
+    context = ScriptRecorder()
+    manager = AntiDetectionManager(AntiDetectionConfig(stealth_mode=False))
+    await manager.apply_stealth_to_context(context)
+    await manager.apply_stealth(context)
+    assert context.scripts == []
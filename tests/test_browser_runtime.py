@@ -0,0 +1,172 @@
+"""Tests for PlaywrightBrowserRuntime request routing (no browser required)."""
+
+import pytest
+
+from scrapeflow.anti_detection import AntiDetectionManager
+from scrapeflow.browser_runtime import PlaywrightBrowserRuntime
+from scrapeflow.config import BrowserConfig, ScrapeFlowConfig
+from scrapeflow.monitoring import PerformanceMonitor
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str = "document", method: str = "GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = {}
+
+    async def all_headers(self):
+        return dict(self.headers)
+
+
+class FakeRoute:
+    def __init__(self, request: FakeRequest):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self, error_code: str = "failed") -> None:
+        self.outcome = ("abort", error_code)
+
+    async def continue_(self, **kwargs) -> None:
+        self.outcome = ("continue", kwargs)
+
+
+class FakeAPIResponse:
+    def __init__(self, status, headers, body=b""):
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class OriginRoute(FakeRoute):
+    """Route whose fetch() is answered by an origin function of the request headers."""
+
+    def __init__(self, request: FakeRequest, origin):
+        super().__init__(request)
+        self.origin = origin
+        self.fetched_with = []
+
+    async def fetch(self, headers=None, max_redirects=None):
+        self.fetched_with.append(headers)
+        response = self.origin(headers or {})
+        # Like Playwright, follow redirects unless told not to.
+        while max_redirects != 0 and response.status in (301, 302, 303, 307, 308):
+            response = self.origin({**(headers or {}), "url": response.headers["location"]})
+        return response
+
+    async def fulfill(self, status=200, headers=None, body=b"", **kwargs):
+        self.outcome = ("fulfill", status, body)
+        self.fulfilled_headers = headers or {}
+
+
+def _runtime(**browser_kwargs):
+    config = ScrapeFlowConfig(browser=BrowserConfig(**browser_kwargs))
+    monitor = PerformanceMonitor()
+    runtime = PlaywrightBrowserRuntime(
+        config, AntiDetectionManager(config.anti_detection), monitor=monitor
+    )
+    return runtime, monitor
+
+
+@pytest.mark.asyncio
+async def test_blocks_configured_resource_types_and_counts_them():
+    runtime, monitor = _runtime(block_resource_types=["image", "font"])
+
+    image = FakeRoute(FakeRequest("https://shop.example/a.png", "image"))
+    doc = FakeRoute(FakeRequest("https://shop.example/", "document"))
+    await runtime._handle_route(image)
+    await runtime._handle_route(doc)
+
+    assert image.outcome[0] == "abort"
+    assert doc.outcome[0] == "continue"
+    counters = monitor.get_metrics().counters
+    assert counters["blocked_requests"] == 1
+    assert counters["blocked_requests.image"] == 1
+
+
+@pytest.mark.asyncio
+async def test_blocks_url_patterns():
+    runtime, monitor = _runtime(blocked_url_patterns=["*doubleclick.net*", "*.mp4"])
+
+    tracker = FakeRoute(FakeRequest("https://ad.doubleclick.net/pixel", "script"))
+    video = FakeRoute(FakeRequest("https://cdn.example/clip.mp4", "media"))
+    script = FakeRoute(FakeRequest("https://shop.example/app.js", "script"))
+    for route in (tracker, video, script):
+        await runtime._handle_route(route)
+
+    assert [r.outcome[0] for r in (tracker, video, script)] == ["abort", "abort", "continue"]
+    assert monitor.get_metrics().counters["blocked_requests"] == 2
+
+
+def test_blocking_disabled_by_default():
+    runtime, _ = _runtime()
+    assert runtime._blocking_enabled is False
+
+
+@pytest.mark.asyncio
+async def test_http_cache_serves_fresh_and_revalidates_stale(tmp_path):
+    runtime, monitor = _runtime(http_cache_dir=str(tmp_path))
+
+    def origin(headers):
+        if headers.get("if-none-match") == '"v1"':
+            return FakeAPIResponse(304, {"etag": '"v1"', "cache-control": "max-age=0"})
+        return FakeAPIResponse(200, {"etag": '"v1"', "cache-control": "max-age=0"}, b"<html>")
+
+    def request():
+        return OriginRoute(FakeRequest("https://shop.example/"), origin)
+
+    first, second = request(), request()
+    await runtime._handle_route(first)
+    await runtime._handle_route(second)
+
+    assert first.outcome == ("fulfill", 200, b"<html>")
+    assert second.outcome == ("fulfill", 200, b"<html>")
+    assert second.fetched_with[0]["if-none-match"] == '"v1"'
+    counters = monitor.get_metrics().counters
+    assert counters["cache_misses"] == 1
+    assert counters["cache_revalidations"] == 1
+
+    runtime.http_cache.store(
+        "https://shop.example/fresh", {}, 200, {"cache-control": "max-age=60"}, b"cached"
+    )
+    fresh = request()
+    fresh.request.url = "https://shop.example/fresh"
+    await runtime._handle_route(fresh)
+    assert fresh.outcome == ("fulfill", 200, b"cached")
+    assert fresh.fetched_with == []
+    assert monitor.get_metrics().counters["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_http_cache_hands_redirects_to_the_browser(tmp_path):
+    runtime, monitor = _runtime(http_cache_dir=str(tmp_path))
+    chain = {
+        "https://shop.example/old": FakeAPIResponse(
+            301, {"location": "https://shop.example/mid", "cache-control": "max-age=60"}
+        ),
+        "https://shop.example/mid": FakeAPIResponse(302, {"location": "https://www.example/new"}),
+        "https://www.example/new": FakeAPIResponse(
+            200, {"cache-control": "max-age=60"}, b"<new>"
+        ),
+    }
+
+    def navigate(url):
+        return OriginRoute(FakeRequest(url), lambda headers: chain[headers.get("url", url)])
+
+    # The browser follows each Location itself, so every hop is its own request.
+    hops = [navigate(url) for url in chain]
+    for hop in hops:
+        await runtime._handle_route(hop)
+    assert [hop.outcome[1] for hop in hops] == [301, 302, 200]
+    assert hops[0].fulfilled_headers["location"] == "https://shop.example/mid"
+    assert hops[2].outcome[2] == b"<new>"
+
+    # The permanent redirect is cached under its own URL, not the final body.
+    again = navigate("https://shop.example/old")
+    await runtime._handle_route(again)
+    assert again.outcome == ("fulfill", 301, b"")
+    assert again.fetched_with == []
+    assert monitor.get_metrics().counters["cache_hits"] == 1
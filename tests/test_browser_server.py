@@ -0,0 +1,150 @@
+"""Tests for the shared browser server lifecycle (no browser required)."""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from scrapeflow.browser_server import BrowserServer, _process_start_time
+from scrapeflow.exceptions import ScrapeFlowError
+
+DEAD_PID = 2 ** 22 + 12345
+
+
+class FakeProcess:
+    def __init__(self, pid, returncode=None):
+        self.pid = pid
+        self.returncode = returncode
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+class RecordingServer(BrowserServer):
+    """BrowserServer whose spawn writes a fake endpoint instead of launching a browser."""
+
+    def __init__(self, *args, endpoint="ws://127.0.0.1:1/fresh", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.endpoint = endpoint
+        self.spawned = 0
+
+    def _spawn(self, config_path, log_file):
+        self.spawned += 1
+        if self.endpoint:
+            log_file.write(f"{self.endpoint}\n")
+            log_file.flush()
+            return FakeProcess(os.getpid())
+        return FakeProcess(DEAD_PID, returncode=1)
+
+
+def test_reuses_healthy_server_from_state_file(tmp_path):
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    port = listener.getsockname()[1]
+    state_path = str(tmp_path / "server.json")
+    with open(state_path, "w") as f:
+        json.dump(
+            {
+                "pid": os.getpid(),
+                "started": _process_start_time(os.getpid()),
+                "ws_endpoint": f"ws://127.0.0.1:{port}/abc",
+            },
+            f,
+        )
+
+    try:
+        server = RecordingServer(state_path=state_path)
+        assert server.ensure() == f"ws://127.0.0.1:{port}/abc"
+        assert server.spawned == 0
+    finally:
+        listener.close()
+
+
+def test_relaunches_when_recorded_server_is_dead(tmp_path):
+    state_path = str(tmp_path / "server.json")
+    with open(state_path, "w") as f:
+        json.dump({"pid": DEAD_PID, "ws_endpoint": "ws://127.0.0.1:1/old"}, f)
+
+    server = RecordingServer(state_path=state_path, launch_options={"headless": True})
+
+    assert server.ensure() == "ws://127.0.0.1:1/fresh"
+    assert server.spawned == 1
+    assert server.ws_endpoint == "ws://127.0.0.1:1/fresh"
+    with open(f"{state_path}.config") as f:
+        assert json.load(f) == {"headless": True}
+
+
+def test_launch_failure_raises(tmp_path):
+    server = RecordingServer(state_path=str(tmp_path / "s.json"), endpoint=None, startup_timeout=1)
+    with pytest.raises(ScrapeFlowError):
+        server.ensure()
+
+
+def test_never_signals_a_reused_pid(tmp_path):
+    # The recorded pid is alive but is not the server that was launched (e.g. after a reboot).
+    state_path = str(tmp_path / "server.json")
+    with open(state_path, "w") as f:
+        json.dump({"pid": os.getpid(), "started": "0", "ws_endpoint": "ws://127.0.0.1:1/x"}, f)
+
+    server = RecordingServer(state_path=state_path)
+    assert not server.is_healthy()
+    assert server.ensure() == "ws://127.0.0.1:1/fresh"  # relaunched; this process survived
+    assert server.spawned == 1
+
+
+def test_terminates_the_recorded_server_process_group(tmp_path):
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"], start_new_session=True
+    )
+    try:
+        state = {"pid": process.pid, "started": _process_start_time(process.pid)}
+        BrowserServer._terminate({**state, "started": "0"})
+        assert process.poll() is None
+        BrowserServer._terminate(state)
+        assert process.wait(timeout=5) != 0
+    finally:
+        process.kill()
+
+
+def test_server_exiting_during_startup_is_reaped(tmp_path):
+    class ExitingServer(BrowserServer):
+        def _spawn(self, config_path, log_file):
+            self.process = subprocess.Popen([sys.executable, "-c", "pass"], stdout=log_file)
+            return self.process
+
+    server = ExitingServer(state_path=str(tmp_path / "s.json"), startup_timeout=60)
+    with pytest.raises(ScrapeFlowError):
+        server.ensure()
+    assert server.process.returncode == 0  # polled, so no zombie is left behind
+
+
+def test_ignores_state_files_owned_by_another_user(tmp_path, monkeypatch):
+    state_path = str(tmp_path / "server.json")
+    with open(state_path, "w") as f:
+        json.dump({"pid": os.getpid(), "ws_endpoint": "ws://attacker.example:1/x"}, f)
+
+    server = RecordingServer(state_path=state_path)
+    assert server.ws_endpoint == "ws://attacker.example:1/x"
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(state_path).st_uid + 1)
+    assert server.ws_endpoint is None
+
+
+def test_default_state_file_is_in_a_private_per_user_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    state_dir = os.path.dirname(BrowserServer().state_path)
+
+    assert state_dir == str(tmp_path / f"scrapeflow-{os.getuid()}")
+    assert os.stat(state_dir).st_mode & 0o077 == 0
+    os.chmod(state_dir, 0o777)
+    with pytest.raises(ScrapeFlowError):
+        BrowserServer()
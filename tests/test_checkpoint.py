@@ -0,0 +1,104 @@
+"""Tests for SQLite crawl checkpoints and resume."""
+
+import pytest
+from pydantic import BaseModel
+
+from scrapeflow.checkpoint import CrawlCheckpoint
+from scrapeflow.config import ScrapeFlowConfig
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import ScrapeFlowHTTPError
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    PooledFakeRuntime,
+)
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_claim_finish_and_reopen(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    checkpoint = CrawlCheckpoint(path, "job-1", batch_size=2)
+    assert checkpoint.claim("https://a.example/1")
+    assert checkpoint.claim("https://a.example/2", priority=5)
+    assert not checkpoint.claim("https://A.example/1#dup")  # same session, same canonical URL
+    checkpoint.mark_done("https://a.example/1", Item(name="x"))
+    checkpoint.close()
+
+    reopened = CrawlCheckpoint(path, "job-1")
+    assert reopened.stats() == {"queued": 1, "done": 1, "failed": 0, "retry": 0}
+    assert list(reopened.results()) == [("https://a.example/1", {"name": "x"})]
+    assert list(reopened.pending_urls()) == ["https://a.example/2"]
+    assert not reopened.claim("https://a.example/1")  # finished by the earlier session
+    assert reopened.claim("https://a.example/2")  # left queued by the earlier session
+    reopened.close()
+
+
+def test_transient_failures_are_claimed_again_on_resume(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    checkpoint = CrawlCheckpoint(path, "job")
+    assert checkpoint.claim_many(["https://a.example/1", "https://a.example/2"]) == [
+        "https://a.example/1",
+        "https://a.example/2",
+    ]
+    checkpoint.mark_failed("https://a.example/1", ScrapeFlowHTTPError("HTTP 503", 503))
+    checkpoint.mark_failed("https://a.example/2", ScrapeFlowHTTPError("HTTP 404", 404))
+    assert not checkpoint.claim("https://a.example/1")  # not within the same session
+    checkpoint.close()
+
+    reopened = CrawlCheckpoint(path, "job")
+    assert reopened.stats() == {"queued": 0, "done": 0, "failed": 1, "retry": 1}
+    assert list(reopened.pending_urls()) == ["https://a.example/1"]
+    assert reopened.claim_many(["https://a.example/1", "https://a.example/2"]) == [
+        "https://a.example/1"
+    ]
+    reopened.close()
+
+
+def test_pending_urls_pages_through_large_queues(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "jobs.db"), "job", batch_size=1000)
+    urls = [f"https://a.example/{i}" for i in range(25)]
+    for url in urls:
+        checkpoint.claim(url)
+
+    assert sorted(checkpoint.pending_urls(chunk_size=10)) == sorted(urls)
+    checkpoint.close()
+
+
+@pytest.mark.asyncio
+async def test_crawl_many_resumes_after_interruption(tmp_path):
+    config = ScrapeFlowConfig(checkpoint_path=str(tmp_path / "crawl.db"))
+    runtime = PooledFakeRuntime()
+    scraper = ScrapeFlow(
+        config,
+        runtime=runtime,
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+    urls = [f"https://a.example/{i}" for i in range(10)]
+
+    async def extract(page, context):
+        return {"url": context["url"]}
+
+    crawl = scraper.crawl_many(urls, extract, concurrency=2, lookahead=4, job_id="nightly")
+    first = [await crawl.__anext__() for _ in range(3)]
+    await crawl.aclose()  # simulated crash: in-flight URLs stay queued
+
+    resumed = [r async for r in scraper.resume("nightly", extract, urls=urls, concurrency=2)]
+
+    done_first = {r.url for r in first}
+    assert {r.url for r in resumed} == set(urls) - done_first
+    assert len(resumed) == len(urls) - len(first)
+    checkpoint = CrawlCheckpoint(config.checkpoint_path, "nightly")
+    assert checkpoint.stats() == {"queued": 0, "done": 10, "failed": 0, "retry": 0}
+    assert checkpoint.finished
+    assert dict(checkpoint.results())["https://a.example/0"] == {"url": "https://a.example/0"}
+    checkpoint.close()
@@ -0,0 +1,99 @@
+"""Tests for Arrow schema derivation and incremental Parquet export."""
+
+import datetime
+import enum
+from typing import Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from scrapeflow.specifications import JobListingSpec, ProductPriceSpec
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from scrapeflow.columnar import ParquetExporter, ParquetSink, model_arrow_schema  # noqa: E402
+
+
+class Currency(enum.Enum):
+    EUR = "EUR"
+    USD = "USD"
+
+
+class Seller(BaseModel):
+    name: str
+    rating: Optional[float] = None
+
+
+class Offer(BaseModel):
+    sku: str = Field(..., description="Stock keeping unit")
+    price: float
+    currency: Currency
+    seen_at: datetime.datetime
+    tags: List[str] = []
+    seller: Optional[Seller] = None
+    raw: Dict[str, int] = {}
+
+
+def test_schema_follows_model_types_and_nullability():
+    schema = model_arrow_schema(Offer)
+    assert schema.field("sku").type == pa.string()
+    assert not schema.field("sku").nullable
+    assert schema.field("sku").metadata == {b"description": b"Stock keeping unit"}
+    assert schema.field("price").type == pa.float64()
+    assert schema.field("currency").type == pa.string()
+    assert schema.field("seen_at").type == pa.timestamp("us")
+    assert schema.field("tags").type == pa.list_(pa.string())
+    assert schema.field("seller").type == pa.struct(
+        [pa.field("name", pa.string(), nullable=False), pa.field("rating", pa.float64())]
+    )
+    assert schema.field("seller").nullable
+    assert schema.field("raw").type == pa.string()  # JSON-encoded
+
+    jobs = model_arrow_schema(JobListingSpec)
+    assert jobs.names == ["title", "company", "location", "url", "description"]
+    assert not jobs.field("title").nullable and jobs.field("company").nullable
+
+
+def test_exporter_writes_one_row_group_per_batch(tmp_path):
+    path = str(tmp_path / "products.parquet")
+    with ParquetExporter(path, ProductPriceSpec) as exporter:
+        exporter.write_batch(ProductPriceSpec(title=f"p{i}", price="1.00") for i in range(3))
+        exporter.write_batch([{"title": "dict", "price": "2.00", "url": "https://a.example"}])
+        exporter.write_batch([])
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    table = parquet.read()
+    assert table.column("title").to_pylist() == ["p0", "p1", "p2", "dict"]
+    assert table.column("url").to_pylist() == [None, None, None, "https://a.example"]
+    assert exporter.rows_written == 4
+
+
+@pytest.mark.asyncio
+async def test_parquet_sink_streams_nested_items(tmp_path):
+    path = str(tmp_path / "offers.parquet")
+    seen_at = datetime.datetime(2024, 5, 1, 12, 30)
+    async with ParquetSink(path, Offer, batch_size=2) as sink:
+        for i in range(5):
+            await sink.put(
+                Offer(
+                    sku=f"s{i}",
+                    price=i + 0.5,
+                    currency=Currency.EUR,
+                    seen_at=seen_at,
+                    tags=["new"],
+                    seller=Seller(name="shop") if i % 2 else None,
+                    raw={"views": i},
+                )
+            )
+
+    table = pq.read_table(path)
+    assert table.num_rows == 5
+    rows = table.to_pylist()
+    assert rows[1]["currency"] == "EUR"
+    assert rows[1]["seen_at"] == seen_at
+    assert rows[1]["seller"] == {"name": "shop", "rating": None}
+    assert rows[0]["seller"] is None
+    assert rows[3]["raw"] == '{"views": 3}'
+    assert pq.ParquetFile(path).metadata.num_row_groups >= 3
@@ -0,0 +1,151 @@
+"""Tests for the latency-driven per-host concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from scrapeflow.concurrency import AdaptiveConcurrencyLimiter
+from scrapeflow.config import ConcurrencyLimitConfig, ScrapeFlowConfig
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import ScrapeFlowTimeoutError
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    PooledFakeRuntime,
+)
+
+
+async def simulate(limiter, capacity, workers=64, requests=3000):
+    """Host whose RTT grows once more than `capacity` requests are in flight."""
+    remaining = [requests]
+
+    async def worker():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            in_flight = await limiter.acquire("h")
+            await asyncio.sleep(0)
+            # Queueing delay set by the load the request arrived into.
+            rtt = 0.1 * max(1.0, in_flight / capacity)
+            limiter.release("h", rtt=rtt, in_flight=in_flight)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+@pytest.mark.asyncio
+async def test_limit_converges_near_server_capacity():
+    monitor = FakeMonitor()
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=2), monitor=monitor)
+    await simulate(limiter, capacity=8)
+    assert 6 <= limiter.limit("h") <= 20
+    assert limiter.limits() == {"h": limiter.limit("h")}
+    assert limiter.rtts()["h"] >= 0.1
+    assert monitor.gauges["concurrency.limit.h"] == limiter.limit("h")
+    assert monitor.gauges["concurrency.rtt_ms.h"] == pytest.approx(limiter.rtts()["h"] * 1000)
+    assert monitor.counters["concurrency.increases"] > 0
+    assert monitor.counters["concurrency.waits"] > 0
+
+
+@pytest.mark.asyncio
+async def test_host_gauges_are_bounded_and_means_cover_every_host():
+    monitor = FakeMonitor()
+    config = ConcurrencyLimitConfig(initial_limit=4, max_host_gauges=2)
+    limiter = AdaptiveConcurrencyLimiter(config, monitor=monitor)
+    for i in range(5):
+        in_flight = await limiter.acquire(f"h{i}")
+        limiter.release(f"h{i}", rtt=0.05 * (i + 1), in_flight=in_flight)
+
+    assert sorted(k for k in monitor.gauges if k.startswith("concurrency.limit.")) == [
+        "concurrency.limit.h0",
+        "concurrency.limit.h1",
+    ]
+    limiter._means_published = float("-inf")  # next release refreshes the means
+    in_flight = await limiter.acquire("h0")
+    limiter.release("h0", in_flight=in_flight)
+    assert monitor.gauges["concurrency.hosts"] == 5
+    assert monitor.gauges["concurrency.mean_limit"] == 4
+    assert monitor.gauges["concurrency.mean_rtt_ms"] == pytest.approx(150)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_never_exceeds_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=3, max_limit=3))
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.slot("h"):
+            peak = max(peak, limiter.in_flight("h"))
+            await asyncio.sleep(0.001)
+
+    await asyncio.gather(*(request() for _ in range(30)))
+    assert peak == 3
+    assert limiter.in_flight("h") == 0
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_drops_shrink_the_limit():
+    monitor = FakeMonitor()
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=10), monitor=monitor)
+    with pytest.raises(ScrapeFlowTimeoutError):
+        async with limiter.slot("h"):
+            raise ScrapeFlowTimeoutError("slow")
+    assert limiter.limit("h") == 9
+    async with limiter.slot("h") as slot:
+        slot.drop()
+    assert limiter.limit("h") == 8
+    with pytest.raises(ValueError):
+        async with limiter.slot("h"):
+            raise ValueError("parse error")  # not a latency signal
+    assert limiter.limit("h") == 8
+    assert monitor.counters["concurrency.drops"] == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_hosts_do_not_grow():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=4))
+    for _ in range(100):
+        in_flight = await limiter.acquire("h")
+        limiter.release("h", rtt=0.05, in_flight=in_flight)
+    assert limiter.limit("h") == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimitConfig(initial_limit=1))
+    await limiter.acquire("h")
+    waiter = asyncio.ensure_future(limiter.acquire("h"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release("h")
+    assert limiter.in_flight("h") == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_limits_navigation_per_host():
+    config = ScrapeFlowConfig()
+    config.concurrency_limit = ConcurrencyLimitConfig(enabled=True, initial_limit=2, max_limit=2)
+    runtime = PooledFakeRuntime()
+    monitor = FakeMonitor()
+    scraper = ScrapeFlow(
+        config,
+        runtime=runtime,
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=monitor,
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+    urls = [f"https://example.com/{i}" for i in range(8)]
+
+    async def extract(page, context):
+        return page.url
+
+    results = [r async for r in scraper.crawl_many(urls, extract, concurrency=8)]
+    assert all(r.success for r in results)
+    assert scraper.concurrency_limiter.in_flight("example.com") == 0
+    assert monitor.counters["concurrency.waits"] > 0
@@ -4,85 +4,17 @@ import pytest
 
 from scrapeflow.engine import ScrapeFlow
 from scrapeflow.exceptions import ScrapeFlowRobotsDisallowedError
-
-
-class FakeRuntime:
-    def __init__(self):
-        self.page = object()
-        self.started = False
-        self.closed = False
-        self.goto_calls = 0
-        self.last_goto = None
-
-    async def start(self) -> None:
-        self.started = True
-
-    async def close(self) -> None:
-        self.closed = True
-
-    async def goto(self, url: str, wait_until: str, timeout: int) -> None:
-        self.goto_calls += 1
-        self.last_goto = (url, wait_until, timeout)
-
-
-class FakeRateLimiter:
-    def __init__(self):
-        self.acquire_calls = 0
-
-    async def acquire(self) -> None:
-        self.acquire_calls += 1
-
-
-class FakeRetryHandler:
-    async def execute_with_retry(self, func, retryable_exceptions=None):
-        return await func()
-
-
-class FakeLogger:
-    def debug(self, message: str, **kwargs):
-        pass
-
-    def info(self, message: str, **kwargs):
-        pass
-
-    def warning(self, message: str, **kwargs):
-        pass
-
-    def error(self, message: str, **kwargs):
-        pass
-
-
-class FakeMonitor:
-    def __init__(self):
-        self.success = 0
-        self.failure = 0
-
-    def start_request(self) -> float:
-        return 0.0
-
-    def end_request(self, start_time: float, success: bool, error=None) -> None:
-        if success:
-            self.success += 1
-        else:
-            self.failure += 1
-
-    def record_retry(self) -> None:
-        pass
-
-    def get_metrics(self):
-        return {"success": self.success, "failure": self.failure}
-
-    def reset(self):
-        self.success = 0
-        self.failure = 0
-
-
-class FakeRobotsChecker:
-    def __init__(self, allowed: bool):
-        self.allowed = allowed
-
-    async def can_fetch(self, url: str) -> bool:
-        return self.allowed
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    FakeRuntime,
+    KeyedFakeRateLimiter,
+    PooledFakeRuntime,
+    make_scraper,
+)
 
 
 @pytest.mark.asyncio
@@ -123,3 +55,48 @@ async def test_navigate_uses_injected_components():
     assert runtime.goto_calls == 1
     assert runtime.last_goto[0] == "https://example.com/path"
     assert monitor.success == 1
+
+
+@pytest.mark.asyncio
+async def test_navigate_passes_the_host_to_keyed_limiters():
+    limiter = KeyedFakeRateLimiter()
+    scraper = make_scraper(FakeRuntime(), limiter=limiter)
+
+    await scraper.navigate("https://Example.com/path")
+
+    assert limiter.keys == ["example.com"]
+    assert limiter.costs == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_crawl_many_bounds_concurrency_and_yields_all_results():
+    runtime = PooledFakeRuntime()
+    limiter = FakeRateLimiter()
+    monitor = FakeMonitor()
+    scraper = make_scraper(runtime, monitor=monitor, limiter=limiter)
+    urls = [f"https://example.com/{i}" for i in range(10)]
+
+    async def extract(page, context):
+        return {"url": page.url, "ctx": context["url"]}
+
+    results = [r async for r in scraper.crawl_many(urls, extract, concurrency=3)]
+
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert all(r.success and r.data["url"] == r.url == r.data["ctx"] for r in results)
+    assert runtime.max_in_flight == 3
+    assert limiter.acquire_calls == 10
+    assert monitor.success == 10
+
+
+@pytest.mark.asyncio
+async def test_crawl_many_reports_failures_without_stopping():
+    runtime = PooledFakeRuntime()
+    scraper = make_scraper(runtime, allowed=False)
+
+    results = [
+        r async for r in scraper.crawl_many(["https://example.com/a"], lambda page, ctx: None)
+    ]
+
+    assert len(results) == 1
+    assert isinstance(results[0].error, ScrapeFlowRobotsDisallowedError)
+    assert runtime.goto_calls == 0
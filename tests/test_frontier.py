@@ -0,0 +1,73 @@
+"""Tests for the URL frontier."""
+
+import pytest
+
+from scrapeflow.frontier import BloomFilter, URLFrontier, canonicalize_url
+from scrapeflow.pagination import paginate
+from scrapeflow.registry import PaginationHandler
+from tests.helpers import LoopingSite
+
+
+def test_canonicalize_url_normalizes_equivalent_spellings():
+    canonical = "https://shop.example/items?color=red&page=2"
+    assert canonicalize_url("HTTPS://Shop.Example:443/items?page=2&color=red#reviews") == canonical
+    assert canonicalize_url(
+        "https://shop.example/items?utm_source=x&page=2&gclid=abc&color=red&fbclid=y"
+    ) == canonical
+    assert canonicalize_url("http://shop.example") == "http://shop.example/"
+    assert canonicalize_url("http://shop.example:8080/a") == "http://shop.example:8080/a"
+    assert canonicalize_url("https://a.example/?sid=1&q=x", strip_params=["SID"]) == (
+        "https://a.example/?q=x"
+    )
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"https://a.example/{i}")
+
+    assert all(f"https://a.example/{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"https://b.example/{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+    assert bloom.size_bytes < 13_000  # ~1.2 bytes per URL
+
+
+def test_frontier_dedupes_canonical_urls_and_pops_by_priority():
+    frontier = URLFrontier(capacity=1_000, recent_size=2)
+    assert frontier.add("https://a.example/low")
+    assert frontier.add("https://a.example/high", priority=10)
+    assert not frontier.add("https://A.example/high#top")
+    assert frontier.add("https://a.example/mid", priority=5)
+    # Evicted from the exact recent set but still caught by the Bloom filter.
+    assert frontier.seen("https://a.example/low")
+    assert not frontier.add("https://a.example/low?utm_medium=email")
+
+    assert list(frontier) == [
+        "https://a.example/high",
+        "https://a.example/mid",
+        "https://a.example/low",
+    ]
+    assert frontier.duplicates == 2
+    assert frontier.visit("https://a.example/new")
+    assert not frontier.visit("https://a.example/new")
+
+
+@pytest.mark.asyncio
+async def test_paginate_stops_when_next_link_revisits_a_page():
+    pytest.importorskip("selectolax")
+    engine = LoopingSite(frontier=URLFrontier(capacity=1_000))
+
+    async def extract(page, context):
+        return context["url"]
+
+    pages = [
+        url
+        async for url in paginate(
+            engine,
+            "https://a.example/1",
+            PaginationHandler(name="loop", next_selector="a.next"),
+            extract,
+        )
+    ]
+
+    assert pages == ["https://a.example/1", "https://a.example/2"]
@@ -0,0 +1,119 @@
+"""Tests for offline HAR replay."""
+
+import base64
+import json
+import zipfile
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import ScrapeFlowError
+from scrapeflow.har import HarArchive, HarReplayRuntime
+from scrapeflow.schema_library import product_price_item_spec
+from scrapeflow.specifications import ProductPriceSpec, SpecificationExtractor
+from scrapeflow.monitoring import PerformanceMonitor
+from tests.helpers import (
+    FakeLogger,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+)
+
+pytest.importorskip("selectolax")
+
+LISTING = """
+<html><head><title>Books</title></head><body>
+  <article class="product_pod">
+    <h3><a href="/catalogue/a" title="A Light in the Attic">A Light...</a></h3>
+    <p class="price_color">£51.77</p>
+  </article>
+</body></html>
+"""
+
+
+class Listing(BaseModel):
+    products: List[ProductPriceSpec]
+
+
+def _entry(url, status, content, headers=None, redirect=""):
+    return {
+        "request": {"method": "GET", "url": url, "headers": []},
+        "response": {
+            "status": status,
+            "headers": [{"name": k, "value": v} for k, v in (headers or {}).items()],
+            "content": content,
+            "redirectURL": redirect,
+        },
+    }
+
+
+def _write_har(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"log": {"version": "1.2", "entries": entries}}, f)
+    return str(path)
+
+
+def _engine(runtime):
+    return ScrapeFlow(
+        runtime=runtime,
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=PerformanceMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+
+
+@pytest.mark.asyncio
+async def test_replays_recorded_documents_through_extractors(tmp_path):
+    har_path = _write_har(
+        tmp_path / "crawl.har",
+        [
+            _entry("https://books.example/", 301, {"text": ""}, redirect="/index.html"),
+            _entry(
+                "https://books.example/index.html",
+                200,
+                {
+                    "mimeType": "text/html",
+                    "encoding": "base64",
+                    "text": base64.b64encode(LISTING.encode("utf-8")).decode("ascii"),
+                },
+                {"Content-Type": "text/html"},
+            ),
+        ],
+    )
+    extractor = SpecificationExtractor(Listing, schema={"products": product_price_item_spec()})
+
+    async with _engine(HarReplayRuntime(har_path)) as scraper:
+        result = await scraper.extract("https://books.example/#top", extractor)
+        response = await scraper.navigate("https://books.example/")
+
+    assert [p.title for p in result.products] == ["A Light in the Attic"]
+    assert result.products[0].url == "https://books.example/catalogue/a"
+    assert response.url == "https://books.example/index.html"
+    assert response.headers["content-type"] == "text/html"
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_urls_fail_without_network(tmp_path):
+    runtime = HarReplayRuntime(_write_har(tmp_path / "empty.har", []))
+    await runtime.start()
+    try:
+        with pytest.raises(ScrapeFlowError):
+            await runtime.goto("https://books.example/missing")
+    finally:
+        await runtime.close()
+
+
+def test_reads_attached_bodies_from_zip_archives(tmp_path):
+    har = {"log": {"entries": [_entry("https://a.example/", 200, {"_file": "abc.html"})]}}
+    path = tmp_path / "crawl.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("har.har", json.dumps(har))
+        zf.writestr("abc.html", "<p>hi</p>")
+
+    archive = HarArchive(str(path))
+    assert archive.body(archive.get("https://a.example/")) == b"<p>hi</p>"
+    archive.close()
@@ -0,0 +1,118 @@
+"""Tests for the on-disk HTTP cache."""
+
+import time
+
+from scrapeflow.http_cache import HttpCache, freshness_lifetime
+
+
+def test_stores_and_serves_fresh_responses(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    headers = {"Cache-Control": "max-age=60", "Content-Encoding": "gzip"}
+    stored = cache.store("https://shop.example/", {}, 200, headers, b"<html>")
+
+    entry = cache.lookup("https://shop.example/", {})
+    assert entry.key == stored.key and entry.is_fresh()
+    assert "content-encoding" not in entry.headers
+    assert cache.read_body(entry) == b"<html>"
+    assert cache.lookup("https://shop.example/other", {}) is None
+
+
+def test_respects_no_store_and_unvalidatable_responses(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    assert cache.store("https://a.example/", {}, 200, {"cache-control": "no-store"}, b"x") is None
+    assert cache.store("https://a.example/", {}, 200, {}, b"x") is None
+    assert cache.store("https://a.example/", {}, 500, {"cache-control": "max-age=60"}, b"x") is None
+    # no-cache responses are kept but always revalidated
+    headers = {"cache-control": "no-cache", "etag": '"v1"'}
+    entry = cache.store("https://a.example/", {}, 200, headers, b"x")
+    assert not entry.is_fresh()
+    assert entry.validators() == {"if-none-match": '"v1"'}
+
+
+def test_vary_headers_select_the_variant(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    headers = {"cache-control": "max-age=60", "vary": "Accept-Language"}
+    cache.store("https://a.example/", {"Accept-Language": "en"}, 200, headers, b"hello")
+    cache.store("https://a.example/", {"Accept-Language": "fr"}, 200, headers, b"bonjour")
+
+    en = cache.lookup("https://a.example/", {"accept-language": "en"})
+    fr = cache.lookup("https://a.example/", {"accept-language": "fr"})
+    assert cache.read_body(en) == b"hello"
+    assert cache.read_body(fr) == b"bonjour"
+    assert cache.lookup("https://a.example/", {"accept-language": "de"}) is None
+
+    cache.clear()
+    assert cache._vary == {}
+
+
+def test_eviction_drops_the_vary_index_with_the_last_variant(tmp_path):
+    cache = HttpCache(str(tmp_path), max_bytes=10)
+    headers = {"cache-control": "max-age=60", "vary": "Accept-Language"}
+    cache.store("https://a.example/", {"Accept-Language": "en"}, 200, headers, b"x" * 6)
+    cache.store("https://a.example/", {"Accept-Language": "fr"}, 200, headers, b"x" * 6)
+    assert "https://a.example/" in cache._vary  # the fr variant is still stored
+
+    cache.store("https://b.example/", {}, 200, {"cache-control": "max-age=60"}, b"x" * 6)
+    assert list(cache._vary) == ["https://b.example/"]
+
+
+def test_set_cookie_and_error_pages_are_not_cached_by_default(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    headers = {"cache-control": "max-age=60", "Set-Cookie": "session=abc"}
+    entry = cache.store("https://a.example/", {}, 200, headers, b"x")
+    assert "set-cookie" not in entry.headers
+    assert "set-cookie" not in cache.lookup("https://a.example/", {}).headers
+    assert cache.store("https://a.example/gone", {}, 404, headers, b"x") is None
+
+    errors = HttpCache(str(tmp_path / "errors"), cache_errors=True)
+    assert errors.store("https://a.example/gone", {}, 404, headers, b"x").status == 404
+
+
+def test_temp_files_left_by_a_crash_are_removed(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store("https://a.example/", {}, 200, {"cache-control": "max-age=60"}, b"x")
+    (tmp_path / "crashed.body.tmp").write_bytes(b"partial")
+
+    HttpCache(str(tmp_path))
+
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == [".body", ".json"]
+
+
+def test_lru_eviction_keeps_recently_used_entries_and_survives_restart(tmp_path):
+    cache = HttpCache(str(tmp_path), max_bytes=25)
+    headers = {"cache-control": "max-age=60"}
+    cache.store("https://a.example/1", {}, 200, headers, b"x" * 10)
+    cache.store("https://a.example/2", {}, 200, headers, b"x" * 10)
+    time.sleep(0.01)
+    cache.lookup("https://a.example/1", {})  # 1 is now most recently used
+    cache.store("https://a.example/3", {}, 200, headers, b"x" * 10)
+
+    assert cache.lookup("https://a.example/2", {}) is None
+    assert cache.evictions == 1
+    reopened = HttpCache(str(tmp_path), max_bytes=25)
+    assert reopened.total_bytes == 20
+    assert reopened.lookup("https://a.example/1", {}) is not None
+    assert reopened.lookup("https://a.example/3", {}) is not None
+
+
+def test_refresh_extends_lifetime_after_revalidation(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    headers = {"etag": '"v1"', "cache-control": "max-age=0"}
+    entry = cache.store("https://a.example/", {}, 200, headers, b"x")
+    assert not entry.is_fresh()
+
+    entry = cache.refresh(entry, {"cache-control": "max-age=300"})
+
+    assert entry.is_fresh()
+    assert cache.lookup("https://a.example/", {}).lifetime == 300
+
+
+def test_freshness_falls_back_to_expires_and_last_modified():
+    now = time.time()
+    assert freshness_lifetime(
+        {"date": "Wed, 01 Jan 2025 00:00:00 GMT", "expires": "Wed, 01 Jan 2025 00:02:00 GMT"}, now
+    ) == 120
+    assert freshness_lifetime(
+        {"date": "Wed, 11 Jan 2025 00:00:00 GMT", "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        now,
+    ) == 86400.0
@@ -0,0 +1,87 @@
+"""Tests for the HTTP-only runtime and its static page."""
+
+from typing import List
+
+import pytest
+from aiohttp import web
+from pydantic import BaseModel
+
+from scrapeflow.http_runtime import HttpRuntime, StaticPage
+from scrapeflow.schema_library import product_price_item_spec
+from scrapeflow.specifications import FieldSpec, ProductPriceSpec, SpecificationExtractor
+
+pytest.importorskip("selectolax")
+
+LISTING = """
+<html><head><title> Books </title></head><body>
+  <h1 class="heading">All products</h1>
+  <article class="product_pod">
+    <h3><a href="/catalogue/a" title="A Light in the Attic">A Light...</a></h3>
+    <p class="price_color">£51.77</p>
+    <p class="instock availability"> In stock </p>
+  </article>
+  <article class="product_pod">
+    <h3><a href="/catalogue/b" title="Tipping the Velvet">Tipping...</a></h3>
+    <p class="price_color">£53.74</p>
+  </article>
+</body></html>
+"""
+
+
+class Listing(BaseModel):
+    heading: str
+    products: List[ProductPriceSpec]
+
+
+@pytest.mark.asyncio
+async def test_static_page_runs_item_spec_extraction():
+    page = StaticPage(LISTING, url="https://books.example/index.html")
+    extractor = SpecificationExtractor(
+        Listing,
+        schema={"heading": FieldSpec(selector="h1.heading"), "products": product_price_item_spec()},
+    )
+
+    result = await extractor.extract(page)
+
+    assert result.heading == "All products"
+    assert [p.title for p in result.products] == ["A Light in the Attic", "Tipping the Velvet"]
+    assert result.products[0].price == "£51.77"
+    assert result.products[0].availability == "In stock"
+    assert result.products[1].availability == ""
+    assert result.products[0].url == "https://books.example/catalogue/a"
+
+
+@pytest.mark.asyncio
+async def test_static_locator_scopes_nested_selectors_to_descendants():
+    page = StaticPage('<div class="a"><div class="a">inner</div></div>')
+    outer = page.locator("div.a").first
+    assert await page.locator("div.a").count() == 2
+    assert await outer.locator("div.a").count() == 1
+    assert await outer.locator("div.a").text_content() == "inner"
+    assert await page.title() == ""
+
+
+@pytest.mark.asyncio
+async def test_http_runtime_fetches_into_static_page():
+    async def handler(request):
+        return web.Response(text=LISTING, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    runtime = HttpRuntime()
+    try:
+        await runtime.start()
+        async with runtime.acquire_page() as page:
+            await runtime.goto(f"http://127.0.0.1:{port}/", "load", 5000, page=page)
+            assert page.status == 200
+            assert await page.title() == "Books"
+            assert await page.locator("article.product_pod").count() == 2
+    finally:
+        await runtime.close()
+        await runner.cleanup()
@@ -0,0 +1,36 @@
+"""Import-time regression tests for the lazy public API."""
+
+import json
+import subprocess
+import sys
+
+import scrapeflow
+
+HEAVY_MODULES = ("playwright", "pydantic", "aiohttp", "tenacity", "mistralai")
+
+
+def _heavy_loaded_after(statement: str) -> list:
+    """Heavy modules in sys.modules after running `statement` in a fresh interpreter."""
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def test_import_scrapeflow_loads_no_heavy_dependencies():
+    assert _heavy_loaded_after("import scrapeflow") == []
+
+
+def test_lightweight_modules_stay_lightweight():
+    assert _heavy_loaded_after("from scrapeflow.content_utils import clean_html_for_llm") == []
+    assert _heavy_loaded_after("from scrapeflow.registry import get_registry") == []
+    assert _heavy_loaded_after("from scrapeflow import ScrapeFlow, Workflow") == []
+
+
+def test_every_public_name_resolves():
+    for name in scrapeflow.__all__:
+        assert getattr(scrapeflow, name) is not None
+    assert set(scrapeflow.__all__) <= set(dir(scrapeflow))
@@ -0,0 +1,115 @@
+"""Tests for the page pool used by concurrent crawling."""
+
+import asyncio
+
+import pytest
+
+from scrapeflow.page_pool import PagePool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.gotos = []
+        self.unrouted = 0
+        self.handlers = {}
+
+    def on(self, event, handler) -> None:
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler) -> None:
+        self.handlers[event].remove(handler)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def goto(self, url: str) -> None:
+        self.gotos.append(url)
+
+    async def unroute_all(self, behavior=None) -> None:
+        self.unrouted += 1
+
+
+def _factory(created):
+    async def make():
+        page = FakePage()
+        created.append(page)
+        return page
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_pool_prewarms_min_size():
+    created = []
+    pool = PagePool(_factory(created), min_size=3, max_size=5)
+    await pool.start()
+    assert len(created) == 3
+    assert pool.idle_count == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_and_resets_pages():
+    created = []
+    pool = PagePool(_factory(created), min_size=1, max_size=2)
+    await pool.start()
+
+    async with pool.lease() as first:
+        pass
+    async with pool.lease() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    assert first.gotos == ["about:blank", "about:blank"]
+    assert first.unrouted == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_removes_listeners_registered_for_the_lease():
+    created = []
+    pool = PagePool(_factory(created), min_size=1, max_size=1)
+    await pool.start()
+    created[0].on("close", print)
+
+    async with pool.lease() as page:
+        pool.add_listener(page, "response", print)
+        assert page.handlers == {"close": [print], "response": [print]}
+
+    assert page.handlers == {"close": [print], "response": []}
+    with pytest.raises(ValueError):
+        pool.add_listener(page, "response", print)
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_after_max_uses():
+    created = []
+    pool = PagePool(_factory(created), min_size=1, max_size=1, max_uses=2)
+    await pool.start()
+
+    pages = []
+    for _ in range(3):
+        async with pool.lease() as page:
+            pages.append(page)
+
+    assert pages[0] is pages[1]
+    assert pages[2] is not pages[0]
+    assert pages[0].closed is True
+    assert pool.recycled == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrent_leases():
+    pool = PagePool(_factory([]), max_size=2)
+    first = await pool.acquire()
+    await pool.acquire()
+
+    waiter = asyncio.ensure_future(pool.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await pool.release(first)
+    assert await asyncio.wait_for(waiter, timeout=1) is first
@@ -0,0 +1,72 @@
+"""Tests for the multi-process sharded crawl executor."""
+
+import pytest
+
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.monitoring import ScrapeMetrics
+from scrapeflow.process_pool import ShardedCrawlExecutor, shard_urls
+from tests.helpers import (
+    FakeLogger,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    PooledFakeRuntime,
+)
+
+
+def fake_engine_factory(config):
+    return ScrapeFlow(
+        config,
+        runtime=PooledFakeRuntime(),
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+
+
+async def extract_url(page, context):
+    return {"url": page.url}
+
+
+def test_shard_urls_keeps_hosts_together():
+    urls = [f"https://host{i % 3}.example/{i}" for i in range(30)]
+    shards = shard_urls(urls, 4)
+    assert sum(len(s) for s in shards) == 30
+    for shard in shards:
+        assert len({u.split("/")[2] for u in shard}) <= 3
+    hosts_per_shard = [{u.split("/")[2] for u in s} for s in shards]
+    for a in range(4):
+        for b in range(a + 1, 4):
+            assert not hosts_per_shard[a] & hosts_per_shard[b]
+
+
+def test_shard_urls_round_robin():
+    shards = shard_urls([f"https://a.example/{i}" for i in range(10)], 3, by="round_robin")
+    assert [len(s) for s in shards] == [4, 3, 3]
+
+
+def test_scrape_metrics_merge():
+    a = ScrapeMetrics()
+    a.record_success(1.0)
+    b = ScrapeMetrics()
+    b.record_failure(3.0, ValueError("x"))
+    a.merge(b)
+    assert a.total_requests == 2
+    assert a.failed_requests == 1
+    assert a.average_response_time == 2.0
+    assert a.errors_by_type["ValueError"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_streams_results_and_merges_metrics():
+    urls = [f"https://host{i % 4}.example/{i}" for i in range(12)]
+    executor = ShardedCrawlExecutor(
+        num_workers=2, engine_factory=fake_engine_factory, concurrency=2, shard_by="round_robin"
+    )
+
+    results = [r async for r in executor.crawl(urls, extract_url)]
+
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert all(r.success and r.data == {"url": r.url} for r in results)
+    assert executor.metrics.successful_requests == 12
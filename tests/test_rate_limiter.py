@@ -0,0 +1,389 @@
+"""Tests for the GCRA, keyed per-host and adaptive (AIMD) rate limiters."""
+
+import asyncio
+import time
+
+import pytest
+
+from scrapeflow.config import RateLimitConfig, ScrapeFlowConfig
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import ScrapeFlowBlockedError, ScrapeFlowTimeoutError
+from scrapeflow.rate_limiter import (
+    AdaptiveRateLimiter,
+    CostPolicy,
+    KeyedRateLimiter,
+    RateLimiter,
+)
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakeResponse,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    FakeRuntime,
+    KeyedFakeRateLimiter,
+    StatusRuntime,
+    make_scraper,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_gcra_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(requests_per_second=10, burst_size=3), clock=clock)
+    assert limiter.tokens == 3
+    assert [limiter.reserve() for _ in range(5)] == pytest.approx([0, 0, 0, 0.1, 0.2])
+    assert limiter.tokens == 0
+
+    clock.now = 1.0  # idle long enough to refill the whole burst, no more
+    assert limiter.tokens == 3
+    assert [limiter.reserve() for _ in range(4)] == pytest.approx([0, 0, 0, 0.1])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_sleep_in_parallel_on_their_own_slots():
+    limiter = RateLimiter(RateLimitConfig(requests_per_second=200, burst_size=1))
+    grants = []
+
+    async def worker():
+        await limiter.acquire()
+        grants.append(time.monotonic())
+
+    start = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(40)))
+    elapsed = time.monotonic() - start
+    assert 0.18 <= elapsed < 0.4  # 39 intervals of 5 ms
+    assert sorted(grants) == grants
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_slot():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(requests_per_second=1, burst_size=1), clock=clock)
+    await limiter.acquire()
+    task = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.reserve() == pytest.approx(1.0)  # not 2.0
+
+
+def test_cost_weights_each_reservation():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(requests_per_second=10, burst_size=2), clock=clock)
+    # Eight quarter-cost calls fit the burst of two; the next full one waits a whole interval.
+    assert [limiter.reserve(cost=0.25) for _ in range(8)] == pytest.approx([0] * 8)
+    assert limiter.reserve() == pytest.approx(0.1)
+
+    clock.now = 10.0
+    assert limiter.reserve(cost=4) == pytest.approx(0.2)  # more than the burst even when idle
+    assert limiter.tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_keyed_limiter_charges_cost_to_host_and_global_buckets():
+    config = RateLimitConfig(
+        requests_per_second=10, burst_size=1, per_host=True, global_requests_per_second=10
+    )
+    limiter = KeyedRateLimiter(config)
+    await limiter.acquire("a.example", cost=0.5)
+    assert limiter.limiter_for("a.example").tokens == pytest.approx(0.5, abs=0.05)
+    assert limiter.global_limiter.tokens == pytest.approx(0.5, abs=0.05)
+
+
+def test_cost_policy_uses_kind_and_recorded_sizes():
+    policy = CostPolicy(kind_costs={"api": 0.2}, reference_bytes=100_000, max_cost=5)
+    assert policy.cost("a.example") == 1.0
+    assert policy.cost("a.example", "api") == 0.2
+    assert policy.cost("a.example", "unknown") == 1.0
+
+    policy.record("a.example", "navigation", 300_000)
+    assert policy.cost("a.example") == pytest.approx(3.0)
+    policy.record("a.example", "navigation", 100_000)  # EWMA: 300k + 0.2 * (100k - 300k)
+    assert policy.cost("a.example") == pytest.approx(2.6)
+    policy.record("b.example", "navigation", 10_000_000)
+    assert policy.cost("b.example") == 5  # clamped
+    assert policy.cost("c.example") == 1.0  # nothing recorded yet
+
+
+@pytest.mark.asyncio
+async def test_engine_acquires_by_cost_policy_and_records_sizes():
+    limiter = KeyedFakeRateLimiter()
+    policy = CostPolicy(reference_bytes=1000)
+    runtime = StatusRuntime(
+        [FakeResponse(200, {"Content-Length": "4000"}), FakeResponse(200), FakeResponse(200)]
+    )
+    runtime.request_kind = "static"
+    scraper = ScrapeFlow(
+        runtime=runtime,
+        rate_limiter=limiter,
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+        cost_policy=policy,
+    )
+    for _ in range(3):
+        await scraper.navigate("https://a.example/")
+    # Static base cost 0.25, then scaled by the 4000-byte average; no length, no sample.
+    assert limiter.costs == pytest.approx([0.25, 1.0, 1.0])
+
+
+@pytest.mark.asyncio
+async def test_hosts_are_limited_independently():
+    limiter = KeyedRateLimiter(RateLimitConfig(requests_per_second=10, burst_size=1, per_host=True))
+    start = time.monotonic()
+    # 3 hosts x 3 requests at 10 rps each: ~0.2 s, not the ~0.8 s of one shared bucket.
+    await asyncio.gather(
+        *(limiter.acquire(f"host{h}.example") for h in range(3) for _ in range(3))
+    )
+    assert time.monotonic() - start < 0.5
+    assert len(limiter) == 3
+
+
+@pytest.mark.asyncio
+async def test_global_cap_applies_across_hosts():
+    config = RateLimitConfig(
+        requests_per_second=1000, burst_size=1, per_host=True, global_requests_per_second=20
+    )
+    limiter = KeyedRateLimiter(config)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire(f"host{h}.example") for h in range(5)))
+    assert time.monotonic() - start >= 0.15  # 4 waits at 20 rps
+
+
+@pytest.mark.asyncio
+async def test_idle_and_least_recently_used_buckets_are_evicted():
+    clock = FakeClock()
+    config = RateLimitConfig(requests_per_second=1000, max_hosts=3, host_idle_ttl=60)
+    limiter = KeyedRateLimiter(config, clock=clock)
+    for host in ("a", "b", "c"):
+        await limiter.acquire(host)
+    await limiter.acquire("a")  # a becomes most recently used
+
+    await limiter.acquire("d")  # at capacity: b (LRU) goes
+    assert "b" not in limiter and {"a", "c", "d"} <= set(limiter._buckets)
+
+    clock.now = 61
+    await limiter.acquire("e")  # everything else idle past the TTL
+    assert list(limiter._buckets) == ["e"]
+    assert limiter.evictions == 4
+
+
+@pytest.mark.asyncio
+async def test_buckets_with_waiters_are_not_evicted():
+    clock = FakeClock()
+    limiter = KeyedRateLimiter(RateLimitConfig(max_hosts=1), clock=clock)
+    bucket = limiter._bucket("busy")
+    bucket.active = 1
+    await limiter.acquire("other")
+    assert "busy" in limiter
+
+
+def test_engine_builds_keyed_limiter_when_per_host():
+    config = ScrapeFlowConfig()
+    config.rate_limit.per_host = True
+    assert isinstance(ScrapeFlow(config, runtime=FakeRuntime()).rate_limiter, KeyedRateLimiter)
+    assert isinstance(ScrapeFlow(runtime=FakeRuntime()).rate_limiter, RateLimiter)
+
+
+def test_aimd_decreases_on_throttling_once_per_cooldown():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(
+        RateLimitConfig(requests_per_second=4, max_requests_per_second=5), clock=clock
+    )
+    assert limiter.observe(status=429) == pytest.approx(4 / 1.5)
+    assert limiter.observe(error=ScrapeFlowTimeoutError("slow")) == pytest.approx(4 / 1.5)
+    clock.now = 1.0
+    assert limiter.observe(status=503) == pytest.approx(4 / 1.5 / 1.5)
+    assert limiter.observe(status=404) == pytest.approx(4 / 1.5 / 1.5)  # neutral
+    assert limiter.refill_rate == pytest.approx(1 / limiter.current_rate)
+
+
+def test_aimd_increases_additively_up_to_the_ceiling():
+    limiter = AdaptiveRateLimiter(
+        RateLimitConfig(requests_per_second=2, max_requests_per_second=2.5), success_threshold=3
+    )
+    rates = [limiter.observe(status=200, latency=0.1) for _ in range(30)]
+    assert rates[2] == pytest.approx(2.2)
+    assert rates[5] == pytest.approx(2.4)
+    assert rates[-1] == pytest.approx(2.5)
+
+
+def test_aimd_backs_off_when_latency_rises():
+    limiter = AdaptiveRateLimiter(RateLimitConfig(requests_per_second=2), success_threshold=1000)
+    for _ in range(20):
+        limiter.observe(status=200, latency=0.1)
+    assert limiter.current_rate == 2
+    for _ in range(5):
+        limiter.observe(status=200, latency=0.5)
+    assert limiter.current_rate < 2
+
+
+@pytest.mark.asyncio
+async def test_engine_feeds_outcomes_per_host_and_publishes_rates():
+    config = ScrapeFlowConfig()
+    config.rate_limit = RateLimitConfig(
+        requests_per_second=100, per_host=True, adaptive=True, max_host_gauges=1
+    )
+    monitor = FakeMonitor()
+    runtime = StatusRuntime([FakeResponse(200), FakeResponse(429)])
+    scraper = ScrapeFlow(
+        config,
+        runtime=runtime,
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=monitor,
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+    await scraper.navigate("https://fast.example/")
+    with pytest.raises(ScrapeFlowBlockedError):
+        await scraper.navigate("https://slow.example/")
+
+    rates = scraper.rate_limiter.rates()
+    assert rates["fast.example"] == 100
+    assert rates["slow.example"] == pytest.approx(100 / 1.5)
+    # Only max_host_gauges hosts get their own gauge; the means cover the rest.
+    assert monitor.gauges["rate_limit.rps.fast.example"] == 100
+    assert "rate_limit.rps.slow.example" not in monitor.gauges
+    assert monitor.gauges["rate_limit.hosts"] == 1  # refreshed at the first outcome only
+
+
+@pytest.mark.asyncio
+async def test_failed_rate_wait_is_not_a_latency_sample():
+    class FailingLimiter:
+        def __init__(self):
+            self.observed = []
+
+        async def acquire(self):
+            raise asyncio.TimeoutError()
+
+        def observe(self, key=None, **outcome):
+            self.observed.append(outcome)
+
+    limiter = FailingLimiter()
+    scraper = make_scraper(FakeRuntime(), limiter=limiter)
+    with pytest.raises(asyncio.TimeoutError):
+        await scraper.navigate("https://a.example/")
+    assert limiter.observed == []
+
+
+class WarningLogger(FakeLogger):
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message: str, **kwargs):
+        self.warnings.append(message)
+
+
+def _robots_scraper(config, crawl_delay, logger=None):
+    return ScrapeFlow(
+        config,
+        runtime=FakeRuntime(),
+        retry_handler=FakeRetryHandler(),
+        logger=logger or FakeLogger(),
+        monitor=FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True, crawl_delay=crawl_delay),
+    )
+
+
+@pytest.mark.asyncio
+async def test_engine_applies_robots_crawl_delay_to_host_bucket():
+    config = ScrapeFlowConfig()
+    config.rate_limit = RateLimitConfig(requests_per_second=10, burst_size=5, per_host=True)
+    scraper = _robots_scraper(config, crawl_delay=2.0)
+    await scraper.navigate("https://slow.example/")
+
+    assert scraper.rate_limiter.limiter_for("slow.example").min_interval == 2.0
+    assert scraper.rate_limiter.rates()["slow.example"] == pytest.approx(0.5)
+    assert scraper.rate_limiter.limiter_for("other.example").min_interval is None
+    assert scraper.rate_limiter.min_intervals() == {"slow.example": 2.0}
+
+    scraper.robots_checker.crawl_delay = None  # the site dropped its Crawl-delay
+    await scraper.navigate("https://slow.example/")
+    assert scraper.rate_limiter.limiter_for("slow.example").min_interval is None
+
+    config.ethical_crawling.honor_crawl_delay = False
+    scraper = _robots_scraper(config, crawl_delay=2.0)
+    await scraper.navigate("https://slow.example/")
+    assert scraper.rate_limiter.limiter_for("slow.example").min_interval is None
+
+
+@pytest.mark.asyncio
+async def test_engine_caps_robots_crawl_delay():
+    config = ScrapeFlowConfig()
+    config.rate_limit = RateLimitConfig(per_host=True)
+    config.ethical_crawling.max_crawl_delay = 30.0
+    scraper = _robots_scraper(config, crawl_delay=1e9)
+    await scraper.navigate("https://slow.example/")
+
+    assert scraper.rate_limiter.min_intervals() == {"slow.example": 30.0}
+
+
+def test_crawl_delay_holds_whatever_the_request_cost():
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitConfig(requests_per_second=10, burst_size=5), clock=clock)
+    policy = CostPolicy(reference_bytes=100_000)
+    policy.record("h", "static", 1_000)  # tiny responses: clamped to min_cost
+    limiter.limit_interval(10)
+    waits = [limiter.reserve(policy.cost("h", "static")) for _ in range(4)]
+    assert waits == pytest.approx([0, 10, 20, 30])
+
+    limiter.limit_interval(2)  # a lowered delay replaces the old one
+    clock.now = 100.0
+    assert [limiter.reserve(0.25) for _ in range(3)] == pytest.approx([0, 2, 4])
+    limiter.limit_interval(None)
+    clock.now = 200.0
+    assert [limiter.reserve(0.25) for _ in range(3)] == pytest.approx([0, 0, 0])
+
+
+def test_crawl_delay_caps_adaptive_rate():
+    limiter = AdaptiveRateLimiter(RateLimitConfig(requests_per_second=10))
+    limiter.limit_interval(0.5)
+    assert limiter.current_rate == limiter.max_rate == 2.0
+    limiter.speed_up()
+    assert limiter.refill_rate == 0.5
+    limiter.limit_interval(None)
+    assert limiter.max_rate == 10.0
+
+
+@pytest.mark.asyncio
+async def test_engine_warns_once_when_limiter_is_not_per_host():
+    logger = WarningLogger()
+    scraper = _robots_scraper(ScrapeFlowConfig(), crawl_delay=2.0, logger=logger)
+    await scraper.navigate("https://slow.example/")
+    await scraper.navigate("https://slow.example/")
+    assert len(logger.warnings) == 1 and "per_host" in logger.warnings[0]
+    assert scraper.rate_limiter.refill_rate == 1.0  # the global bucket is left alone
+
+
+@pytest.mark.asyncio
+async def test_single_adaptive_bucket_publishes_one_rate_gauge():
+    config = ScrapeFlowConfig()
+    config.rate_limit = RateLimitConfig(requests_per_second=100, adaptive=True)
+    monitor = FakeMonitor()
+    scraper = ScrapeFlow(
+        config,
+        runtime=StatusRuntime([FakeResponse(200)]),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=monitor,
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+    await scraper.navigate("https://a.example/")
+    assert monitor.gauges == {"rate_limit.rps": 100}
+
+
+def test_adaptive_with_shared_path_is_rejected(tmp_path):
+    config = ScrapeFlowConfig()
+    config.rate_limit = RateLimitConfig(adaptive=True, shared_path=str(tmp_path / "rl.bin"))
+    with pytest.raises(ValueError, match="adaptive"):
+        ScrapeFlow(config, runtime=FakeRuntime())
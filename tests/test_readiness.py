@@ -0,0 +1,138 @@
+"""Tests for spec-driven navigation readiness."""
+
+import asyncio
+import gc
+import time
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from scrapeflow.readiness import wait_until_ready
+from scrapeflow.specifications import FieldSpec, ItemSpec, SpecificationExtractor
+from tests.helpers import FakeMonitor, FakeRuntime, make_scraper
+
+
+class Listing(BaseModel):
+    heading: str
+    subtitle: Optional[str] = None
+    products: List[dict]
+    badge: str = "none"
+
+
+def _listing_extractor():
+    return SpecificationExtractor(
+        Listing,
+        schema={
+            "heading": FieldSpec(selector=["h1.title", "h1"]),
+            "subtitle": "h2",
+            "products": ItemSpec(items_selector="article", fields={"name": "h3"}),
+            "badge": FieldSpec(selector=".badge", required=True),
+        },
+    )
+
+
+class SlowDomPage:
+    """Page whose selectors attach after given delays (seconds); missing ones never do."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.url = "about:blank"
+
+    async def wait_for_selector(self, selector, state="visible", timeout=None):
+        delay = self.delays.get(selector)
+        if delay is None or delay * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(selector)
+        await asyncio.sleep(delay)
+
+
+class RecordingExtractor:
+    def __init__(self, inner):
+        self.inner = inner
+        self.extracted_at = None
+
+    def required_selectors(self):
+        return self.inner.required_selectors()
+
+    async def extract(self, page):
+        self.extracted_at = time.monotonic()
+        return "done"
+
+
+class SlowDomRuntime(FakeRuntime):
+    def __init__(self, page):
+        super().__init__()
+        self.dom_page = page
+
+    @asynccontextmanager
+    async def acquire_page(self):
+        yield self.dom_page
+
+
+def test_required_selectors_cover_required_fields_and_items():
+    assert _listing_extractor().required_selectors() == [
+        ("h1.title", "h1"),
+        ("article",),
+        (".badge",),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_accepts_any_fallback_selector():
+    page = SlowDomPage({"h1": 0.01, "article": 0.02})
+    assert await wait_until_ready(page, [("h1.title", "h1"), ("article",)], 500)
+    assert not await wait_until_ready(page, [("h1.title",)], 50)
+
+
+class BrokenSelectorPage:
+    """Page where "good" attaches at once and every other selector fails at once."""
+
+    async def wait_for_selector(self, selector, state="visible", timeout=None):
+        await asyncio.sleep(0)
+        if selector != "good":
+            raise ValueError(f"malformed selector {selector}")
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_retrieves_every_task_exception():
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+    try:
+        # Many groups, so some finished set holds failures after the success.
+        groups = [("good",) + tuple(f"bad{i}" for i in range(10))] * 20
+        assert await wait_until_ready(BrokenSelectorPage(), groups, 500)
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_navigate_and_extract_starts_at_domcontentloaded_and_stops_waiting_when_ready():
+    page = SlowDomPage({"h1": 0.01, "article": 0.02, ".badge": 0.03})
+    runtime = SlowDomRuntime(page)
+    scraper = make_scraper(runtime)
+    extractor = RecordingExtractor(_listing_extractor())
+
+    started = time.monotonic()
+    assert await scraper.navigate_and_extract("https://shop.example/", extractor) == "done"
+
+    assert runtime.last_goto[1] == "domcontentloaded"
+    assert extractor.extracted_at - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_navigate_and_extract_caps_the_wait():
+    monitor = FakeMonitor()
+    scraper = make_scraper(SlowDomRuntime(SlowDomPage({})), monitor=monitor)
+    extractor = RecordingExtractor(_listing_extractor())
+
+    started = time.monotonic()
+    await scraper.navigate_and_extract("https://shop.example/", extractor, readiness_timeout=50)
+
+    assert extractor.extracted_at - started < 1.0
+    assert monitor.counters["readiness_timeouts"] == 1
@@ -0,0 +1,177 @@
+"""Tests for per-domain render-mode detection and routing."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import (
+    ScrapeFlowBlockedError,
+    ScrapeFlowHTTPError,
+    ScrapeFlowValidationError,
+)
+from scrapeflow.render_mode import RenderMode, RenderModeRouter, RenderModeTable
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+)
+
+
+class ContentPage:
+    def __init__(self):
+        self.url = "about:blank"
+        self.body = None
+
+
+class ContentRuntime:
+    """Runtime serving fixed content per host."""
+
+    def __init__(self, content_by_host):
+        self.content_by_host = content_by_host
+        self.page = ContentPage()
+        self.fetches = []
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @asynccontextmanager
+    async def acquire_page(self):
+        yield ContentPage()
+
+    async def goto(self, url, wait_until, timeout, page=None):
+        self.fetches.append(url)
+        page = page or self.page
+        page.url = url
+        page.body = self.content_by_host.get(url.split("/")[2])
+
+
+class BodyExtractor:
+    async def extract(self, page):
+        if not page.body:
+            raise ScrapeFlowValidationError("empty")
+        return {"body": page.body}
+
+
+def _engine(browser, static, table):
+    return ScrapeFlow(
+        runtime=browser,
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+        render_router=RenderModeRouter(static, table),
+    )
+
+
+@pytest.mark.asyncio
+async def test_static_domain_is_routed_over_http_after_probe(tmp_path):
+    browser = ContentRuntime({"static.example": "same", "spa.example": "rendered"})
+    static = ContentRuntime({"static.example": "same", "spa.example": None})
+    table = RenderModeTable(str(tmp_path / "modes.json"))
+    scraper = _engine(browser, static, table)
+
+    assert await scraper.extract("https://static.example/1", BodyExtractor()) == {"body": "same"}
+    assert await scraper.extract("https://spa.example/1", BodyExtractor()) == {"body": "rendered"}
+    assert table.to_dict() == {"static.example": "static", "spa.example": "browser"}
+
+    browser.fetches.clear()
+    static.fetches.clear()
+    await scraper.extract("https://static.example/2", BodyExtractor())
+    await scraper.extract("https://spa.example/2", BodyExtractor())
+    assert static.fetches == ["https://static.example/2"]
+    assert browser.fetches == ["https://spa.example/2"]
+
+    table.save()
+    reloaded = RenderModeTable(str(tmp_path / "modes.json"))
+    assert reloaded.get("static.example") == RenderMode.STATIC
+
+
+@pytest.mark.asyncio
+async def test_static_domain_is_demoted_when_validation_fails():
+    browser = ContentRuntime({"shop.example": "rendered"})
+    static = ContentRuntime({"shop.example": None})
+    table = RenderModeTable()
+    table.set("shop.example", RenderMode.STATIC)
+    scraper = _engine(browser, static, table)
+
+    assert await scraper.extract("https://shop.example/x", BodyExtractor()) == {"body": "rendered"}
+    assert table.get("shop.example") == RenderMode.BROWSER
+
+
+class FlakyRuntime(ContentRuntime):
+    """Static runtime whose fetches fail with a transport error."""
+
+    def __init__(self, content_by_host, error):
+        super().__init__(content_by_host)
+        self.error = error
+
+    async def goto(self, url, wait_until, timeout, page=None):
+        self.fetches.append(url)
+        raise self.error
+
+
+@pytest.mark.asyncio
+async def test_transient_static_failures_decide_nothing():
+    browser = ContentRuntime({"shop.example": "same"})
+    static = FlakyRuntime({"shop.example": "same"}, ConnectionError("reset"))
+    table = RenderModeTable()
+    scraper = _engine(browser, static, table)
+
+    assert await scraper.extract("https://shop.example/1", BodyExtractor()) == {"body": "same"}
+    assert table.get("shop.example") is None  # probed again next time
+
+    table.set("shop.example", RenderMode.STATIC)
+    static.error = ScrapeFlowBlockedError("HTTP 429", status_code=429)
+    with pytest.raises(ScrapeFlowBlockedError):
+        await scraper.extract("https://shop.example/2", BodyExtractor())
+    assert table.get("shop.example") == RenderMode.STATIC
+
+
+
+@pytest.mark.asyncio
+async def test_dead_link_on_static_domain_keeps_the_verdict():
+    browser = ContentRuntime({"shop.example": "same"})
+    static = FlakyRuntime({"shop.example": "same"}, ScrapeFlowHTTPError("HTTP 404", 404))
+    table = RenderModeTable()
+    table.set("shop.example", RenderMode.STATIC)
+    scraper = _engine(browser, static, table)
+
+    with pytest.raises(ScrapeFlowHTTPError):
+        await scraper.extract("https://shop.example/gone", BodyExtractor())
+    assert table.get("shop.example") == RenderMode.STATIC
+    assert browser.fetches == []
+
+
+@pytest.mark.asyncio
+async def test_static_refusal_during_probe_picks_browser_and_frees_the_lock():
+    browser = ContentRuntime({"shop.example": "same"})
+    static = FlakyRuntime({"shop.example": "same"}, ScrapeFlowHTTPError("HTTP 403", 403))
+    table = RenderModeTable()
+    scraper = _engine(browser, static, table)
+
+    assert await scraper.extract("https://shop.example/1", BodyExtractor()) == {"body": "same"}
+    assert table.get("shop.example") == RenderMode.BROWSER
+    assert scraper.render_router._probe_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_table_is_saved_in_batches_and_on_close(tmp_path):
+    path = tmp_path / "modes.json"
+    table = RenderModeTable(str(path), save_interval=60)
+    table.set("a.example", RenderMode.STATIC)
+    await table.save_if_due()
+    table.set("b.example", RenderMode.BROWSER)
+    await table.save_if_due()  # within the interval: only marked dirty
+    assert RenderModeTable(str(path)).to_dict() == {"a.example": "static"}
+    assert table.dirty
+
+    await RenderModeRouter(ContentRuntime({}), table).close()
+    assert RenderModeTable(str(path)).to_dict() == {"a.example": "static", "b.example": "browser"}
+    assert not table.dirty
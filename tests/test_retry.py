@@ -0,0 +1,142 @@
+"""Tests for retry classification and status-aware navigation."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scrapeflow.config import RetryConfig
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import (
+    ScrapeFlowBlockedError,
+    ScrapeFlowHTTPError,
+    ScrapeFlowRetryError,
+)
+from scrapeflow.retry import ErrorClassifier, RetryHandler, parse_retry_after
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakeRateLimiter,
+    FakeResponse,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    StatusRuntime,
+)
+
+
+class CountlessMonitor(FakeMonitor):
+    """Monitor written against the original port: no counters or gauges."""
+
+    increment = None
+    set_gauge = None
+
+
+def _scraper(runtime, max_retries=3, max_delay=60.0, monitor=None):
+    config = RetryConfig(max_retries=max_retries, initial_delay=0.0, max_delay=max_delay)
+    return ScrapeFlow(
+        runtime=runtime,
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=RetryHandler(config),
+        logger=FakeLogger(),
+        monitor=monitor or FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(in_a_minute) <= 60
+
+
+def test_classifier_separates_permanent_and_transient_statuses():
+    assert not ErrorClassifier.is_retryable(ScrapeFlowHTTPError("gone", 404))
+    assert not ErrorClassifier.is_retryable(ScrapeFlowHTTPError("gone", 410))
+    assert ErrorClassifier.is_retryable(ScrapeFlowHTTPError("oops", 502))
+    assert ErrorClassifier.is_retryable(ScrapeFlowBlockedError("slow down", status_code=429))
+    assert ErrorClassifier.get_retry_delay(
+        ScrapeFlowHTTPError("busy", 503, headers={"retry-after": "7"})
+    ) == 7.0
+
+
+@pytest.mark.asyncio
+async def test_navigate_fails_fast_on_404():
+    runtime = StatusRuntime([FakeResponse(404)])
+    scraper = _scraper(runtime)
+
+    with pytest.raises(ScrapeFlowHTTPError) as exc_info:
+        await scraper.navigate("https://example.com/missing")
+
+    assert exc_info.value.status_code == 404
+    assert runtime.goto_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_navigate_retries_5xx_then_succeeds():
+    runtime = StatusRuntime([FakeResponse(502), FakeResponse(200)])
+    scraper = _scraper(runtime)
+
+    response = await scraper.navigate("https://example.com/flaky")
+
+    assert response.status == 200
+    assert runtime.goto_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_navigate_works_with_a_retry_handler_without_classifier():
+    runtime = StatusRuntime([FakeResponse(200), FakeResponse(404)])
+    scraper = _scraper(runtime)
+    scraper.retry_handler = FakeRetryHandler()
+
+    assert (await scraper.navigate("https://example.com/")).status == 200
+    with pytest.raises(ScrapeFlowHTTPError):
+        await scraper.navigate("https://example.com/missing")
+
+
+@pytest.mark.asyncio
+async def test_navigate_works_with_a_monitor_without_counters():
+    runtime = StatusRuntime([FakeResponse(200)])
+    scraper = _scraper(runtime, monitor=CountlessMonitor())
+
+    response = await scraper.navigate("https://example.com/")
+
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_navigate_honours_retry_after(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("scrapeflow.retry.asyncio.sleep", fake_sleep)
+    runtime = StatusRuntime([FakeResponse(429, {"retry-after": "5"}), FakeResponse(200)])
+
+    await _scraper(runtime).navigate("https://example.com/limited")
+
+    assert sleeps == [5.0]
+    assert runtime.goto_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_navigate_gives_up_when_retry_after_exceeds_max_delay():
+    runtime = StatusRuntime([FakeResponse(503, {"Retry-After": "3600"})])
+
+    with pytest.raises(ScrapeFlowBlockedError) as exc_info:
+        await _scraper(runtime, max_delay=30.0).navigate("https://example.com/down")
+
+    assert exc_info.value.retry_after == 3600.0
+    assert runtime.goto_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_navigate_wraps_exhausted_transient_failures():
+    runtime = StatusRuntime([FakeResponse(500)] * 3)
+
+    with pytest.raises(ScrapeFlowRetryError):
+        await _scraper(runtime, max_retries=2).navigate("https://example.com/broken")
+
+    assert runtime.goto_calls == 3
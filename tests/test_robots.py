@@ -1,7 +1,19 @@
 """Tests for robots.txt enforcement."""
 
 import pytest
-from scrapeflow.robots import RobotsChecker
+from scrapeflow.robots import RobotsChecker, parse_crawl_delay
+
+ROBOTS_TXT = """
+User-agent: *
+Crawl-delay: 2
+Disallow: /private/
+
+User-agent: ScrapeFlow
+User-agent: OtherBot
+Crawl-delay: 0.5  # seconds
+Request-rate: 1/4s
+Disallow: /admin/
+"""
 
 
 @pytest.mark.asyncio
@@ -18,3 +30,46 @@ async def test_robots_checker_respect_enabled():
     # Most sites allow ScrapeFlow; this may return True or False
     result = await checker.can_fetch("https://quotes.toscrape.com/")
     assert isinstance(result, bool)
+
+
+def test_parse_crawl_delay_uses_the_matching_group():
+    lines = ROBOTS_TXT.splitlines()
+    # The stricter of Crawl-delay 0.5 and Request-rate 1/4s.
+    assert parse_crawl_delay(lines, "ScrapeFlow/2.1") == 4.0
+    assert parse_crawl_delay(lines, "SomeoneElse") == 2.0
+    assert parse_crawl_delay(["User-agent: *", "Disallow: /"], "ScrapeFlow") is None
+
+
+@pytest.mark.parametrize(
+    "directive, delay",
+    [
+        ("Request-rate: 30/1m", 2.0),
+        ("Request-rate: 1/10m 0600-0845", 600.0),
+        ("Request-rate: 3/1.5", 0.5),
+        ("Crawl-delay: 1.5", 1.5),
+        ("Crawl-delay: soon", None),
+        ("Crawl-delay: inf", None),
+        ("Crawl-delay: nan", None),
+        ("Request-rate: 0/5", None),
+    ],
+)
+def test_parse_crawl_delay_formats(directive, delay):
+    assert parse_crawl_delay(["User-agent: *", directive], "ScrapeFlow") == delay
+
+
+@pytest.mark.asyncio
+async def test_checker_caches_rules_and_crawl_delay(monkeypatch):
+    checker = RobotsChecker(user_agent="ScrapeFlow")
+    fetched = []
+
+    async def fake_fetch(robots_url):
+        fetched.append(robots_url)
+        return ROBOTS_TXT
+
+    monkeypatch.setattr(checker, "_fetch_robots_text", fake_fetch)
+    assert await checker.get_crawl_delay("https://shop.example/a") == 4.0
+    assert await checker.can_fetch("https://shop.example/admin/x") is False
+    assert await checker.can_fetch("https://shop.example/private/x") is True
+    assert fetched == ["https://shop.example/robots.txt"]
+
+    assert await RobotsChecker(respect_robots=False).get_crawl_delay("https://a.example/") is None
@@ -0,0 +1,152 @@
+"""Tests for per-host politeness scheduling."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from scrapeflow.config import EthicalCrawlingConfig, ScrapeFlowConfig
+from scrapeflow.engine import ScrapeFlow
+from scrapeflow.exceptions import ScrapeFlowError
+from scrapeflow.scheduler import HostScheduler, host_of
+from tests.helpers import (
+    FakeLogger,
+    FakeMonitor,
+    FakePage,
+    FakeRateLimiter,
+    FakeRetryHandler,
+    FakeRobotsChecker,
+    FakeRuntime,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_round_robin_across_hosts():
+    scheduler = HostScheduler()
+    for url in ["https://a/1", "https://a/2", "https://a/3", "https://b/1", "https://c/1"]:
+        scheduler.push(url)
+
+    order = [scheduler.next_ready() for _ in range(5)]
+
+    assert order == ["https://a/1", "https://b/1", "https://c/1", "https://a/2", "https://a/3"]
+    assert scheduler.next_ready() is None
+
+
+def test_concurrency_cap_and_interval_per_host():
+    clock = FakeClock()
+    scheduler = HostScheduler(max_concurrency_per_host=1, min_interval_per_host=2.0, clock=clock)
+    for url in ["https://a/1", "https://a/2", "https://b/1"]:
+        scheduler.push(url)
+
+    assert scheduler.next_ready() == "https://a/1"
+    assert scheduler.next_ready() == "https://b/1"
+    assert scheduler.next_ready() is None  # a is at its cap
+    assert scheduler.next_wakeup() is None  # ... and only waits for its in-flight request
+
+    scheduler.done("https://a/1")
+    assert scheduler.next_ready() is None  # still inside a's interval
+    assert scheduler.next_wakeup() == 2.0
+    clock.now = 2.0
+    assert scheduler.next_ready() == "https://a/2"
+
+
+def test_page_budget_is_shared_across_schedulers():
+    counts = {}
+    first = HostScheduler(max_pages_per_host=2, page_counts=counts)
+    assert first.push("https://a/1") and first.push("https://a/2")
+    assert not first.push("https://a/3")
+    first.next_ready()
+
+    second = HostScheduler(max_pages_per_host=2, page_counts=counts)
+    assert second.push("https://a/4")
+    assert not second.push("https://a/5")
+    assert second.push("https://b/1")
+
+
+class HostLatencyRuntime(FakeRuntime):
+    """Runtime with per-host latency that tracks requests in flight per host."""
+
+    def __init__(self, latency):
+        super().__init__()
+        self.latency = latency
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.completed = []
+
+    @asynccontextmanager
+    async def acquire_page(self):
+        yield FakePage()
+
+    async def goto(self, url, wait_until, timeout, page=None):
+        host = host_of(url)
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        await asyncio.sleep(self.latency[host])
+        self.in_flight[host] -= 1
+        self.completed.append(url)
+
+
+def _scraper(runtime, **ethics):
+    return ScrapeFlow(
+        ScrapeFlowConfig(ethical_crawling=EthicalCrawlingConfig(**ethics)),
+        runtime=runtime,
+        rate_limiter=FakeRateLimiter(),
+        retry_handler=FakeRetryHandler(),
+        logger=FakeLogger(),
+        monitor=FakeMonitor(),
+        robots_checker=FakeRobotsChecker(allowed=True),
+    )
+
+
+@pytest.mark.asyncio
+async def test_crawl_many_keeps_fast_hosts_moving_behind_a_slow_one():
+    runtime = HostLatencyRuntime({"slow.example": 0.2, "fast.example": 0.01})
+    scraper = _scraper(runtime, max_concurrency_per_domain=1)
+    urls = [f"https://slow.example/{i}" for i in range(3)]
+    urls += [f"https://fast.example/{i}" for i in range(10)]
+
+    results = [r async for r in scraper.crawl_many(urls, lambda page, ctx: None, concurrency=4)]
+
+    assert all(r.success for r in results)
+    assert runtime.max_in_flight == {"slow.example": 1, "fast.example": 1}
+    # All fast pages finish while the slow host is still on its first pages.
+    assert [host_of(u) for u in runtime.completed[:10]].count("fast.example") >= 9
+
+
+@pytest.mark.asyncio
+async def test_crawl_many_enforces_max_pages_per_domain():
+    runtime = HostLatencyRuntime({"a.example": 0, "b.example": 0})
+    scraper = _scraper(runtime, max_pages_per_domain=2)
+    urls = [f"https://a.example/{i}" for i in range(4)] + ["https://b.example/1"]
+
+    results = [r async for r in scraper.crawl_many(urls, lambda page, ctx: None)]
+    again = [r async for r in scraper.crawl_many(["https://a.example/9"], lambda page, ctx: None)]
+
+    assert sorted(r.url for r in results if r.success) == [
+        "https://a.example/0",
+        "https://a.example/1",
+        "https://b.example/1",
+    ]
+    assert all(isinstance(r.error, ScrapeFlowError) for r in results if not r.success)
+    # The budget is per crawl: a later, unrelated crawl starts from zero.
+    assert again[0].success
+    assert len(runtime.completed) == 4
+
+
+def test_passed_intervals_are_pruned():
+    clock = FakeClock()
+    scheduler = HostScheduler(min_interval_per_host=1.0, clock=clock)
+    for i in range(200):
+        scheduler.push(f"https://host{i}.example/")
+        scheduler.next_ready()
+        scheduler.done(f"https://host{i}.example/")
+        clock.now += 2.0
+
+    assert len(scheduler._next_start) <= 65
@@ -0,0 +1,121 @@
+"""Tests for the cross-process shared rate limiter."""
+
+import multiprocessing
+import sys
+import time
+
+import pytest
+
+from scrapeflow.config import RateLimitConfig, ScrapeFlowConfig
+from scrapeflow.engine import ScrapeFlow
+from tests.helpers import FakeRuntime
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="MmapBackend is POSIX-only")
+
+from scrapeflow.shared_rate_limiter import MmapBackend, SharedRateLimiter  # noqa: E402
+
+
+def test_backends_on_one_file_share_buckets(tmp_path):
+    path = str(tmp_path / "rl.bin")
+    a, b = MmapBackend(path, slots=8), MmapBackend(path, slots=8)
+    assert a.reserve_now("host", 1.0, 0.0) == 0
+    assert b.reserve_now("host", 1.0, 0.0) == pytest.approx(1.0, abs=0.05)
+    assert b.reserve_now("other", 1.0, 0.0) == 0
+    a.close()
+    b.close()
+
+    with pytest.raises(ValueError):
+        MmapBackend(path, slots=16)
+
+
+@pytest.mark.asyncio
+async def test_shared_limiter_charges_cost(tmp_path):
+    backend = MmapBackend(str(tmp_path / "rl.bin"), slots=8)
+    limiter = SharedRateLimiter(RateLimitConfig(requests_per_second=10, burst_size=2), backend)
+    start = time.monotonic()
+    for _ in range(8):
+        await limiter.acquire(cost=0.25)  # all within the burst of two
+    assert time.monotonic() - start < 0.05
+    # The next full-cost request waits one interval, as RateLimiter's would.
+    assert backend.reserve_now("", 0.1, 0.1) == pytest.approx(0.1, abs=0.02)
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_min_interval_applies_to_per_host_buckets_only(tmp_path):
+    backend = MmapBackend(str(tmp_path / "rl.bin"), slots=8)
+    config = RateLimitConfig(requests_per_second=1000, burst_size=5, per_host=True)
+    limiter = SharedRateLimiter(config, backend)
+    assert limiter.set_min_interval("slow.example", 0.1)
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire("slow.example")  # no burst: 2 waits of 0.1 s
+    assert 0.18 <= time.monotonic() - start < 0.5
+    # Cheap requests still wait the full delay.
+    assert limiter.set_min_interval("cheap.example", 0.1)
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire("cheap.example", cost=0.25)
+    assert 0.18 <= time.monotonic() - start < 0.5
+    limiter.set_min_interval("cheap.example", None)
+    assert "cheap.example" not in limiter._min_intervals
+    assert not SharedRateLimiter(RateLimitConfig(), backend).set_min_interval("a", 1.0)
+    backend.close()
+
+
+def test_idle_slots_are_reused_and_busy_table_fills(tmp_path):
+    backend = MmapBackend(str(tmp_path / "rl.bin"), slots=2)
+    backend.reserve_now("a", 0.05, 0.0)
+    backend.reserve_now("b", 0.05, 0.0)
+    with pytest.raises(RuntimeError):
+        backend.reserve_now("c", 0.05, 0.0)
+    time.sleep(0.06)  # a and b idle again
+    assert backend.reserve_now("c", 0.05, 0.0) == 0
+    assert backend.reserve_now("a", 0.05, 0.0) == 0
+    backend.close()
+
+
+def _worker(path, count, go, grants):
+    import asyncio
+
+    limiter = SharedRateLimiter(
+        RateLimitConfig(requests_per_second=100, burst_size=1, per_host=True), MmapBackend(path)
+    )
+
+    async def run():
+        for _ in range(count):
+            await limiter.acquire("example.com")
+            grants.put(time.monotonic())
+
+    go.wait(30)
+    asyncio.run(run())
+
+
+def test_rate_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "rl.bin")
+    ctx = multiprocessing.get_context("spawn")
+    go, grants = ctx.Event(), ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(path, 10, go, grants)) for _ in range(3)]
+    for p in procs:
+        p.start()
+    time.sleep(0.5)  # let every worker import and block on the start signal
+    go.set()
+    times = sorted(grants.get(timeout=30) for _ in range(30))
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+
+    # 30 requests at a combined 100/s: ~0.29 s, and never more than ~5 in 50 ms.
+    # Three unshared buckets would finish in ~0.1 s with ~15 grants per 50 ms.
+    assert times[-1] - times[0] >= 0.25
+    assert max(sum(t <= s + 0.05 for t in times[i:]) for i, s in enumerate(times)) <= 8
+
+
+@pytest.mark.asyncio
+async def test_engine_uses_shared_limiter_when_configured(tmp_path):
+    config = ScrapeFlowConfig()
+    config.rate_limit.shared_path = str(tmp_path / "rl.bin")
+    limiter = ScrapeFlow(config, runtime=FakeRuntime()).rate_limiter
+    assert isinstance(limiter, SharedRateLimiter)
+    await limiter.acquire("example.com")
+    limiter.close()
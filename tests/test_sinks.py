@@ -0,0 +1,151 @@
+"""Tests for streaming result sinks."""
+
+import asyncio
+import csv
+import json
+import sqlite3
+
+import pytest
+from pydantic import BaseModel
+
+from scrapeflow.frontier import URLFrontier
+from scrapeflow.pagination import paginate
+from scrapeflow.registry import PaginationHandler
+from scrapeflow.sinks import CSVSink, JSONLSink, Sink, SQLiteSink
+from tests.helpers import LoopingSite
+
+
+class Quote(BaseModel):
+    text: str
+    tags: list
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_batches_and_rotates(tmp_path):
+    path = tmp_path / "out" / "items.jsonl"
+    async with JSONLSink(str(path), batch_size=10, rotate_bytes=200) as sink:
+        await sink.put_many(Quote(text=f"q{i}", tags=["a"]) for i in range(50))
+        await sink.put({"text": "plain", "tags": []})
+
+    assert len(sink.paths) > 1
+    assert sink.paths[0].endswith("items-00000.jsonl")
+    rows = [row for part in sink.paths for row in read_jsonl(part)]
+    assert [row["text"] for row in rows] == [f"q{i}" for i in range(50)] + ["plain"]
+    assert sink.items_written == 51
+    assert sink.batches_written <= 10
+
+
+@pytest.mark.asyncio
+async def test_put_blocks_while_writer_is_behind(tmp_path):
+    class SlowSink(Sink):
+        def __init__(self):
+            super().__init__(batch_size=2, queue_size=2, fsync="never")
+            self.written = []
+
+        def _write_batch(self, records):
+            import time
+
+            time.sleep(0.05)
+            self.written.extend(records)
+
+        def _sync(self):
+            pass
+
+        def _close(self):
+            pass
+
+    sink = SlowSink()
+    for i in range(4):
+        await sink.put(i)
+    assert sink._queue.qsize() <= 2  # producers never run more than queue_size ahead
+    await sink.flush()
+    assert [r["value"] for r in sink.written] == [0, 1, 2, 3]
+    await sink.close()
+    await sink.flush()  # no-op once closed, e.g. by `async with sink:` before the engine closes
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_close_does_not_hang_when_the_writer_died_with_a_full_queue(tmp_path):
+    sink = JSONLSink(str(tmp_path / "items.jsonl"), batch_size=1, queue_size=1)
+    await sink.put({"n": 1})
+    sink._writer.cancel()  # dies before draining anything
+    await asyncio.sleep(0)
+    assert sink._queue.full()
+
+    await asyncio.wait_for(sink.close(), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_writer_errors_surface_to_producers(tmp_path):
+    class BrokenSink(Sink):
+        def _write_batch(self, records):
+            raise OSError("disk full")
+
+        def _sync(self):
+            pass
+
+        def _close(self):
+            pass
+
+    sink = BrokenSink(batch_size=1, flush_interval=0)
+    await sink.put(1)
+    with pytest.raises(OSError):
+        await sink.flush()
+    with pytest.raises(OSError):
+        await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_csv_sink_writes_header_once_per_file(tmp_path):
+    path = tmp_path / "items.csv"
+    async with CSVSink(str(path)) as sink:
+        await sink.put(Quote(text="a", tags=["x", "y"]))
+        await sink.put({"text": "b", "tags": [], "extra": 1})
+    async with CSVSink(str(path)) as sink:
+        await sink.put({"text": "c", "tags": []})
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {"text": "a", "tags": '["x", "y"]'},
+        {"text": "b", "tags": "[]"},
+        {"text": "c", "tags": "[]"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_sink_and_paginate_integration(tmp_path):
+    pytest.importorskip("selectolax")
+    path = str(tmp_path / "items.db")
+    sink = SQLiteSink(path, table="quotes", flush_interval=0.01)
+    engine = LoopingSite(frontier=URLFrontier(capacity=1_000))
+    engine.sink = sink
+
+    async def extract(page, context):
+        return [{"url": context["url"], "n": n} for n in range(3)]
+
+    handler = PaginationHandler(name="loop", next_selector="a.next")
+    pages = [data async for data in paginate(engine, "https://a.example/1", handler, extract)]
+    await sink.close()
+
+    conn = sqlite3.connect(path)
+    rows = [json.loads(data) for (data,) in conn.execute("SELECT data FROM quotes ORDER BY id")]
+    conn.close()
+    assert len(pages) == 2
+    assert rows == [item for page in pages for item in page]
+
+
+@pytest.mark.asyncio
+async def test_partial_batches_flush_after_interval(tmp_path):
+    path = tmp_path / "items.jsonl"
+    sink = JSONLSink(str(path), batch_size=100, flush_interval=0.01)
+    await sink.put({"n": 1})
+    await asyncio.sleep(0.2)
+    assert read_jsonl(path) == [{"n": 1}]
+    await sink.close()